@@ -1,5 +1,6 @@
-# Importação da biblioteca math para usar a função cos(x)
+# Importação das bibliotecas math (cos(x) escalar) e numpy (modo em lote)
 import math
+import numpy as np
 
 # Definição da função f(x)
 def f(x):
@@ -9,20 +10,128 @@ def f(x):
 def g(x):
     return (math.cos(x) + 1)/5
 
-# Escolha do valor inicial x0
-x0 = 0.5
+def _passo_steffensen(x, x1, x2):
+    """
+    Aplica a extrapolação Δ² de Aitken a três iterados x, g(x), g(g(x)).
 
-# Definição da tolerância
-tolerance = 1e-6
+    Quando o denominador x2 - 2x1 + x se anula (ou o resultado não é finito),
+    a sequência já está estacionária e o último iterado é devolvido.
+    """
+    x, x1, x2 = np.asarray(x, dtype=float), np.asarray(x1, dtype=float), np.asarray(x2, dtype=float)
+    denominador = x2 - 2*x1 + x
+    with np.errstate(divide='ignore', invalid='ignore'):
+        acelerado = x - (x1 - x)**2 / denominador
+    return np.where((denominador != 0) & np.isfinite(acelerado), acelerado, x2)
 
-# Iteração linear para encontrar o ponto fixo de g(x)
-xn = x0
-xn1 = g(xn)
-while abs(xn1 - xn) > tolerance:
-    xn = xn1
-    xn1 = g(xn)
+def iteracao_linear(g, x0, tolerancia=1e-6, max_iter=1000, acelerar=False, paciencia=10):
+    """
+    Encontra o ponto fixo x = g(x) pela iteração linear.
 
-# Estimativa da raiz da função f(x)
-root = xn1
+    Com acelerar=True usa o método de Steffensen: cada passo aplica g duas
+    vezes e extrapola com Δ² de Aitken, o que torna quadrática a convergência
+    de problemas linearmente convergentes (2 avaliações de g por iteração).
 
-print("A raiz da função f(x) é aproximadamente", root)
+    Parâmetros:
+    g: função da forma x = g(x)
+    x0: valor inicial
+    tolerancia: diferença máxima entre iterados consecutivos
+    max_iter: número máximo de iterações
+    acelerar: se True, usa a aceleração de Steffensen
+    paciencia: número de passos consecutivos com diferença crescente que
+        caracteriza divergência
+
+    Retorna:
+    raiz: aproximação do ponto fixo
+    iteracoes: número de iterações realizadas
+
+    Erros:
+    ValueError: se a iteração divergir ou não convergir em max_iter iterações
+    """
+    xn = x0
+    passo_anterior = math.inf
+    crescimentos = 0
+    for iteracao in range(1, max_iter + 1):
+        try:
+            x1 = g(xn)
+            xn1 = float(_passo_steffensen(xn, x1, g(x1))) if acelerar else x1
+        except OverflowError:
+            # Funções do math (ex.: math.exp) levantam OverflowError em vez de devolver inf
+            xn1 = math.inf
+        passo = abs(xn1 - xn)
+        if not math.isfinite(xn1):
+            raise ValueError(f"A iteração divergiu após {iteracao} iterações.")
+        if passo <= tolerancia:
+            return xn1, iteracao
+        crescimentos = crescimentos + 1 if passo > passo_anterior else 0
+        if crescimentos >= paciencia:
+            raise ValueError(f"A iteração divergiu após {iteracao} iterações (|g'| > 1?).")
+        passo_anterior = passo
+        xn = xn1
+    raise ValueError(f"A iteração não convergiu após {max_iter} iterações.")
+
+def iteracao_linear_lote(g, x0, *parametros, tolerancia=1e-6, max_iter=1000, acelerar=False,
+                         paciencia=10):
+    """
+    Aplica a iteração linear a muitos valores iniciais de uma só vez.
+
+    g deve aceitar arrays do NumPy. Os valores que convergem ou divergem saem
+    do conjunto ativo, e g passa a ser avaliada só nos restantes.
+
+    Parâmetros:
+    g: função vetorizada g(x, *parametros)
+    x0: array de valores iniciais
+    *parametros: arrays de parâmetros de cada problema, combinados com x0 por broadcasting
+    tolerancia, max_iter, acelerar, paciencia: como em iteracao_linear
+
+    Retorna:
+    raizes: array com as aproximações dos pontos fixos
+    iteracoes: array com o número de iterações de cada valor inicial
+    convergiu: array booleano; False indica divergência ou limite de iterações
+    """
+    forma = np.broadcast_shapes(np.shape(x0), *(np.shape(p) for p in parametros))
+    x = np.array(np.broadcast_to(np.asarray(x0, dtype=float), forma)).ravel()
+    parametros = [np.broadcast_to(p, forma).ravel() for p in parametros]
+    iteracoes = np.zeros(x.size, dtype=int)
+    convergiu = np.zeros(x.size, dtype=bool)
+    passo_anterior = np.full(x.size, np.inf)
+    crescimentos = np.zeros(x.size, dtype=int)
+    ativos = np.arange(x.size)
+    for _ in range(max_iter):
+        if ativos.size == 0:
+            break
+        xa = x[ativos]
+        args = [p[ativos] for p in parametros]
+        x1 = g(xa, *args)
+        xn1 = _passo_steffensen(xa, x1, g(x1, *args)) if acelerar else x1
+        passo = np.abs(xn1 - xa)
+        iteracoes[ativos] += 1
+        x[ativos] = xn1
+
+        feito = passo <= tolerancia
+        cresceu = passo > passo_anterior[ativos]
+        crescimentos[ativos] = np.where(cresceu, crescimentos[ativos] + 1, 0)
+        divergiu = ~np.isfinite(xn1) | (crescimentos[ativos] >= paciencia)
+        passo_anterior[ativos] = passo
+        convergiu[ativos[feito]] = True
+        ativos = ativos[~(feito | divergiu)]
+    return x.reshape(forma), iteracoes.reshape(forma), convergiu.reshape(forma)
+
+if __name__ == "__main__":
+    # Escolha do valor inicial x0
+    x0 = 0.5
+
+    # Definição da tolerância
+    tolerance = 1e-6
+
+    # Iteração linear para encontrar o ponto fixo de g(x), com e sem aceleração
+    root, iteracoes = iteracao_linear(g, x0, tolerance)
+    print("A raiz da função f(x) é aproximadamente", root, f"({iteracoes} avaliações de g)")
+    root, iteracoes = iteracao_linear(g, x0, tolerance, acelerar=True)
+    print("Com Steffensen:", root, f"({2 * iteracoes} avaliações de g)")
+
+    # Equação de Kepler x = M + E sen(x) para várias anomalias médias M, em lote
+    E = 0.3
+    M = np.linspace(0, 2 * np.pi, 9)
+    raizes, iteracoes, convergiu = iteracao_linear_lote(lambda x, M: M + E * np.sin(x), M, M,
+                                                        tolerancia=1e-10, acelerar=True)
+    print("Kepler (E = 0.3):", np.round(raizes, 6), "iterações:", iteracoes, "convergiu:", convergiu.all())
@@ -0,0 +1,72 @@
+"""
+Testes unitários para o módulo de iteração linear.
+"""
+
+import importlib.util
+import math
+import os
+import unittest
+import numpy as np
+
+# O nome do arquivo tem hífens, então o módulo é carregado pelo caminho
+_spec = importlib.util.spec_from_file_location(
+    "iteracao_linear", os.path.join(os.path.dirname(__file__), "iteracao-linear.py"))
+iteracao = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(iteracao)
+
+class TestIteracaoLinear(unittest.TestCase):
+    def test_exemplo_do_modulo(self):
+        """Testa o ponto fixo de g(x) = (cos(x) + 1)/5, raiz de f(x) = cos(x) - 5x + 1."""
+        raiz, _ = iteracao.iteracao_linear(iteracao.g, 0.5, 1e-12)
+        self.assertAlmostEqual(iteracao.f(raiz), 0.0, places=11)
+
+    def test_steffensen_reduz_iteracoes(self):
+        """Testa a aceleração em um problema de convergência linear lenta (g'(x) = 0,99)."""
+        g = lambda x: 0.99 * x + 0.01
+        raiz, iteracoes = iteracao.iteracao_linear(g, 0.0, 1e-10, max_iter=10000)
+        raiz_acelerada, iteracoes_aceleradas = iteracao.iteracao_linear(g, 0.0, 1e-10, acelerar=True)
+        self.assertAlmostEqual(raiz, 1.0, places=7)
+        self.assertAlmostEqual(raiz_acelerada, 1.0, places=12)
+        self.assertGreater(iteracoes, 1000)
+        self.assertLessEqual(iteracoes_aceleradas, 3)
+        # Em g não linear, Steffensen usa menos avaliações de g (2 por iteração)
+        _, simples = iteracao.iteracao_linear(math.cos, 1.0, 1e-12, max_iter=1000)
+        _, aceleradas = iteracao.iteracao_linear(math.cos, 1.0, 1e-12, acelerar=True)
+        self.assertLess(2 * aceleradas, simples)
+
+    def test_divergencia_e_limite(self):
+        """Testa os erros de divergência e de limite de iterações."""
+        with self.assertRaises(ValueError):
+            iteracao.iteracao_linear(lambda x: 2 * x + 1, 1.0)
+        with self.assertRaises(ValueError):
+            iteracao.iteracao_linear(math.exp, 1.0)
+        with self.assertRaises(ValueError):
+            iteracao.iteracao_linear(math.cos, 1.0, 1e-12, max_iter=5)
+
+class TestIteracaoLinearLote(unittest.TestCase):
+    def test_coincide_com_escalar(self):
+        """Testa a equação de Kepler x = M + E sen(x) em lote contra a versão escalar."""
+        E = 0.3
+        M = np.linspace(0, 2 * np.pi, 9)
+        for acelerar in (False, True):
+            raizes, iteracoes, convergiu = iteracao.iteracao_linear_lote(
+                lambda x, M: M + E * np.sin(x), M, M, tolerancia=1e-10, acelerar=acelerar)
+            self.assertTrue(convergiu.all())
+            for Mi, raiz, n in zip(M, raizes, iteracoes):
+                esperado, n_esperado = iteracao.iteracao_linear(lambda x: Mi + E * math.sin(x), Mi, 1e-10,
+                                                                acelerar=acelerar)
+                self.assertAlmostEqual(raiz, esperado, places=12)
+                self.assertEqual(n, n_esperado)
+            np.testing.assert_allclose(raizes - E * np.sin(raizes), M, atol=1e-9)
+
+    def test_pistas_divergentes(self):
+        """Testa que valores divergentes saem do lote sem afetar os demais."""
+        g = lambda x: np.where(x > 2, 2 * x, np.cos(x))
+        raizes, _, convergiu = iteracao.iteracao_linear_lote(g, np.array([[0.1, 3.0], [1.0, 5.0]]),
+                                                             tolerancia=1e-10)
+        self.assertEqual(convergiu.shape, (2, 2))
+        np.testing.assert_array_equal(convergiu, [[True, False], [True, False]])
+        np.testing.assert_allclose(raizes[:, 0], 0.7390851332151607, atol=1e-9)
+
+if __name__ == '__main__':
+    unittest.main()
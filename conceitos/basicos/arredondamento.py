@@ -5,26 +5,36 @@ def arredondar_digitos_significativos(valor, digitos_significativos):
     """
     Arredonda um número para um determinado número de dígitos significativos.
     
+    Aceita arrays do NumPy: a ordem de grandeza de todos os elementos é
+    calculada de uma vez com np.log10, e valor e digitos_significativos são
+    combinados por broadcasting. Zeros, infinitos e NaN são devolvidos sem
+    alteração.
+    
     Args:
-        valor: O número a ser arredondado
+        valor: O número (ou array de números) a ser arredondado
         digitos_significativos: Número de dígitos significativos a manter
+            (escalar ou array)
         
     Returns:
-        O valor arredondado
+        O valor arredondado (float para entradas escalares, array caso contrário)
     """
-    if valor == 0:
-        return 0
+    valor = np.asarray(valor, dtype=float)
     
     # Calcula o expoente necessário para manter o número de dígitos significativos
-    expoente = np.floor(np.log10(np.abs(valor))) + 1 - digitos_significativos
+    with np.errstate(divide='ignore', invalid='ignore'):
+        expoente = np.floor(np.log10(np.abs(valor))) + 1 - np.asarray(digitos_significativos)
     
     # Arredonda o valor exato para o número de dígitos significativos
-    return np.around(valor / (10 ** expoente)) * (10 ** expoente)
+    escala = 10.0 ** np.where(np.isfinite(expoente), expoente, 0)
+    resultado = np.where(np.isfinite(expoente), np.around(valor / escala) * escala, valor)
+    return resultado if resultado.ndim else float(resultado)
 
 def calcular_erro_arredondamento(valor_exato, valor_arredondado):
     """
     Calcula diferentes métricas de erro de arredondamento.
     
+    Aceita escalares ou arrays do NumPy (calculados elemento a elemento).
+    
     Args:
         valor_exato: O valor original
         valor_arredondado: O valor após arredondamento
@@ -32,17 +42,17 @@ def calcular_erro_arredondamento(valor_exato, valor_arredondado):
     Returns:
         Um dicionário com os diferentes tipos de erro
     """
-    if valor_exato == 0:
-        return {
-            "erro_absoluto": np.abs(valor_arredondado),
-            "erro_relativo": float('inf') if valor_arredondado != 0 else 0,
-            "erro_percentual": float('inf') if valor_arredondado != 0 else 0
-        }
-    
+    valor_exato = np.asarray(valor_exato, dtype=float)
     erro_absoluto = np.abs(valor_exato - valor_arredondado)
-    erro_relativo = erro_absoluto / np.abs(valor_exato)
+    
+    # Com valor exato nulo, o erro relativo é 0 se o arredondado também for nulo, e infinito caso contrário
+    with np.errstate(divide='ignore', invalid='ignore'):
+        erro_relativo = np.where(erro_absoluto == 0, 0.0, erro_absoluto / np.abs(valor_exato))
     erro_percentual = erro_relativo * 100
     
+    if erro_relativo.ndim == 0:
+        erro_absoluto, erro_relativo, erro_percentual = (
+            float(erro_absoluto), float(erro_relativo), float(erro_percentual))
     return {
         "erro_absoluto": erro_absoluto,
         "erro_relativo": erro_relativo,
@@ -59,14 +69,9 @@ def visualizar_erro_arredondamento(valor, digitos_range, salvar_grafico=False, n
         salvar_grafico: Se True, salva o gráfico em um arquivo
         nome_arquivo: Nome do arquivo para salvar o gráfico (se salvar_grafico=True)
     """
-    erros_percentuais = []
-    valores_arredondados = []
-    
-    for digitos in digitos_range:
-        valor_arredondado = arredondar_digitos_significativos(valor, digitos)
-        erro = calcular_erro_arredondamento(valor, valor_arredondado)
-        erros_percentuais.append(erro['erro_percentual'])
-        valores_arredondados.append(valor_arredondado)
+    # Todas as precisões de uma vez
+    valores_arredondados = arredondar_digitos_significativos(valor, np.asarray(digitos_range))
+    erros_percentuais = calcular_erro_arredondamento(valor, valores_arredondados)['erro_percentual']
     
     # Plotar o gráfico de erro
     plt.figure(figsize=(10, 6))
@@ -93,6 +98,39 @@ def visualizar_erro_arredondamento(valor, digitos_range, salvar_grafico=False, n
     
     return valores_arredondados, erros_percentuais
 
+def propagar_erro(valor_inicial, numero_iteracoes, precisoes, operacao=None):
+    """
+    Aplica uma operação iterativa arredondando cada resultado, para todas as
+    precisões de uma vez.
+    
+    A cada iteração, operacao é chamada uma única vez com o array de todas as
+    precisões (e de todos os valores iniciais, se valor_inicial for um array).
+    
+    Args:
+        valor_inicial: Valor inicial (escalar ou array) para o cálculo
+        numero_iteracoes: Número de iterações a realizar
+        precisoes: Lista de precisões (dígitos significativos) a testar
+        operacao: Função vetorizada que realiza a operação em cada iteração.
+                  Se None, usa a operação padrão (x^2/10)
+    
+    Returns:
+        Array de formato (precisões, iterações + 1, *formato de valor_inicial),
+        em que a coluna 0 contém os valores iniciais
+    """
+    if operacao is None:
+        operacao = lambda x: (x ** 2) / 10
+    
+    valor_inicial = np.asarray(valor_inicial, dtype=float)
+    precisoes = np.asarray(precisoes).reshape((-1,) + (1,) * valor_inicial.ndim)
+    valores = np.empty((precisoes.shape[0], numero_iteracoes + 1) + valor_inicial.shape)
+    valores[:, 0] = valor_inicial
+    
+    for iteracao in range(numero_iteracoes):
+        # Cálculo exato seguido do arredondamento, em todas as precisões
+        valores[:, iteracao + 1] = arredondar_digitos_significativos(operacao(valores[:, iteracao]), precisoes)
+    
+    return valores
+
 def demonstrar_propagacao_erro(valor_inicial, numero_iteracoes, precisoes, operacao=None):
     """
     Demonstra como o erro de arredondamento se propaga em um cálculo iterativo.
@@ -103,24 +141,12 @@ def demonstrar_propagacao_erro(valor_inicial, numero_iteracoes, precisoes, opera
         precisoes: Lista de precisões (dígitos significativos) a testar
         operacao: Função que realiza a operação matemática em cada iteração. 
                   Se None, usa a operação padrão (x^2/10)
-    """
-    if operacao is None:
-        operacao = lambda x: (x ** 2) / 10
     
-    resultados = {}
-    for precisao in precisoes:
-        valor = valor_inicial
-        valores = [valor]
-        
-        for _ in range(numero_iteracoes):
-            # Cálculo exato
-            valor_exato = operacao(valor)
-            
-            # Cálculo com arredondamento
-            valor = arredondar_digitos_significativos(valor_exato, precisao)
-            valores.append(valor)
-        
-        resultados[precisao] = valores
+    Returns:
+        Dicionário que associa cada precisão à sua linha do array de propagar_erro
+    """
+    valores_por_precisao = propagar_erro(valor_inicial, numero_iteracoes, precisoes, operacao)
+    resultados = dict(zip(precisoes, valores_por_precisao))
     
     # Visualizar os resultados
     plt.figure(figsize=(12, 6))
@@ -23,6 +23,7 @@ from typing import Union, List, Dict, Optional, Tuple
 import numpy as np
 import matplotlib.pyplot as plt
 import seaborn as sns
+from scipy import special
 from scipy.stats import binom
 import logging
 
@@ -34,6 +35,9 @@ class DistribuicaoBinomial:
     """
     Implementa cálculos e visualizações para a distribuição binomial.
     
+    As tabelas de PMF, CDF e SF para k = 0..n são calculadas uma única vez, com
+    chamadas vetorizadas, e as consultas pontuais são respondidas por indexação.
+    
     Attributes:
         n (int): Número de tentativas
         p (float): Probabilidade de sucesso em cada tentativa
@@ -50,6 +54,7 @@ class DistribuicaoBinomial:
         self._validar_parametros(n, p)
         self.n = n
         self.p = p
+        self._tabelas = None  # (n, p, pmf, cdf, sf), calculadas sob demanda
         # Calcular estatísticas
         self.media, self.variancia = self._calcular_estatisticas()
     
@@ -101,21 +106,82 @@ class DistribuicaoBinomial:
             raise ValueError("k não pode ser maior que n")
         return math.comb(self.n, k)
 
-    def pmf(self, k: int) -> float:
+    def _calcular_tabelas(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Retorna as tabelas de PMF, CDF e SF para k = 0..n.
+
+        As tabelas são calculadas na primeira consulta e recalculadas apenas se
+        n ou p forem alterados. A SF vem de binom.sf, e não de 1 - CDF, para
+        manter a precisão na cauda superior.
+
+        Returns:
+            Tupla com os arrays de PMF, CDF e SF
+        """
+        if self._tabelas is None or self._tabelas[:2] != (self.n, self.p):
+            k = np.arange(self.n + 1)
+            self._tabelas = (self.n, self.p,
+                             binom.pmf(k, self.n, self.p),
+                             binom.cdf(k, self.n, self.p),
+                             binom.sf(k, self.n, self.p))
+        return self._tabelas[2:]
+
+    @property
+    def tabela_pmf(self) -> np.ndarray:
+        """Array com P(X = k) para k = 0..n."""
+        return self._calcular_tabelas()[0]
+
+    @property
+    def tabela_cdf(self) -> np.ndarray:
+        """Array com P(X ≤ k) para k = 0..n."""
+        return self._calcular_tabelas()[1]
+
+    @property
+    def tabela_sf(self) -> np.ndarray:
+        """Array com P(X > k) para k = 0..n."""
+        return self._calcular_tabelas()[2]
+
+    def _consultar(self, tabela: np.ndarray, k, abaixo: float, acima: float):
+        """
+        Consulta uma tabela em k (escalar ou array), como as funções do scipy.
+
+        Valores não inteiros de k são arredondados para baixo.
+
+        Args:
+            tabela: Tabela indexada por k = 0..n
+            k: Número(s) de sucessos
+            abaixo: Valor para k < 0
+            acima: Valor para k > n
+
+        Returns:
+            Valor(es) da tabela em k
+        """
+        if isinstance(k, (int, np.integer)) and 0 <= k <= self.n:
+            return tabela[k]  # Caminho rápido para consultas pontuais
+        indice = np.floor(np.asarray(k, dtype=float))
+        valores = tabela[np.clip(indice, 0, self.n).astype(np.intp)]
+        return np.where(indice < 0, abaixo, np.where(indice > self.n, acima, valores))[()]
+
+    def pmf(self, k: Union[int, np.ndarray]) -> Union[float, np.ndarray]:
         """
         Calcula a função massa de probabilidade P(X = k).
         
         Args:
-            k: Número de sucessos
+            k: Número de sucessos (escalar ou array)
 
         Returns:
             Probabilidade de exatamente k sucessos
         """
-        return binom.pmf(k, self.n, self.p)
+        valores = self._consultar(self.tabela_pmf, k, 0.0, 0.0)
+        if isinstance(k, (int, np.integer)):
+            return valores
+        return np.where(np.floor(k) == k, valores, 0.0)[()]
 
     def pmf_manual(self, k: int) -> float:
         """
         Calcula manualmente a função massa de probabilidade P(X = k).
+
+        Usa inteiros exatos e potências diretas; para n grande, prefira
+        log_pmf_binomial ou avaliar_binomial.
         
         Args:
             k: Número de sucessos
@@ -126,29 +192,29 @@ class DistribuicaoBinomial:
         coef = self.calcular_coeficiente_binomial(k)
         return coef * (self.p ** k) * ((1 - self.p) ** (self.n - k))
 
-    def cdf(self, k: int) -> float:
+    def cdf(self, k: Union[int, np.ndarray]) -> Union[float, np.ndarray]:
         """
         Calcula a função de distribuição acumulada P(X ≤ k).
         
         Args:
-            k: Número de sucessos
+            k: Número de sucessos (escalar ou array)
 
         Returns:
             Probabilidade acumulada até k sucessos
         """
-        return binom.cdf(k, self.n, self.p)
+        return self._consultar(self.tabela_cdf, k, 0.0, 1.0)
 
-    def sf(self, k: int) -> float:
+    def sf(self, k: Union[int, np.ndarray]) -> Union[float, np.ndarray]:
         """
         Calcula a função de sobrevivência P(X > k).
         
         Args:
-            k: Número de sucessos
+            k: Número de sucessos (escalar ou array)
 
         Returns:
             Probabilidade de mais que k sucessos
         """
-        return 1 - self.cdf(k)
+        return self._consultar(self.tabela_sf, k, 1.0, 0.0)
 
     def plotar_distribuicao(self, titulo: Optional[str] = None) -> None:
         """
@@ -158,7 +224,7 @@ class DistribuicaoBinomial:
             titulo: Título opcional para o gráfico
         """
         k = np.arange(0, self.n + 1)
-        prob = binom.pmf(k, self.n, self.p)
+        prob = self.tabela_pmf
         
         plt.figure(figsize=(10, 6))
         plt.bar(k, prob, alpha=0.8, color='b', label=f'n={self.n}, p={self.p}')
@@ -177,7 +243,7 @@ class DistribuicaoBinomial:
         Returns:
             Dicionário com as probabilidades para cada valor de k
         """
-        return {k: self.pmf(k) for k in range(self.n + 1)}
+        return dict(enumerate(self.tabela_pmf.tolist()))
 
     def resumo(self) -> None:
         """Imprime um resumo das estatísticas da distribuição."""
@@ -187,8 +253,7 @@ class DistribuicaoBinomial:
         print(f"Desvio Padrão (σ): {np.sqrt(self.variancia)}")
         print("\nTabela de probabilidades:")
         print("k\tP(X=k)")
-        for k in range(self.n + 1):
-            print(f"{k}\t{self.pmf(k):.4f}")
+        print("\n".join(f"{k}\t{prob:.4f}" for k, prob in enumerate(self.tabela_pmf.tolist())))
 
 
 # Método de Newton para encontrar raízes
@@ -225,6 +290,103 @@ def newton(f, df, x0, tol=1e-6, max_iter=100):
     raise ValueError(f"O método não convergiu após {max_iter} iterações.")
 
 
+def newton_vetorizado(f, df, x0, *parametros, limites: Optional[Tuple] = None,
+                      tol: float = 1e-6, max_iter: int = 100
+                      ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Aplica o método de Newton a muitas equações independentes de uma só vez.
+
+    Cada posição (pista) dos arrays é uma equação f(x, *parametros) = 0. Todas as
+    pistas avançam juntas com operações vetorizadas; as que convergem saem do
+    conjunto ativo, e f e df passam a ser avaliadas só nas restantes. Com
+    limites = (a, b), cada pista mantém um intervalo com troca de sinal e usa um
+    passo de bisseção sempre que o passo de Newton sai do intervalo, não é
+    finito ou a derivada é quase nula. Sem limites, essas pistas são
+    interrompidas e marcadas como não convergidas.
+
+    Exemplo: o limite superior de Clopper-Pearson resolve
+    binom.cdf(k, n, p) - α = 0 em p, com df = -n * binom.pmf(k, n-1, p),
+    para arrays de k e n passados em parametros.
+
+    Args:
+        f: Função vetorizada f(x, *parametros)
+        df: Derivada vetorizada df(x, *parametros)
+        x0: Aproximações iniciais
+        *parametros: Arrays de parâmetros, combinados com x0 por broadcasting
+        limites: Tupla opcional (a, b) com f(a) e f(b) de sinais opostos em cada pista
+        tol: Tolerância de convergência no tamanho do passo de Newton ou, após
+            um passo de bisseção, na largura do intervalo
+        max_iter: Número máximo de iterações
+
+    Returns:
+        Tupla com as raízes, o número de iterações e se cada pista convergiu
+
+    Raises:
+        ValueError: Se algum intervalo de limites não tiver troca de sinal
+    """
+    formas = [np.shape(x0)] + [np.shape(p) for p in parametros]
+    if limites is not None:
+        formas += [np.shape(limites[0]), np.shape(limites[1])]
+    forma = np.broadcast_shapes(*formas)
+    x = np.array(np.broadcast_to(np.asarray(x0, dtype=float), forma)).ravel()
+    parametros = [np.broadcast_to(p, forma).ravel() for p in parametros]
+
+    if limites is not None:
+        inferior = np.array(np.broadcast_to(np.asarray(limites[0], dtype=float), forma)).ravel()
+        superior = np.array(np.broadcast_to(np.asarray(limites[1], dtype=float), forma)).ravel()
+        f_inferior = f(inferior, *parametros)
+        if np.any(f_inferior * f(superior, *parametros) > 0):
+            raise ValueError("f(a) e f(b) devem ter sinais opostos em todas as pistas")
+
+    fx = f(x, *parametros)
+    iteracoes = np.zeros(x.size, dtype=int)
+    convergiu = fx == 0
+    ativos = np.flatnonzero(~convergiu)
+    for _ in range(max_iter):
+        if ativos.size == 0:
+            break
+        args = [p[ativos] for p in parametros]
+        xa, fa = x[ativos], fx[ativos]
+        derivada = df(xa, *args)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            novo = xa - fa / derivada
+        invalido = ~np.isfinite(novo) | (np.abs(derivada) < 1e-10)
+
+        if limites is not None:
+            a, b = inferior[ativos], superior[ativos]
+            fora = invalido | (novo <= np.minimum(a, b)) | (novo >= np.maximum(a, b))
+            novo = np.where(fora, 0.5 * (a + b), novo)  # Passo de bisseção
+            falhou = np.zeros(ativos.size, dtype=bool)
+        else:
+            novo = np.where(invalido, xa, novo)
+            fora = np.zeros(ativos.size, dtype=bool)
+            falhou = invalido
+
+        f_novo = f(novo, *args)
+        iteracoes[ativos] += 1
+        if limites is not None:
+            # Mantém a troca de sinal entre as extremidades do intervalo
+            mesmo_sinal = np.sign(f_novo) == np.sign(f_inferior[ativos])
+            inferior[ativos] = np.where(mesmo_sinal, novo, a)
+            f_inferior[ativos] = np.where(mesmo_sinal, f_novo, f_inferior[ativos])
+            superior[ativos] = np.where(mesmo_sinal, b, novo)
+        x[ativos] = novo
+        fx[ativos] = f_novo
+
+        # Um passo de bisseção pode cair sobre o próprio xa (x0 no ponto médio);
+        # nessas pistas o critério é a largura do intervalo, não o passo
+        if limites is not None:
+            pequeno = np.where(fora, np.abs(superior[ativos] - inferior[ativos]) < tol,
+                               np.abs(novo - xa) < tol)
+        else:
+            pequeno = np.abs(novo - xa) < tol
+        feito = ~falhou & (pequeno | (f_novo == 0))
+        convergiu[ativos[feito]] = True
+        ativos = ativos[~(feito | falhou)]
+
+    return x.reshape(forma), iteracoes.reshape(forma), convergiu.reshape(forma)
+
+
 def calcular_probabilidade_binomial(n: int, k: int, p: float) -> float:
     """
     Wrapper para cálculo de probabilidade binomial pontual.
@@ -241,6 +403,218 @@ def calcular_probabilidade_binomial(n: int, k: int, p: float) -> float:
     return dist.pmf(k)
 
 
+# Constante de Berry-Esseen (Shevtsova, 2011) para somas de variáveis i.i.d.
+CONSTANTE_BERRY_ESSEEN = 0.4748
+
+
+def _erro_stirling(x: np.ndarray) -> np.ndarray:
+    """
+    Calcula o erro da fórmula de Stirling, lgamma(x+1) - [(x+½) log x - x + ½ log 2π].
+
+    Para x > 15 usa a série assintótica, evitando a subtração de dois números
+    grandes e quase iguais; para x pequeno usa lgamma diretamente.
+    """
+    x = np.asarray(x, dtype=float)
+    grande = x > 15
+    xg = np.where(grande, x, 16.0)
+    inv2 = 1.0 / (xg * xg)
+    serie = (1/12 - inv2 * (1/360 - inv2 * (1/1260 - inv2 * (1/1680 - inv2 / 1188)))) / xg
+    xp = np.where(grande, 1.0, np.maximum(x, 1e-300))
+    direto = special.gammaln(xp + 1) - (xp + 0.5) * np.log(xp) + xp - 0.5 * np.log(2 * np.pi)
+    return np.where(grande, serie, direto)
+
+
+def _desvio_poisson(x: np.ndarray, m: np.ndarray) -> np.ndarray:
+    """
+    Calcula x log(x/m) + m - x sem cancelamento quando x está perto de m.
+
+    Quando |x - m| < 0,1 (x + m), usa a série em v = (x - m)/(x + m), cujos
+    termos caem por um fator v² < 0,01 a cada passo.
+    """
+    diferenca = x - m
+    perto = np.abs(diferenca) < 0.1 * (x + m)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        direto = special.xlogy(x, x / m) + m - x
+        v = np.where(perto, diferenca / (x + m), 0.0)
+    serie = diferenca * v
+    termo = 2 * x * v
+    v2 = v * v
+    for j in range(1, 12):
+        termo = termo * v2
+        serie = serie + termo / (2 * j + 1)
+    return np.where(perto, serie, direto)
+
+
+def log_pmf_binomial(n, k, p) -> np.ndarray:
+    """
+    Calcula log P(X = k) em espaço logarítmico, sem coeficientes binomiais inteiros.
+
+    Em vez de log C(n,k) = lgamma(n+1) - lgamma(k+1) - lgamma(n-k+1), cujos
+    termos chegam a 10^9 para n = 10^8 e se cancelam perdendo sete dígitos, usa
+    a forma de ponto de sela de Loader (a mesma de scipy e R):
+    log P = S(n) - S(k) - S(n-k) - D(k, np) - D(n-k, nq) + ½ log(n / 2πk(n-k)),
+    com S o erro de Stirling e D o desvio de Poisson, ambos pequenos. Isso evita
+    os inteiros enormes de math.comb e o underflow de p^k (1-p)^(n-k).
+    Aceita arrays de n, k e p, combinados por broadcasting.
+
+    Args:
+        n: Número(s) de tentativas
+        k: Número(s) de sucessos
+        p: Probabilidade(s) de sucesso
+
+    Returns:
+        Array com log P(X = k) (-inf fora do suporte)
+    """
+    n, k, p = np.broadcast_arrays(np.asarray(n, dtype=float), np.asarray(k, dtype=float),
+                                  np.asarray(p, dtype=float))
+    dentro = (k >= 0) & (k <= n) & (k == np.floor(k))
+    interior = dentro & (k > 0) & (k < n)
+    # Valores auxiliares nos extremos evitam log(0); o resultado deles é descartado
+    ki = np.where(interior, k, 1.0)
+    ni = np.where(interior, n, 2.0)
+    with np.errstate(divide='ignore'):
+        log_pmf = (_erro_stirling(ni) - _erro_stirling(ki) - _erro_stirling(ni - ki)
+                   - _desvio_poisson(ki, ni * p) - _desvio_poisson(ni - ki, ni * (1 - p))
+                   + 0.5 * np.log(ni / (2 * np.pi * ki * (ni - ki))))
+        extremos = np.where(k == 0, special.xlog1py(n, -p), special.xlogy(n, p))
+    return np.where(interior, log_pmf, np.where(dentro, extremos, -np.inf))
+
+
+def log_pmf_poisson(k, lam) -> np.ndarray:
+    """
+    Calcula log P(Y = k) para Y ~ Poisson(λ), na mesma forma de ponto de sela.
+
+    Args:
+        k: Número(s) de ocorrências
+        lam: Taxa(s) λ
+
+    Returns:
+        Array com log P(Y = k) (-inf para k negativo ou não inteiro)
+    """
+    k, lam = np.broadcast_arrays(np.asarray(k, dtype=float), np.asarray(lam, dtype=float))
+    dentro = (k >= 0) & (k == np.floor(k))
+    ki = np.where(dentro & (k > 0), k, 1.0)
+    with np.errstate(divide='ignore'):
+        log_pmf = -_erro_stirling(ki) - _desvio_poisson(ki, lam) - 0.5 * np.log(2 * np.pi * ki)
+    return np.where(dentro, np.where(k == 0, -lam, log_pmf), -np.inf)
+
+
+def limites_erro_aproximacao(n, p) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Calcula limites superiores do erro das aproximações da binomial.
+
+    - Poisson(np): distância de variação total ≤ (1 - e^(-np)) p (Barbour-Hall),
+      que limita o erro de qualquer probabilidade (pontual ou acumulada)
+    - Normal com correção de continuidade: sup |F(k) - Φ(k)| ≤ C (p² + q²) / √(npq)
+      (Berry-Esseen); o erro da PMF é no máximo o dobro
+
+    Args:
+        n: Número(s) de tentativas
+        p: Probabilidade(s) de sucesso
+
+    Returns:
+        Tupla com os limites de erro das aproximações de Poisson e normal
+    """
+    n = np.asarray(n, dtype=float)
+    p = np.asarray(p, dtype=float)
+    q = 1 - p
+    limite_poisson = -np.expm1(-n * p) * p
+    with np.errstate(divide='ignore'):
+        limite_normal = CONSTANTE_BERRY_ESSEEN * (p * p + q * q) / np.sqrt(n * p * q)
+    return limite_poisson, limite_normal
+
+
+def avaliar_binomial(n, k, p, funcao: str = "pmf", tolerancia: float = 1e-6,
+                     metodo: str = "auto") -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Avalia PMF, CDF ou SF da binomial em lote, escolhendo o método por elemento.
+
+    No modo "auto", cada combinação (n, k, p) usa a aproximação de Poisson ou a
+    normal com correção de continuidade quando o limite de erro correspondente
+    (ver limites_erro_aproximacao) é menor que a tolerância, e o cálculo exato
+    caso contrário. O cálculo exato usa log_pmf_binomial (PMF) ou a função beta
+    incompleta regularizada (CDF e SF), e seu custo não depende do tamanho de n.
+
+    Args:
+        n: Número(s) de tentativas (inteiros não negativos)
+        k: Número(s) de sucessos; para CDF e SF valores não inteiros são arredondados para baixo
+        p: Probabilidade(s) de sucesso
+        funcao: "pmf" (P(X = k)), "cdf" (P(X ≤ k)) ou "sf" (P(X > k))
+        tolerancia: Erro absoluto máximo aceito para usar uma aproximação
+        metodo: "auto", "exata", "poisson" ou "normal"
+
+    Returns:
+        Tupla com o array de probabilidades e o array com o método usado em cada elemento
+
+    Raises:
+        ValueError: Se os parâmetros, a função ou o método forem inválidos
+    """
+    if funcao not in ("pmf", "cdf", "sf"):
+        raise ValueError("funcao deve ser 'pmf', 'cdf' ou 'sf'")
+    if metodo not in ("auto", "exata", "poisson", "normal"):
+        raise ValueError("metodo deve ser 'auto', 'exata', 'poisson' ou 'normal'")
+
+    n, k, p = np.broadcast_arrays(np.asarray(n, dtype=float), np.asarray(k, dtype=float),
+                                  np.asarray(p, dtype=float))
+    if np.any(n < 0) or np.any(n != np.floor(n)):
+        raise ValueError("n deve ser um inteiro não negativo")
+    if np.any((p < 0) | (p > 1)):
+        raise ValueError("p deve estar entre 0 e 1")
+
+    if metodo == "auto":
+        limite_poisson, limite_normal = limites_erro_aproximacao(n, p)
+        if funcao == "pmf":
+            limite_normal = 2 * limite_normal
+        metodos = np.where(limite_poisson <= tolerancia, "poisson",
+                           np.where(limite_normal <= tolerancia, "normal", "exata"))
+    else:
+        metodos = np.full(n.shape, metodo)
+
+    if funcao != "pmf":
+        k = np.floor(k)
+    valores = np.empty(n.shape)
+    for nome in ("exata", "poisson", "normal"):
+        lanes = metodos == nome
+        if not lanes.any():
+            continue
+        nl, kl, pl = n[lanes], np.clip(k[lanes], 0, n[lanes]), p[lanes]
+        if nome == "exata":
+            if funcao == "pmf":
+                resultado = np.exp(log_pmf_binomial(nl, kl, pl))
+            # P(X ≤ k) = I_(1-p)(n-k, k+1); k = n é tratado após o laço
+            elif funcao == "cdf":
+                resultado = special.betainc(np.maximum(nl - kl, 1), kl + 1, 1 - pl)
+            else:
+                resultado = special.betainc(kl + 1, np.maximum(nl - kl, 1), pl)
+        elif nome == "poisson":
+            lam = nl * pl
+            if funcao == "pmf":
+                resultado = np.exp(log_pmf_poisson(kl, lam))
+            elif funcao == "cdf":
+                resultado = special.pdtr(kl, lam)
+            else:
+                resultado = special.pdtrc(kl, lam)
+        else:
+            desvio = np.sqrt(nl * pl * (1 - pl))
+            z = (kl + 0.5 - nl * pl) / desvio
+            if funcao == "pmf":
+                resultado = special.ndtr(z) - special.ndtr(z - 1 / desvio)
+            elif funcao == "cdf":
+                resultado = special.ndtr(z)
+            else:
+                resultado = special.ndtr(-z)
+        valores[lanes] = resultado
+
+    # Valores fora do suporte 0..n são exatos para qualquer método
+    if funcao == "pmf":
+        valores[(k < 0) | (k > n) | (k != np.floor(k))] = 0.0
+    elif funcao == "cdf":
+        valores = np.where(k < 0, 0.0, np.where(k >= n, 1.0, valores))
+    else:
+        valores = np.where(k < 0, 1.0, np.where(k >= n, 0.0, valores))
+    return valores[()], metodos[()]
+
+
 def formatar_resultado(valor: float, decimais: int = 4) -> str:
     """
     Formata o resultado com o número especificado de casas decimais.
@@ -1,6 +1,5 @@
 import numpy as np
 import matplotlib.pyplot as plt
-import math
 
 # Try to import ipywidgets for interactive features, but continue if not available
 try:
@@ -56,6 +55,250 @@ def bissecao(f, a, b, eps=1e-6, max_iter=100):
     c = (a + b) / 2
     return c, iteracao, historico
 
+def _preparar_lote(f, a, b, parametros):
+    """
+    Combina intervalos e parâmetros por broadcasting e avalia f nos extremos.
+    
+    Retorna:
+    forma: forma comum dos arrays
+    a, b, fa, fb: arrays planos (cópias) com os extremos e os valores de f
+    parametros: lista de arrays planos de parâmetros
+    """
+    forma = np.broadcast_shapes(np.shape(a), np.shape(b), *(np.shape(p) for p in parametros))
+    a = np.array(np.broadcast_to(np.asarray(a, dtype=float), forma)).ravel()
+    b = np.array(np.broadcast_to(np.asarray(b, dtype=float), forma)).ravel()
+    parametros = [np.broadcast_to(p, forma).ravel() for p in parametros]
+    fa = np.asarray(f(a, *parametros), dtype=float)
+    fb = np.asarray(f(b, *parametros), dtype=float)
+    if np.any(fa * fb > 0):
+        raise ValueError("A função deve ter sinais opostos nos extremos de todos os intervalos.")
+    return forma, a, b, fa, fb, parametros
+
+def bissecao_vetorizada(f, a, b, *parametros, eps=1e-6, max_iter=100, metodo="bissecao",
+                        registrar_historico=False):
+    """
+    Resolve muitas equações f(x) = 0 de uma vez, uma para cada intervalo [a, b].
+    
+    Todos os intervalos avançam juntos com operações do NumPy; os que convergem
+    saem do conjunto ativo, e f passa a ser avaliada só nos restantes. Sem
+    histórico, nenhuma estrutura Python é criada por iteração.
+    
+    Métodos:
+    - "bissecao": mesmo critério de parada de bissecao (|b-a| ≤ eps ou |f(c)| < eps)
+    - "illinois": falsa posição de Illinois, que divide por 2 o valor de f no
+      extremo que se repete e converge com ordem ≈ 1,44; depois de três passos
+      seguidos que não reduzem o intervalo à metade, o seguinte é de bisseção,
+      o que garante a convergência mesmo com intervalos mal escalados
+    - "brent": método de Brent (interpolação inversa quadrática, secante e
+      bisseção de segurança), superlinear e com a garantia da bisseção
+    
+    Parâmetros:
+    f: função vetorizada f(x, *parametros), que recebe e devolve arrays
+    a, b: arrays com os extremos dos intervalos, com sinais opostos de f
+    *parametros: arrays de parâmetros de cada equação (ex.: número de histórias)
+    eps: tolerância para o critério de parada
+    max_iter: número máximo de iterações
+    metodo: "bissecao", "illinois" ou "brent"
+    registrar_historico: se True, guarda os valores dos intervalos ativos a cada iteração
+    
+    Retorna:
+    raizes: array com as aproximações das raízes, na forma dos intervalos
+    iteracoes: array com o número de iterações de cada intervalo
+    historico: lista com um dicionário de arrays por iteração ('iteracao',
+        'indices', 'a', 'b', 'c', 'f(c)'), ou None se registrar_historico for False
+    """
+    if metodo not in ("bissecao", "illinois", "brent"):
+        raise ValueError("metodo deve ser 'bissecao', 'illinois' ou 'brent'")
+    forma, a, b, fa, fb, parametros = _preparar_lote(f, a, b, parametros)
+    historico = [] if registrar_historico else None
+    if metodo == "brent":
+        raizes, iteracoes = _brent_lote(f, a, b, fa, fb, parametros, eps, max_iter, historico)
+        return raizes.reshape(forma), iteracoes.reshape(forma), historico
+    
+    raizes = np.empty(a.size)
+    iteracoes = np.zeros(a.size, dtype=int)
+    ativos = np.arange(a.size)
+    largura = np.abs(b - a)
+    lento = np.zeros(a.size, dtype=int)
+    for iteracao in range(max_iter):
+        # Intervalos já menores que a tolerância terminam no ponto médio
+        largos = np.abs(b[ativos] - a[ativos]) > eps
+        raizes[ativos[~largos]] = 0.5 * (a[ativos[~largos]] + b[ativos[~largos]])
+        ativos = ativos[largos]
+        if ativos.size == 0:
+            break
+        
+        ai, bi, fai, fbi = a[ativos], b[ativos], fa[ativos], fb[ativos]
+        if metodo == "bissecao":
+            c = 0.5 * (ai + bi)
+        else:
+            with np.errstate(divide='ignore', invalid='ignore'):
+                c = (ai * fbi - bi * fai) / (fbi - fai)
+            bissecta = (lento[ativos] >= 3) | ~np.isfinite(c)
+            c = np.where(bissecta, 0.5 * (ai + bi), c)
+        fc = np.asarray(f(c, *[p[ativos] for p in parametros]), dtype=float)
+        iteracoes[ativos] = iteracao
+        if historico is not None:
+            historico.append({'iteracao': iteracao, 'indices': ativos.copy(), 'a': ai, 'b': bi,
+                              'c': c, 'f(c)': fc})
+        
+        if metodo == "bissecao":
+            lado_a = fai * fc < 0  # Raiz em [a, c]
+            b[ativos] = np.where(lado_a, c, bi)
+            fb[ativos] = np.where(lado_a, fc, fbi)
+            a[ativos] = np.where(lado_a, ai, c)
+            fa[ativos] = np.where(lado_a, fai, fc)
+            feito = np.abs(fc) < eps
+        else:
+            # b é sempre o ponto mais recente; se f(c) tem o sinal de f(b), o
+            # extremo a se repete e seu valor é dividido por 2 (Illinois)
+            troca = fc * fbi < 0
+            a[ativos] = np.where(troca, bi, ai)
+            fa[ativos] = np.where(troca, fbi, np.where(bissecta, fai, 0.5 * fai))
+            b[ativos] = c
+            fb[ativos] = fc
+            nova_largura = np.abs(c - a[ativos])
+            lento[ativos] = np.where(nova_largura > 0.5 * largura[ativos], lento[ativos] + 1, 0)
+            largura[ativos] = nova_largura
+            # Mesmo critério de largura da bisseção: o passo entre dois iterados
+            # do mesmo lado pode ser pequeno com o intervalo ainda largo
+            feito = fc == 0
+        raizes[ativos[feito]] = c[feito]
+        iteracoes[ativos] += ~feito
+        ativos = ativos[~feito]
+    
+    if ativos.size:
+        raizes[ativos] = 0.5 * (a[ativos] + b[ativos]) if metodo == "bissecao" else b[ativos]
+    return raizes.reshape(forma), iteracoes.reshape(forma), historico
+
+def _brent_lote(f, a, b, fa, fb, parametros, eps, max_iter, historico):
+    """
+    Método de Brent aplicado a todos os intervalos ao mesmo tempo.
+    
+    Segue o algoritmo zeroin: b é a melhor aproximação, c o extremo oposto do
+    intervalo com troca de sinal e a o ponto anterior. Cada ramo do algoritmo
+    é escolhido por intervalo com máscaras booleanas.
+    """
+    c, fc = a.copy(), fa.copy()
+    d = b - a
+    e = d.copy()
+    iteracoes = np.zeros(a.size, dtype=int)
+    ativos = np.arange(a.size)
+    eps_maquina = np.finfo(float).eps
+    for iteracao in range(max_iter + 1):
+        ai, bi, ci = a[ativos], b[ativos], c[ativos]
+        fai, fbi, fci = fa[ativos], fb[ativos], fc[ativos]
+        di, ei = d[ativos], e[ativos]
+        
+        # c passa a ser o extremo com sinal oposto ao de b
+        mesmo_lado = np.sign(fbi) == np.sign(fci)
+        ci = np.where(mesmo_lado, ai, ci)
+        fci = np.where(mesmo_lado, fai, fci)
+        di = np.where(mesmo_lado, bi - ai, di)
+        ei = np.where(mesmo_lado, di, ei)
+        
+        # b deve ser o ponto com menor |f|
+        troca = np.abs(fci) < np.abs(fbi)
+        ai, fai = np.where(troca, bi, ai), np.where(troca, fbi, fai)
+        bi, fbi = np.where(troca, ci, bi), np.where(troca, fci, fbi)
+        ci, fci = np.where(troca, ai, ci), np.where(troca, fai, fci)
+        
+        tol1 = 2 * eps_maquina * np.abs(bi) + 0.5 * eps
+        xm = 0.5 * (ci - bi)
+        feito = (np.abs(xm) <= tol1) | (fbi == 0)
+        
+        # Guarda o estado e retira os intervalos que convergiram
+        a[ativos], b[ativos], c[ativos] = ai, bi, ci
+        fa[ativos], fb[ativos], fc[ativos] = fai, fbi, fci
+        d[ativos], e[ativos] = di, ei
+        iteracoes[ativos] = iteracao
+        continuar = ~feito
+        ativos = ativos[continuar]
+        if ativos.size == 0 or iteracao == max_iter:
+            break
+        ai, bi, ci, fai, fbi, fci = (ai[continuar], bi[continuar], ci[continuar],
+                                     fai[continuar], fbi[continuar], fci[continuar])
+        di, ei, tol1, xm = di[continuar], ei[continuar], tol1[continuar], xm[continuar]
+        
+        # Passo de interpolação: secante se a == c, senão quadrática inversa
+        with np.errstate(divide='ignore', invalid='ignore'):
+            s = fbi / fai
+            q_ = fai / fci
+            r = fbi / fci
+            secante = ai == ci
+            p = np.where(secante, 2 * xm * s, s * (2 * xm * q_ * (q_ - r) - (bi - ai) * (r - 1)))
+            q = np.where(secante, 1 - s, (q_ - 1) * (r - 1) * (s - 1))
+        q = np.where(p > 0, -q, q)
+        p = np.abs(p)
+        interpola = (np.abs(ei) >= tol1) & (np.abs(fai) > np.abs(fbi))
+        aceita = interpola & (2 * p < np.minimum(3 * xm * q - np.abs(tol1 * q), np.abs(ei * q)))
+        with np.errstate(divide='ignore', invalid='ignore'):
+            novo_d = np.where(aceita, p / q, xm)
+        ei = np.where(aceita, di, xm)
+        di = novo_d
+        
+        ai, fai = bi, fbi
+        bi = bi + np.where(np.abs(di) > tol1, di, np.copysign(tol1, xm))
+        fbi = np.asarray(f(bi, *[prm[ativos] for prm in parametros]), dtype=float)
+        if historico is not None:
+            historico.append({'iteracao': iteracao, 'indices': ativos.copy(), 'a': ai, 'b': ci,
+                              'c': bi, 'f(c)': fbi})
+        a[ativos], b[ativos], fa[ativos], fb[ativos] = ai, bi, fai, fbi
+        d[ativos], e[ativos] = di, ei
+    return b, iteracoes
+
+def encontrar_intervalos(f, a, b, num_pontos=1000):
+    """
+    Encontra intervalos com troca de sinal de f amostrando uma grade em [a, b].
+    
+    A função é avaliada uma única vez em todos os pontos da grade (f deve
+    aceitar arrays do NumPy). Cada par de pontos vizinhos com sinais opostos
+    vira um intervalo. Raízes de multiplicidade par (em que f toca o zero sem
+    trocar de sinal) e pares de raízes mais próximas que o passo da grade não
+    são detectados. Uma descontinuidade com troca de sinal, como um polo,
+    também gera um intervalo. Pontos em que f não é finita são ignorados.
+    
+    Parâmetros:
+    f: função vetorizada
+    a, b: extremos do domínio de busca
+    num_pontos: número de pontos da grade
+    
+    Retorna:
+    intervalos: array (n, 2) com os extremos de cada intervalo com troca de sinal
+    zeros: array com os pontos da grade em que f é exatamente zero
+    """
+    x = np.linspace(a, b, num_pontos)
+    y = np.asarray(f(x), dtype=float)
+    finitos = np.isfinite(y)
+    x, y = x[finitos], y[finitos]
+    troca = y[:-1] * y[1:] < 0
+    return np.column_stack((x[:-1][troca], x[1:][troca])), x[y == 0]
+
+def encontrar_raizes(f, a, b, num_pontos=1000, eps=1e-10, metodo="brent", max_iter=100):
+    """
+    Encontra todas as raízes de f em [a, b] detectáveis na grade.
+    
+    Os intervalos de encontrar_intervalos são refinados todos juntos por uma
+    única chamada a bissecao_vetorizada, sem laço Python por intervalo.
+    
+    Parâmetros:
+    f: função vetorizada
+    a, b: extremos do domínio de busca
+    num_pontos: número de pontos da grade
+    eps: tolerância do refinamento
+    metodo: "bissecao", "illinois" ou "brent"
+    max_iter: número máximo de iterações do refinamento
+    
+    Retorna:
+    raizes: array ordenado com as raízes encontradas
+    """
+    intervalos, zeros = encontrar_intervalos(f, a, b, num_pontos)
+    raizes = np.empty(0)
+    if len(intervalos):
+        raizes, _, _ = bissecao_vetorizada(f, intervalos[:, 0], intervalos[:, 1], eps=eps,
+                                           max_iter=max_iter, metodo=metodo)
+    return np.sort(np.concatenate((raizes, zeros)))
+
 def visualizar_bissecao(f, a, b, eps=1e-6, max_iter=20):
     """
     Visualiza graficamente o processo de convergência do método da bisseção.
@@ -131,7 +374,7 @@ def altura_objeto(t, m=2, S0=40, k=0.6, g=9.81):
     k: coeficiente de resistência do ar (kg/s)
     g: aceleração da gravidade (m/s²)
     """
-    return S0 - ((m*g/k)*t) + (((m*g)/(k**2))*(1 - math.exp(-k*t/m)))
+    return S0 - ((m*g/k)*t) + (((m*g)/(k**2))*(1 - np.exp(-k*t/m)))
 
 def exemplo_queda(visualizar=True):
     """Exemplo do objeto em queda com resistência do ar."""
@@ -149,8 +392,13 @@ def exemplo_queda(visualizar=True):
         plt.grid(True)
         plt.show()
     
-    # Encontrar o tempo de queda usando bisseção
-    raiz, iteracoes = visualizar_bissecao(altura_objeto, 3, 5, 1e-6, 15)
+    # Localizar automaticamente o intervalo com troca de sinal e refinar por bisseção
+    intervalos, _ = encontrar_intervalos(altura_objeto, 0, 10, 21)
+    if len(intervalos) == 0:
+        print("O objeto não atinge o solo nos primeiros 10 segundos")
+        return None
+    a, b = intervalos[0]
+    raiz, iteracoes = visualizar_bissecao(altura_objeto, a, b, 1e-6, 15)
     if raiz:
         print(f"O objeto atinge o solo em {raiz:.3f} segundos")
     return raiz
@@ -180,8 +428,12 @@ def exemplo_basquete(visualizar=True):
         plt.show()
     
     # Encontrar o momento em que o jogador atinge determinada pontuação
+    intervalos, _ = encontrar_intervalos(pontuacao_jogador, 0, 30, 301)
+    if len(intervalos) == 0:
+        print("A pontuação alvo não é atingida entre 0 e 30 minutos")
+        return None
     try:
-        raiz, iteracoes = visualizar_bissecao(pontuacao_jogador, 10, 20, 1e-6, 15)
+        raiz, iteracoes = visualizar_bissecao(pontuacao_jogador, *intervalos[0], 1e-6, 15)
         if raiz:
             print(f"O jogador atinge a pontuação alvo em {raiz:.2f} minutos")
         return raiz
@@ -245,6 +497,7 @@ if __name__ == "__main__":
         
         if opcao == 1:
             visualizar_bissecao(polinomio_exemplo, 1, 2, 1e-6, 10)
+            print(f"Todas as raízes em [-10, 10]: {encontrar_raizes(polinomio_exemplo, -10, 10)}")
             
         elif opcao == 2:
             exemplo_queda()
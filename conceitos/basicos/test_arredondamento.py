@@ -0,0 +1,62 @@
+"""
+Testes unitários para o módulo de arredondamento.
+"""
+
+import unittest
+import numpy as np
+from conceitos.basicos.arredondamento import (arredondar_digitos_significativos, calcular_erro_arredondamento,
+                                              propagar_erro)
+
+class TestArredondamento(unittest.TestCase):
+    def test_exemplos_escalares(self):
+        """Testa os exemplos do módulo e o caso do zero."""
+        self.assertEqual(arredondar_digitos_significativos(124678, 4), 124700.0)
+        self.assertAlmostEqual(arredondar_digitos_significativos(346.635, 4), 346.6)
+        self.assertEqual(arredondar_digitos_significativos(0, 3), 0.0)
+        self.assertIsInstance(arredondar_digitos_significativos(-0.0123456, 2), float)
+
+    def test_arrays_coincidem_com_escalares(self):
+        """Testa o arredondamento vetorizado contra o cálculo elemento a elemento."""
+        valores = np.random.default_rng(0).lognormal(0, 5, 1000) * np.sign(np.arange(1000) - 500)
+        arredondados = arredondar_digitos_significativos(valores, 3)
+        for valor, arredondado in zip(valores[::97], arredondados[::97]):
+            self.assertEqual(arredondado, arredondar_digitos_significativos(float(valor), 3))
+        np.testing.assert_allclose(arredondados, valores, rtol=5e-3)
+
+    def test_broadcasting_e_valores_especiais(self):
+        """Testa precisões em lote e zeros, infinitos e NaN."""
+        resultado = arredondar_digitos_significativos(np.pi, np.arange(1, 5))
+        np.testing.assert_allclose(resultado, [3, 3.1, 3.14, 3.142])
+        especiais = arredondar_digitos_significativos(np.array([0.0, np.inf, -np.inf, np.nan]), 2)
+        np.testing.assert_array_equal(especiais, [0.0, np.inf, -np.inf, np.nan])
+
+    def test_erro_em_lote(self):
+        """Testa as métricas de erro com arrays, inclusive valor exato nulo."""
+        erros = calcular_erro_arredondamento(np.array([124678, 0.0, 0.0]), np.array([124700, 0.0, 1.0]))
+        np.testing.assert_allclose(erros['erro_absoluto'], [22, 0, 1])
+        np.testing.assert_array_equal(erros['erro_relativo'][1:], [0, np.inf])
+        self.assertAlmostEqual(calcular_erro_arredondamento(124678, 124700)['erro_percentual'], 2200 / 124678)
+
+class TestPropagacaoErro(unittest.TestCase):
+    def test_matriz_coincide_com_laco_escalar(self):
+        """Testa a matriz (precisão × iteração) contra o laço original por precisão."""
+        precisoes = [2, 4, 6, 8]
+        valores = propagar_erro(3.7, 8, precisoes)
+        self.assertEqual(valores.shape, (4, 9))
+        for linha, precisao in zip(valores, precisoes):
+            valor = 3.7
+            esperado = [valor]
+            for _ in range(8):
+                valor = arredondar_digitos_significativos(valor ** 2 / 10, precisao)
+                esperado.append(valor)
+            np.testing.assert_array_equal(linha, esperado)
+
+    def test_varios_valores_iniciais(self):
+        """Testa a propagação com um array de valores iniciais."""
+        iniciais = np.array([[1.5, 2.5, 3.5]])
+        valores = propagar_erro(iniciais, 5, [3, 5], operacao=lambda x: x * 1.01)
+        self.assertEqual(valores.shape, (2, 6, 1, 3))
+        np.testing.assert_array_equal(valores[1, :, 0, 2], propagar_erro(3.5, 5, [5], lambda x: x * 1.01)[0])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,127 @@
+"""
+Testes unitários para o módulo de distribuição binomial.
+"""
+
+import unittest
+import numpy as np
+from scipy.stats import binom, beta
+from conceitos.basicos.binomial import (DistribuicaoBinomial, avaliar_binomial, log_pmf_binomial,
+                                        newton, newton_vetorizado)
+
+class TestDistribuicaoBinomial(unittest.TestCase):
+    def setUp(self):
+        """Define uma distribuição pequena para comparação com o scipy."""
+        self.dist = DistribuicaoBinomial(20, 0.3)
+        self.k = np.arange(-2, 24)
+
+    def test_tabelas_coincidem_com_scipy(self):
+        """Testa as consultas vetorizadas contra binom.pmf/cdf/sf."""
+        np.testing.assert_allclose(self.dist.pmf(self.k), binom.pmf(self.k, 20, 0.3))
+        np.testing.assert_allclose(self.dist.cdf(self.k), binom.cdf(self.k, 20, 0.3))
+        np.testing.assert_allclose(self.dist.sf(self.k), binom.sf(self.k, 20, 0.3))
+
+    def test_consultas_pontuais(self):
+        """Testa consultas escalares, inclusive fora do suporte e não inteiras."""
+        self.assertAlmostEqual(self.dist.pmf(6), binom.pmf(6, 20, 0.3))
+        self.assertEqual(self.dist.pmf(2.5), 0.0)
+        self.assertAlmostEqual(self.dist.cdf(2.5), binom.cdf(2, 20, 0.3))
+        self.assertEqual(self.dist.cdf(-1), 0.0)
+        self.assertEqual(self.dist.sf(25), 0.0)
+
+    def test_cauda_superior_precisa(self):
+        """Testa que a SF não perde precisão como 1 - CDF."""
+        dist = DistribuicaoBinomial(200000, 0.01)
+        self.assertGreater(dist.sf(3000), 0.0)
+        self.assertAlmostEqual(dist.sf(3000) / binom.sf(3000, 200000, 0.01), 1.0)
+
+    def test_tabelas_recalculadas_ao_mudar_parametros(self):
+        """Testa que o cache é invalidado quando p muda."""
+        tabela = self.dist.calcular_tabela_probabilidades()
+        self.assertEqual(len(tabela), 21)
+        self.assertAlmostEqual(sum(tabela.values()), 1.0)
+        self.dist.p = 0.5
+        self.assertAlmostEqual(self.dist.pmf(10), binom.pmf(10, 20, 0.5))
+
+class TestAvaliarBinomial(unittest.TestCase):
+    def test_log_pmf_n_grande(self):
+        """Testa o log da PMF para n = 10^8, onde math.comb seria inviável."""
+        n, p = 10**8, 1e-3
+        k = np.array([99000, 100000, 101000])
+        # binom.logpmf usa diferenças de lgamma e erra no sétimo dígito aqui
+        np.testing.assert_allclose(log_pmf_binomial(n, k, p), np.log(binom.pmf(k, n, p)), rtol=1e-12)
+        self.assertEqual(log_pmf_binomial(10, 11, 0.5), -np.inf)
+
+    def test_exata_em_lote(self):
+        """Testa a avaliação exata com arrays de (n, k, p) combinados por broadcasting."""
+        n = np.array([[50], [10**8]])
+        p = np.array([[0.3], [0.5]])
+        k = np.floor(n * p) + np.array([-2, 0, 3])
+        for funcao in ("pmf", "cdf", "sf"):
+            valores, metodos = avaliar_binomial(n, k, p, funcao, metodo="exata")
+            self.assertEqual(valores.shape, (2, 3))
+            np.testing.assert_allclose(valores, getattr(binom, funcao)(k, n, p), rtol=1e-8)
+
+    def test_troca_automatica_de_metodo(self):
+        """Testa a escolha da aproximação pelos limites de erro."""
+        n = np.array([10**8, 10**8, 20])
+        p = np.array([1e-9, 0.4, 0.4])
+        k = np.floor(n * p)
+        valores, metodos = avaliar_binomial(n, k, p, "cdf", tolerancia=1e-3)
+        self.assertEqual(list(metodos), ["poisson", "normal", "exata"])
+        np.testing.assert_allclose(valores, binom.cdf(k, n, p), atol=1e-3)
+
+    def test_fora_do_suporte(self):
+        """Testa valores de k fora de 0..n."""
+        self.assertEqual(avaliar_binomial(10, -1, 0.2, "cdf")[0], 0.0)
+        self.assertEqual(avaliar_binomial(10, 10, 0.2, "sf")[0], 0.0)
+        self.assertEqual(avaliar_binomial(10, 2.5, 0.2, "pmf")[0], 0.0)
+        with self.assertRaises(ValueError):
+            avaliar_binomial(10, 2, 1.5)
+
+class TestNewtonVetorizado(unittest.TestCase):
+    def test_coincide_com_newton_escalar(self):
+        """Testa cada pista contra o método de Newton escalar."""
+        a = np.array([2.0, 9.0, 50.0])
+        raizes, iteracoes, convergiu = newton_vetorizado(lambda x, a: x * x - a, lambda x, a: 2 * x, 1.0, a)
+        self.assertTrue(convergiu.all())
+        for ai, raiz in zip(a, raizes):
+            self.assertAlmostEqual(raiz, newton(lambda x: x * x - ai, lambda x: 2 * x, 1.0))
+        self.assertEqual(iteracoes[0], 5)
+        self.assertLess(iteracoes[0], iteracoes[2])
+
+    def test_bissecao_quando_newton_diverge(self):
+        """Testa a bisseção de segurança em arctan, onde Newton diverge a partir de 2."""
+        x0 = np.array([0.5, 2.0, 3.0])
+        _, _, convergiu = newton_vetorizado(np.arctan, lambda x: 1 / (1 + x * x), x0)
+        self.assertEqual(list(convergiu), [True, False, False])
+        raizes, _, convergiu = newton_vetorizado(np.arctan, lambda x: 1 / (1 + x * x), x0, limites=(-5.0, 6.0))
+        self.assertTrue(convergiu.all())
+        np.testing.assert_allclose(raizes, 0.0, atol=1e-6)
+
+    def test_x0_no_ponto_medio(self):
+        """Testa x0 no ponto médio dos limites com um passo de Newton que sai do intervalo."""
+        f = lambda x: np.arctan(x + 1)
+        df = lambda x: 1 / (1 + (x + 1) ** 2)
+        raizes, iteracoes, convergiu = newton_vetorizado(f, df, 2.0, limites=(-6.0, 10.0))
+        self.assertTrue(convergiu)
+        self.assertGreater(iteracoes, 1)
+        self.assertAlmostEqual(float(raizes), -1.0, places=6)
+
+    def test_inversao_da_cdf_binomial(self):
+        """Testa o limite superior de Clopper-Pearson para muitas combinações de (k, n)."""
+        k = np.arange(2000) % 50
+        n = k + np.arange(2000) % 300 + 1
+        raizes, _, convergiu = newton_vetorizado(
+            lambda p, k, n: binom.cdf(k, n, p) - 0.05,
+            lambda p, k, n: -n * binom.pmf(k, n - 1, p),
+            (k + 1) / (n + 1), k, n, limites=(0.0, 1.0), tol=1e-12)
+        self.assertTrue(convergiu.all())
+        np.testing.assert_allclose(raizes, beta.ppf(0.95, k + 1, n - k), atol=1e-10)
+
+    def test_limites_sem_troca_de_sinal(self):
+        """Testa a validação dos intervalos."""
+        with self.assertRaises(ValueError):
+            newton_vetorizado(np.arctan, lambda x: 1 / (1 + x * x), 1.0, limites=(1.0, 2.0))
+
+if __name__ == '__main__':
+    unittest.main()
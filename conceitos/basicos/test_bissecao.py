@@ -0,0 +1,90 @@
+"""
+Testes unitários para o módulo do método da bisseção.
+"""
+
+import unittest
+import numpy as np
+from conceitos.basicos.bissecao import (bissecao, bissecao_vetorizada, polinomio_exemplo,
+                                       encontrar_intervalos, encontrar_raizes, altura_objeto)
+
+class TestBissecaoVetorizada(unittest.TestCase):
+    def setUp(self):
+        """Define intervalos diferentes em torno da raiz de x³ - x - 2."""
+        self.a = np.array([1.0, 0.0, -1.0, 1.5])
+        self.b = np.array([2.0, 3.0, 5.0, 1.6])
+        self.raiz = 1.5213797068045676
+
+    def test_coincide_com_bissecao_escalar(self):
+        """Testa cada intervalo contra a bisseção escalar."""
+        raizes, iteracoes, historico = bissecao_vetorizada(polinomio_exemplo, self.a, self.b, eps=1e-10)
+        self.assertIsNone(historico)
+        for ai, bi, raiz, n in zip(self.a, self.b, raizes, iteracoes):
+            c, it, _ = bissecao(polinomio_exemplo, ai, bi, eps=1e-10)
+            self.assertEqual(raiz, c)
+            self.assertEqual(n, it)
+
+    def test_metodos_superlineares(self):
+        """Testa Illinois e Brent: mesma raiz com menos iterações que a bisseção."""
+        _, it_bissecao, _ = bissecao_vetorizada(polinomio_exemplo, self.a, self.b, eps=1e-12)
+        for metodo in ("illinois", "brent"):
+            raizes, iteracoes, _ = bissecao_vetorizada(polinomio_exemplo, self.a, self.b,
+                                                       eps=1e-12, metodo=metodo)
+            np.testing.assert_allclose(raizes, self.raiz, atol=1e-11)
+            self.assertTrue((iteracoes < it_bissecao).all())
+
+    def test_parametros_por_equacao(self):
+        """Testa muitas equações de tempo de entrega com parâmetros diferentes."""
+        taxa_hora = 3 / 5 / 8 * 0.6
+        historias = np.arange(1, 5001, dtype=float)
+        for metodo in ("bissecao", "illinois", "brent"):
+            horas, _, _ = bissecao_vetorizada(lambda h, n: n - taxa_hora * h, 0.0, 2e5, historias,
+                                              eps=1e-8, metodo=metodo)
+            np.testing.assert_allclose(horas, historias / taxa_hora, atol=1e-6)
+
+    def test_intervalo_mal_escalado(self):
+        """Testa exp(x) - 1e8 em [0, 100], onde a falsa posição pura quase não sai do lugar."""
+        for metodo in ("bissecao", "illinois", "brent"):
+            raiz, iteracoes, _ = bissecao_vetorizada(lambda x: np.exp(x) - 1e8, 0.0, 100.0,
+                                                     eps=1e-10, metodo=metodo)
+            self.assertAlmostEqual(float(raiz), np.log(1e8), places=9)
+            self.assertLess(iteracoes, 100)
+
+    def test_historico_opcional(self):
+        """Testa o registro do histórico apenas quando pedido."""
+        _, iteracoes, historico = bissecao_vetorizada(polinomio_exemplo, self.a, self.b,
+                                                      registrar_historico=True)
+        self.assertEqual(len(historico), iteracoes.max())
+        self.assertEqual(set(historico[0]), {'iteracao', 'indices', 'a', 'b', 'c', 'f(c)'})
+
+    def test_sem_troca_de_sinal(self):
+        """Testa a validação dos intervalos."""
+        with self.assertRaises(ValueError):
+            bissecao_vetorizada(polinomio_exemplo, np.array([1.0, 2.0]), np.array([2.0, 3.0]))
+
+class TestEncontrarRaizes(unittest.TestCase):
+    def test_todas_as_raizes_do_seno(self):
+        """Testa a busca de todas as raízes de sen(x) em um domínio largo."""
+        raizes = encontrar_raizes(np.sin, -20.0, 20.0, num_pontos=401)
+        np.testing.assert_allclose(raizes, np.pi * np.arange(-6, 7), atol=1e-9)
+
+    def test_polinomio_exemplo(self):
+        """Testa que x³ - x - 2 tem uma única raiz real."""
+        raizes = encontrar_raizes(polinomio_exemplo, -100.0, 100.0)
+        self.assertEqual(len(raizes), 1)
+        self.assertAlmostEqual(raizes[0], 1.5213797068045676, places=9)
+
+    def test_zeros_na_grade(self):
+        """Testa raízes que caem exatamente em pontos da grade."""
+        raizes = encontrar_raizes(lambda x: (x - 1) * (x - 2) * (x - 3), 0.0, 4.0, num_pontos=5)
+        np.testing.assert_array_equal(raizes, [1.0, 2.0, 3.0])
+
+    def test_intervalo_da_queda(self):
+        """Testa a localização automática do intervalo do objeto em queda."""
+        intervalos, zeros = encontrar_intervalos(altura_objeto, 0, 10, 21)
+        self.assertEqual(intervalos.shape, (1, 2))
+        self.assertEqual(len(zeros), 0)
+        a, b = intervalos[0]
+        self.assertLess(altura_objeto(b) * altura_objeto(a), 0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,156 @@
+"""
+Testes unitários para o módulo da regra do trapézio.
+"""
+
+import itertools
+import math
+import os
+import tempfile
+import unittest
+import numpy as np
+from scipy import integrate
+from conceitos.basicos.trapezio import (f, trapezoidal_rule_simple, trapezoidal_rule_composite,
+                                        trapezoidal_refinements, trapezoidal_rule_adaptive,
+                                        calculate_distance_from_velocity, read_velocity_chunks,
+                                        stream_cumulative_distance, distance_from_stream, KMH_S_TO_M,
+                                        gauss_legendre_nodes, gauss_legendre_quadrature, adaptive_simpson)
+
+class TestTrapezio(unittest.TestCase):
+    def setUp(self):
+        """Define o intervalo do exemplo do módulo e a integral de referência."""
+        self.a, self.b = 0.0, 2 - math.sqrt(2)
+        self.exata = integrate.quad(f, self.a, self.b, epsabs=1e-14)[0]
+
+    def test_simples_e_composta_coincidem(self):
+        """Testa as duas implementações contra o somatório escalar do trapézio."""
+        for n in (1, 3, 60):
+            h = (self.b - self.a) / n
+            esperado = h * ((f(self.a) + f(self.b)) / 2 + sum(f(self.a + i * h) for i in range(1, n)))
+            self.assertAlmostEqual(trapezoidal_rule_simple(f, self.a, self.b, n), esperado, places=14)
+            self.assertAlmostEqual(trapezoidal_rule_composite(f, self.a, self.b, n), esperado, places=14)
+
+    def test_integrando_avaliado_uma_vez(self):
+        """Testa que f é chamada uma única vez com a grade inteira."""
+        chamadas = []
+        def g(x):
+            chamadas.append(np.shape(x))
+            return np.cos(x)
+        trapezoidal_rule_composite(g, 0.0, 1.0, 20)
+        self.assertEqual(chamadas, [(21,)])
+        self.assertAlmostEqual(trapezoidal_rule_composite(lambda x: 2.0, 0.0, 3.0, 4), 6.0)
+
+    def test_refinamentos_reaproveitam_avaliacoes(self):
+        """Testa que dobrar n avalia só os pontos médios novos."""
+        pontos = []
+        def g(x):
+            pontos.append(np.size(x))
+            return f(x)
+        niveis = list(itertools.islice(trapezoidal_refinements(g, self.a, self.b, 3), 5))
+        self.assertEqual([n for n, _ in niveis], [3, 6, 12, 24, 48])
+        self.assertEqual(sum(pontos), 49)
+        for n, integral in niveis:
+            self.assertAlmostEqual(integral, trapezoidal_rule_composite(f, self.a, self.b, n), places=14)
+
+    def test_romberg_atinge_tolerancia(self):
+        """Testa a extrapolação de Romberg contra o trapézio adaptativo puro."""
+        integral, n = trapezoidal_rule_adaptive(f, self.a, self.b, tol=1e-12)
+        self.assertAlmostEqual(integral, self.exata, places=12)
+        integral_trapezio, n_trapezio = trapezoidal_rule_adaptive(f, self.a, self.b, tol=1e-8,
+                                                                  extrapolate=False)
+        self.assertAlmostEqual(integral_trapezio, self.exata, places=7)
+        self.assertLess(n, n_trapezio)
+
+    def test_tolerancia_nao_atingida(self):
+        """Testa o erro quando o número de níveis é insuficiente."""
+        with self.assertRaises(ValueError):
+            trapezoidal_rule_adaptive(np.sqrt, 0.0, 1.0, tol=1e-14, max_levels=3)
+
+class TestQuadraturasDeOrdemAlta(unittest.TestCase):
+    def setUp(self):
+        """Define limites em lote e as integrais de referência."""
+        self.b = np.linspace(-1.0, 2.5, 8)
+        self.exatas = np.array([integrate.quad(f, 0.0, bi, epsabs=1e-14)[0] for bi in self.b])
+
+    def test_gauss_legendre_exata_para_polinomios(self):
+        """Testa a exatidão para polinômios de grau até 2n - 1."""
+        self.assertAlmostEqual(gauss_legendre_quadrature(lambda x: x**9 - 3 * x**4, -1.0, 2.0, 5),
+                               (2**10 - 1) / 10 - 3 * (2**5 + 1) / 5, places=11)
+
+    def test_nos_em_cache(self):
+        """Testa que os nós de cada ordem são calculados uma vez e protegidos contra escrita."""
+        nos, pesos = gauss_legendre_nodes(12)
+        self.assertIs(gauss_legendre_nodes(12)[0], nos)
+        self.assertFalse(nos.flags.writeable)
+        self.assertAlmostEqual(pesos.sum(), 2.0)
+
+    def test_limites_em_lote(self):
+        """Testa muitas integrais definidas de uma vez, inclusive com b < a."""
+        chamadas = []
+        def g(x):
+            chamadas.append(np.shape(x))
+            return f(x)
+        np.testing.assert_allclose(gauss_legendre_quadrature(g, 0.0, self.b, 30), self.exatas, atol=1e-12)
+        self.assertEqual(chamadas, [(8, 30)])
+        np.testing.assert_allclose(adaptive_simpson(f, 0.0, self.b, tol=1e-12), self.exatas, atol=1e-11)
+        self.assertEqual(np.shape(adaptive_simpson(f, np.zeros((2, 1)), self.b)), (2, 8))
+
+    def test_simpson_reaproveita_avaliacoes(self):
+        """Testa que o Simpson adaptativo usa muito menos pontos que o trapézio composto."""
+        pontos = []
+        def g(x):
+            pontos.append(np.size(x))
+            return f(x)
+        a, b = 0.0, 2 - math.sqrt(2)
+        exata = integrate.quad(f, a, b, epsabs=1e-14)[0]
+        self.assertAlmostEqual(adaptive_simpson(g, a, b, tol=1e-10), exata, places=10)
+        _, n = trapezoidal_rule_adaptive(f, a, b, tol=1e-10, extrapolate=False)
+        self.assertLess(10 * sum(pontos), n + 1)
+
+    def test_tolerancia_nao_atingida(self):
+        """Testa o erro quando a profundidade máxima é insuficiente."""
+        with self.assertRaises(ValueError):
+            adaptive_simpson(np.sqrt, 0.0, 1.0, tol=1e-14, max_depth=3)
+
+class TestDistanciaEmFluxo(unittest.TestCase):
+    def setUp(self):
+        """Gera um registro de telemetria com passos de tempo irregulares."""
+        rng = np.random.default_rng(0)
+        self.t = np.cumsum(rng.uniform(0.5, 1.5, 1001))
+        self.v = rng.uniform(0, 120, 1001)
+        self.acumulada = integrate.cumulative_trapezoid(self.v, self.t, initial=0) * KMH_S_TO_M
+        self.diretorio = tempfile.TemporaryDirectory()
+        self.addCleanup(self.diretorio.cleanup)
+
+    def test_exemplo_do_modulo(self):
+        """Testa o exemplo de velocidades do módulo."""
+        t = [0, 120, 240, 360, 480, 600, 720, 840, 960, 1080, 1200]
+        v = [20, 22, 23, 25, 30, 31, 32, 40, 45, 50, 65]
+        self.assertAlmostEqual(calculate_distance_from_velocity(t, v), 11350.0)
+        with self.assertRaises(ValueError):
+            calculate_distance_from_velocity(t, v[:-1])
+
+    def test_blocos_ligados_pela_amostra_de_fronteira(self):
+        """Testa que o tamanho do bloco não altera a distância acumulada."""
+        for tamanho in (1, 7, 1000, 5000):
+            blocos = list(stream_cumulative_distance(read_velocity_chunks((self.t, self.v), tamanho)))
+            np.testing.assert_allclose(np.concatenate([t for t, _ in blocos]), self.t)
+            np.testing.assert_allclose(np.concatenate([d for _, d in blocos]), self.acumulada, rtol=1e-12)
+
+    def test_fontes_em_arquivo(self):
+        """Testa a leitura em blocos de CSV, binário e array mapeado em memória."""
+        dados = np.column_stack((self.t, self.v))
+        csv = os.path.join(self.diretorio.name, "telemetria.csv")
+        np.savetxt(csv, dados, delimiter=",", header="tempo,velocidade", fmt="%.17g")
+        binario = os.path.join(self.diretorio.name, "telemetria.bin")
+        dados.tofile(binario)
+        mapeado = np.memmap(binario, dtype=np.float64, mode="r").reshape(-1, 2)
+        for fonte, opcoes in ((csv, {"skip_header": 1}), (binario, {}), (mapeado, {})):
+            total = distance_from_stream(read_velocity_chunks(fonte, chunk_size=64, **opcoes))
+            self.assertAlmostEqual(total, self.acumulada[-1], places=6)
+
+    def test_serie_vazia(self):
+        """Testa uma série sem amostras."""
+        self.assertEqual(distance_from_stream(read_velocity_chunks((np.array([]), np.array([])))), 0.0)
+
+if __name__ == '__main__':
+    unittest.main()
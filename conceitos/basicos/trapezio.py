@@ -1,4 +1,7 @@
+import functools
+import itertools
 import math
+import os
 import numpy as np
 
 # =====================================
@@ -10,19 +13,33 @@ def f(t):
     Função de exemplo para calcular a integral: sin(π*t²/2)
     
     Args:
-        t (float): Valor de entrada
+        t (float ou np.ndarray): Valor(es) de entrada
         
     Returns:
-        float: Valor da função no ponto t
+        float ou np.ndarray: Valor da função no(s) ponto(s) t
     """
-    return math.sin(math.pi * t**2/2)
+    return np.sin(np.pi * t**2/2)
+
+def _avaliar_na_grade(f, x):
+    """
+    Avalia f em todos os pontos de x com uma única chamada.
+    
+    Args:
+        f (function): Função que aceita arrays do NumPy
+        x (np.ndarray): Pontos de avaliação
+    
+    Returns:
+        np.ndarray: Valores de f com o mesmo formato de x (funções constantes
+        que devolvem um escalar também são aceitas)
+    """
+    return np.broadcast_to(np.asarray(f(x), dtype=float), x.shape)
 
 def trapezoidal_rule_simple(f, a, b, n):
     """
     Implementação da regra do trapézio simples.
     
     Args:
-        f (function): A função a ser integrada
+        f (function): A função a ser integrada (deve aceitar arrays do NumPy)
         a (float): Limite inferior da integração
         b (float): Limite superior da integração
         n (int): Número de subintervalos
@@ -31,18 +48,15 @@ def trapezoidal_rule_simple(f, a, b, n):
         float: Aproximação da integral definida
     """
     h = (b - a) / n
-    sum_value = (f(a) + f(b)) / 2
-    for i in range(1, n):
-        x = a + i * h
-        sum_value += f(x)
-    return h * sum_value
+    y = _avaliar_na_grade(f, a + h * np.arange(n + 1))
+    return h * (np.sum(y) - (y[0] + y[-1]) / 2)
 
 def trapezoidal_rule_composite(f, a, b, n):
     """
     Implementação da regra do trapézio composta usando numpy para vetorização.
     
     Args:
-        f (function): A função a ser integrada
+        f (function): A função a ser integrada (deve aceitar arrays do NumPy)
         a (float): Limite inferior da integração
         b (float): Limite superior da integração
         n (int): Número de subintervalos
@@ -52,40 +66,303 @@ def trapezoidal_rule_composite(f, a, b, n):
     """
     # Cria um array com os pontos de avaliação
     x = np.linspace(a, b, n+1)
-    # Avalia a função em todos os pontos
-    y = np.array([f(xi) for xi in x])
+    # Avalia a função em todos os pontos com uma única chamada
+    y = _avaliar_na_grade(f, x)
     
     # Aplica a regra do trapézio
     area = (b - a) / (2 * n) * (y[0] + 2 * np.sum(y[1:-1]) + y[-1])
     return area
 
+def trapezoidal_refinements(f, a, b, n=1):
+    """
+    Gera as aproximações do trapézio composto com n, 2n, 4n, ... subintervalos.
+    
+    Ao dobrar n, os pontos antigos continuam na grade, então só os pontos
+    médios novos são avaliados: T(h/2) = T(h)/2 + (h/2)·Σ f(pontos médios).
+    Cada nível custa apenas as avaliações novas.
+    
+    Args:
+        f (function): A função a ser integrada (deve aceitar arrays do NumPy)
+        a (float): Limite inferior da integração
+        b (float): Limite superior da integração
+        n (int): Número inicial de subintervalos
+    
+    Yields:
+        tuple: (número de subintervalos, aproximação da integral)
+    """
+    h = (b - a) / n
+    integral = trapezoidal_rule_composite(f, a, b, n)
+    while True:
+        yield n, integral
+        pontos_medios = a + h * (np.arange(n) + 0.5)
+        integral = integral / 2 + h / 2 * np.sum(_avaliar_na_grade(f, pontos_medios))
+        n *= 2
+        h /= 2
+
+def trapezoidal_rule_adaptive(f, a, b, tol=1e-8, n=1, max_levels=25, extrapolate=True):
+    """
+    Integração adaptativa pelo trapézio composto, dobrando n até atingir a tolerância.
+    
+    Com extrapolate=True aplica o método de Romberg: a extrapolação de
+    Richardson elimina os termos h², h⁴, ... do erro do trapézio, e a
+    tolerância é atingida com muito menos pontos para funções suaves.
+    
+    Args:
+        f (function): A função a ser integrada (deve aceitar arrays do NumPy)
+        a (float): Limite inferior da integração
+        b (float): Limite superior da integração
+        tol (float): Diferença máxima entre duas estimativas sucessivas
+        n (int): Número inicial de subintervalos
+        max_levels (int): Número máximo de vezes que n é dobrado
+        extrapolate (bool): Se True, usa a extrapolação de Romberg
+    
+    Returns:
+        tuple: (aproximação da integral, número final de subintervalos)
+    
+    Raises:
+        ValueError: Se a tolerância não for atingida em max_levels níveis
+    """
+    linha_anterior = []
+    for nivel, (n_atual, trapezio) in enumerate(trapezoidal_refinements(f, a, b, n)):
+        # Linha da tabela de Romberg: R(k, j) = R(k, j-1) + (R(k, j-1) - R(k-1, j-1)) / (4^j - 1)
+        linha = [trapezio]
+        if extrapolate:
+            for j, anterior in enumerate(linha_anterior, start=1):
+                linha.append(linha[-1] + (linha[-1] - anterior) / (4**j - 1))
+        if linha_anterior and abs(linha[-1] - linha_anterior[-1]) <= tol:
+            return linha[-1], n_atual
+        if nivel == max_levels:
+            break
+        linha_anterior = linha
+    raise ValueError(f"Tolerância {tol} não atingida com {n_atual} subintervalos")
+
+@functools.lru_cache(maxsize=None)
+def gauss_legendre_nodes(order):
+    """
+    Nós e pesos de Gauss-Legendre em [-1, 1], calculados uma vez por ordem.
+    
+    Args:
+        order (int): Número de nós
+    
+    Returns:
+        tuple: (nós, pesos) como arrays somente leitura, compartilhados entre chamadas
+    """
+    nos, pesos = np.polynomial.legendre.leggauss(order)
+    nos.flags.writeable = False
+    pesos.flags.writeable = False
+    return nos, pesos
+
+def gauss_legendre_quadrature(f, a, b, order=20):
+    """
+    Quadratura de Gauss-Legendre com order nós, exata para polinômios de grau 2·order - 1.
+    
+    Os limites podem ser arrays (combinados por broadcasting) para calcular
+    muitas integrais definidas de uma vez: f é chamada uma única vez com um
+    array de formato (..., order) com os nós de todas elas.
+    
+    Args:
+        f (function): A função a ser integrada (deve aceitar arrays do NumPy)
+        a (float ou np.ndarray): Limite(s) inferior(es) da integração
+        b (float ou np.ndarray): Limite(s) superior(es) da integração
+        order (int): Número de nós
+    
+    Returns:
+        float ou np.ndarray: Aproximação da(s) integral(is) definida(s)
+    """
+    nos, pesos = gauss_legendre_nodes(order)
+    centro = (np.asarray(a, dtype=float) + b) / 2
+    meia_largura = (np.asarray(b, dtype=float) - a) / 2
+    x = centro[..., np.newaxis] + meia_largura[..., np.newaxis] * nos
+    integral = meia_largura * (_avaliar_na_grade(f, x) @ pesos)
+    return integral if integral.ndim else float(integral)
+
+def adaptive_simpson(f, a, b, tol=1e-10, max_depth=50):
+    """
+    Regra de Simpson adaptativa, em lote para arrays de limites de integração.
+    
+    Cada intervalo guarda os valores de f nos extremos e no ponto médio. Ao
+    ser dividido, os filhos herdam esses valores e só os dois novos pontos
+    médios são avaliados. Todos os intervalos pendentes, de todas as
+    integrais, são avaliados juntos em uma chamada de f por nível. Um
+    intervalo é aceito quando |S(esq) + S(dir) - S| ≤ 15·tol, e a tolerância
+    é dividida ao meio entre os filhos.
+    
+    Args:
+        f (function): A função a ser integrada (deve aceitar arrays do NumPy)
+        a (float ou np.ndarray): Limite(s) inferior(es) da integração
+        b (float ou np.ndarray): Limite(s) superior(es) da integração
+        tol (float): Tolerância absoluta de cada integral
+        max_depth (int): Número máximo de divisões de um intervalo
+    
+    Returns:
+        float ou np.ndarray: Aproximação da(s) integral(is) definida(s)
+    
+    Raises:
+        ValueError: Se algum intervalo não atingir a tolerância em max_depth divisões
+    """
+    a, b = np.broadcast_arrays(np.asarray(a, dtype=float), np.asarray(b, dtype=float))
+    forma = a.shape
+    a, b = a.ravel(), b.ravel()
+    m = (a + b) / 2
+    fa, fm, fb = np.split(_avaliar_na_grade(f, np.concatenate((a, m, b))), 3)
+    inteiro = (b - a) / 6 * (fa + 4 * fm + fb)
+    tolerancia = np.full(a.size, float(tol))
+    dono = np.arange(a.size)
+    total = np.zeros(a.size)
+    
+    for _ in range(max_depth):
+        if dono.size == 0:
+            break
+        m_esq, m_dir = (a + m) / 2, (m + b) / 2
+        f_esq, f_dir = np.split(_avaliar_na_grade(f, np.concatenate((m_esq, m_dir))), 2)
+        esquerda = (b - a) / 12 * (fa + 4 * f_esq + fm)
+        direita = (b - a) / 12 * (fm + 4 * f_dir + fb)
+        diferenca = esquerda + direita - inteiro
+        aceito = np.abs(diferenca) <= 15 * tolerancia
+        # Extrapolação de Richardson sobre as duas estimativas de Simpson
+        np.add.at(total, dono[aceito], (esquerda + direita + diferenca / 15)[aceito])
+        
+        r = ~aceito
+        a, m, b = (np.concatenate((a[r], m[r])), np.concatenate((m_esq[r], m_dir[r])),
+                   np.concatenate((m[r], b[r])))
+        fa, fm, fb = (np.concatenate((fa[r], fm[r])), np.concatenate((f_esq[r], f_dir[r])),
+                      np.concatenate((fm[r], fb[r])))
+        inteiro = np.concatenate((esquerda[r], direita[r]))
+        tolerancia = np.tile(tolerancia[r] / 2, 2)
+        dono = np.tile(dono[r], 2)
+    
+    if dono.size:
+        raise ValueError(f"Tolerância {tol} não atingida em {max_depth} divisões")
+    total = total.reshape(forma)
+    return total if total.ndim else float(total)
+
+# Conversão de km/h · s para metros
+KMH_S_TO_M = 1000 / 3600
+
 def calculate_distance_from_velocity(times, velocities):
     """
     Calcula a distância percorrida a partir de dados de tempo e velocidade
     usando a regra do trapézio.
     
     Args:
-        times (list): Lista de tempos em segundos
-        velocities (list): Lista de velocidades em km/h
+        times (array-like): Tempos em segundos
+        velocities (array-like): Velocidades em km/h
     
     Returns:
         float: Distância calculada em metros
     """
-    if len(times) != len(velocities):
+    t = np.asarray(times, dtype=float)
+    v = np.asarray(velocities, dtype=float)
+    if t.shape != v.shape:
         raise ValueError("Os arrays de tempo e velocidade devem ter o mesmo tamanho")
     
-    n = len(times) - 1  # número de intervalos
-    areas = []
+    # Soma das áreas dos trapézios (v1 + v2) * (t2 - t1) / 2, convertida para metros
+    return float(np.sum((v[1:] + v[:-1]) * np.diff(t)) / 2 * KMH_S_TO_M)
+
+def read_velocity_chunks(source, chunk_size=1_000_000, delimiter=",", skip_header=0, dtype=np.float64):
+    """
+    Lê pares (tempo, velocidade) em blocos de no máximo chunk_size amostras.
+    
+    Fontes aceitas:
+    - tupla (tempos, velocidades) de arrays, inclusive np.memmap
+    - array (n, 2), inclusive np.memmap, com tempo na primeira coluna
+    - arquivo .csv ou .txt com duas colunas (tempo, velocidade)
+    - qualquer outro arquivo: binário bruto com pares tempo, velocidade
+      intercalados do tipo dtype (como gravado por array.tofile)
+    
+    Só um bloco fica na memória por vez; arrays mapeados em memória são
+    fatiados sem cópia.
     
-    for i in range(n):
-        v1, v2 = velocities[i], velocities[i+1]  # velocidades nos pontos
-        t1, t2 = times[i], times[i+1]  # tempos nos pontos
-        area = (v1 + v2) * (t2 - t1) / 2  # área do trapézio
-        areas.append(area)
+    Args:
+        source: Fonte das amostras (ver acima)
+        chunk_size (int): Número máximo de amostras por bloco
+        delimiter (str): Separador das colunas do CSV
+        skip_header (int): Linhas de cabeçalho a ignorar no CSV
+        dtype: Tipo dos valores no arquivo binário
+    
+    Yields:
+        tuple: (tempos, velocidades) de cada bloco
+    """
+    if isinstance(source, tuple):
+        tempos, velocidades = source
+        for inicio in range(0, len(tempos), chunk_size):
+            yield tempos[inicio:inicio + chunk_size], velocidades[inicio:inicio + chunk_size]
+    elif isinstance(source, np.ndarray):
+        for inicio in range(0, len(source), chunk_size):
+            bloco = source[inicio:inicio + chunk_size]
+            yield bloco[:, 0], bloco[:, 1]
+    elif os.fspath(source).lower().endswith((".csv", ".txt")):
+        with open(source) as arquivo:
+            for _ in range(skip_header):
+                next(arquivo, None)
+            while True:
+                linhas = list(itertools.islice(arquivo, chunk_size))
+                if not linhas:
+                    break
+                bloco = np.loadtxt(linhas, delimiter=delimiter, ndmin=2)
+                yield bloco[:, 0], bloco[:, 1]
+    else:
+        with open(source, "rb") as arquivo:
+            while True:
+                bloco = np.fromfile(arquivo, dtype=dtype, count=2 * chunk_size)
+                if bloco.size == 0:
+                    break
+                if bloco.size % 2:
+                    raise ValueError("O arquivo binário deve conter pares (tempo, velocidade)")
+                bloco = bloco.reshape(-1, 2)
+                yield bloco[:, 0], bloco[:, 1]
+
+def stream_cumulative_distance(chunks, conversion=KMH_S_TO_M):
+    """
+    Integra blocos de (tempo, velocidade) e gera a distância acumulada.
+    
+    A última amostra de cada bloco é guardada e ligada à primeira do bloco
+    seguinte, então o resultado é idêntico ao de integrar a série inteira,
+    com memória constante independentemente do tamanho do registro.
+    
+    Args:
+        chunks (iterable): Blocos (tempos, velocidades), por exemplo de read_velocity_chunks
+        conversion (float): Fator de conversão de velocidade·tempo para distância
+            (padrão: km/h · s para metros)
+    
+    Yields:
+        tuple: (tempos, distância acumulada em cada tempo) de cada bloco;
+        a primeira amostra da série tem distância 0
+    """
+    t_anterior = v_anterior = None
+    total = 0.0
+    for tempos, velocidades in chunks:
+        t = np.asarray(tempos, dtype=float)
+        v = np.asarray(velocidades, dtype=float)
+        if t.shape != v.shape:
+            raise ValueError("Os arrays de tempo e velocidade devem ter o mesmo tamanho")
+        if t.size == 0:
+            continue
+        if t_anterior is None:
+            # Primeira amostra da série: a distância começa em zero
+            areas = np.concatenate(([0.0], (v[1:] + v[:-1]) * np.diff(t) / 2))
+        else:
+            areas = (np.concatenate(([v_anterior], v[:-1])) + v) * np.diff(t, prepend=t_anterior) / 2
+        acumulada = total + np.cumsum(areas) * conversion
+        total = acumulada[-1]
+        t_anterior, v_anterior = t[-1], v[-1]
+        yield t, acumulada
+
+def distance_from_stream(chunks, conversion=KMH_S_TO_M):
+    """
+    Calcula a distância total de uma série de blocos (tempo, velocidade).
     
-    # Convertendo para metros (km/h * s * 1000/3600 = m)
-    distance = sum(areas) * 1000/3600
-    return distance
+    Args:
+        chunks (iterable): Blocos (tempos, velocidades), por exemplo de read_velocity_chunks
+        conversion (float): Fator de conversão de velocidade·tempo para distância
+    
+    Returns:
+        float: Distância total (0 para uma série vazia)
+    """
+    total = 0.0
+    for _, acumulada in stream_cumulative_distance(chunks, conversion):
+        total = acumulada[-1]
+    return float(total)
 
 # =====================================
 # Exemplos de uso
@@ -100,15 +377,33 @@ if __name__ == "__main__":
     integral_simple = trapezoidal_rule_simple(f, a, b, 1)
     print(f"Integral usando a regra do trapézio simples: {integral_simple:.6f}")
     
-    # Usando a regra do trapézio composta com diferentes números de trapézios
-    for n in [3, 5, 10, 20, 60]:
-        integral_composite = trapezoidal_rule_composite(f, a, b, n)
+    # Estudo de convergência do trapézio composto: cada nível dobra n e
+    # reaproveita as avaliações do nível anterior
+    for n, integral_composite in itertools.islice(trapezoidal_refinements(f, a, b, 3), 6):
         print(f"Integral usando a regra do trapézio composta com {n} trapézios: {integral_composite:.10f}")
     
+    # Integração adaptativa com extrapolação de Romberg
+    integral_romberg, n = trapezoidal_rule_adaptive(f, a, b, tol=1e-12)
+    print(f"Integral usando Romberg ({n} trapézios no último nível): {integral_romberg:.12f}")
+    
+    # Quadraturas de ordem alta para integrandos suaves
+    print(f"Integral usando Gauss-Legendre com 10 nós: {gauss_legendre_quadrature(f, a, b, 10):.12f}")
+    print(f"Integral usando Simpson adaptativo: {adaptive_simpson(f, a, b, tol=1e-12):.12f}")
+    
+    # Várias integrais definidas de uma vez: S(x) = ∫₀ˣ sin(πt²/2) dt (integral de Fresnel)
+    limites = np.linspace(0, 2, 5)
+    print("Integral de Fresnel S(x) para x =", limites, ":",
+          np.round(adaptive_simpson(f, 0, limites, tol=1e-12), 10))
+    
     # Exemplo 2: Cálculo de distância a partir de velocidades
     t = [0, 120, 240, 360, 480, 600, 720, 840, 960, 1080, 1200]  # tempos em segundos
     v = [20, 22, 23, 25, 30, 31, 32, 40, 45, 50, 65]  # velocidades em km/h
     
     distancia = calculate_distance_from_velocity(t, v)
     print(f"\nAproximação da distância percorrida: {distancia:.0f} metros")
+    
+    # O mesmo registro lido em blocos de 4 amostras, como faríamos com um
+    # arquivo de telemetria grande demais para a memória
+    for tempos, acumulada in stream_cumulative_distance(read_velocity_chunks((t, v), chunk_size=4)):
+        print(f"Distância acumulada até {tempos[-1]:.0f} s: {acumulada[-1]:.0f} metros")
 
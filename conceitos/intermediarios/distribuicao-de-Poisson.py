@@ -3,12 +3,16 @@ Implementação da Distribuição de Poisson para cálculos probabilísticos.
 
 Este módulo fornece funções para calcular probabilidades usando a distribuição
 de Poisson, incluindo probabilidades pontuais e acumuladas, com suporte para
-ajuste de períodos e validação de parâmetros.
+ajuste de períodos e validação de parâmetros. As versões em lote recebem
+arrays de k e λ e usam a função gama incompleta regularizada.
 """
 
 import math
+from collections import OrderedDict
 from typing import Tuple, Union
 import logging
+import numpy as np
+from scipy import special
 from dataclasses import dataclass
 from typing import List, Dict
 
@@ -36,8 +40,20 @@ class PoissonResult:
 class CalculadoraPoisson:
     """Classe principal para cálculos da distribuição de Poisson."""
     
-    def __init__(self, periodo_base: int = 30):
+    def __init__(self, periodo_base: int = 30, max_elementos_cache: int = 1_000_000):
+        """
+        Inicializa a calculadora.
+
+        Args:
+            periodo_base: Período, em dias, a que se refere o λ informado
+            max_elementos_cache: Total de valores guardados nas tabelas acumuladas
+                usadas pelos quantis (8 bytes cada); as tabelas menos usadas
+                recentemente são descartadas ao ultrapassar o limite
+        """
         self.periodo_base = periodo_base
+        self.max_elementos_cache = max_elementos_cache
+        self._tabelas_acumuladas = OrderedDict()  # λ -> P(X ≤ k) para k = 0, 1, ...
+        self._elementos_cache = 0
     
     def validar_parametros(self, params: PoissonParams) -> None:
         """Validação dos parâmetros de entrada."""
@@ -58,19 +74,177 @@ class CalculadoraPoisson:
 
     def calcular_probabilidade_pontual(self, k: int, lambda_val: float) -> float:
         """Calcula P(X = k) para a distribuição de Poisson."""
-        log_p = k * math.log(lambda_val) - lambda_val - math.log(math.factorial(k))
+        log_p = k * math.log(lambda_val) - lambda_val - math.lgamma(k + 1)
         return math.exp(log_p)
 
     def calcular_probabilidade_acumulada(self, k_max: int, lambda_val: float) -> float:
-        """Calcula P(X ≤ k) para a distribuição de Poisson."""
-        return sum(self.calcular_probabilidade_pontual(i, lambda_val) 
-                  for i in range(k_max + 1))
+        """
+        Calcula P(X ≤ k) para a distribuição de Poisson.
+
+        Soma os termos pela recorrência p(i) = p(i-1)·λ/i, em tempo linear e sem
+        fatoriais. Depois da moda (i > λ) os termos só diminuem, então a soma
+        para assim que um termo deixa de alterar o total. Quando e^(-λ) não é
+        representável em ponto flutuante (λ > 700), usa a função gama
+        incompleta regularizada Q(k+1, λ).
+        """
+        if k_max < 0:
+            return 0.0
+        if lambda_val > 700:
+            return float(special.gammaincc(k_max + 1, lambda_val))
+        termo = math.exp(-lambda_val)
+        total = termo
+        for i in range(1, k_max + 1):
+            termo *= lambda_val / i
+            if i > lambda_val and total + termo == total:
+                break
+            total += termo
+        return min(total, 1.0)
 
     def calcular_probabilidade_complementar(self, k_max: int, lambda_val: float) -> float:
         """Calcula P(X > k) para a distribuição de Poisson."""
         prob_acumulada = self.calcular_probabilidade_acumulada(k_max, lambda_val)
         return round(1 - prob_acumulada, 4)
     
+    @staticmethod
+    def _validar_lote(k: np.ndarray, lambdas: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Valida arrays de k e λ e os combina por broadcasting."""
+        k, lambdas = np.broadcast_arrays(np.asarray(k), np.asarray(lambdas, dtype=float))
+        if np.any(k < 0) or np.any(k != np.floor(k)):
+            raise ValueError("k deve conter inteiros não negativos")
+        if np.any(lambdas <= 0):
+            raise ValueError("lambda deve ser positivo")
+        return k.astype(float), lambdas
+
+    def probabilidades_pontuais(self, k: np.ndarray, lambdas: np.ndarray) -> np.ndarray:
+        """
+        Calcula P(X = k) em lote para arrays de k e λ.
+
+        Args:
+            k: Array de números de ocorrências
+            lambdas: Array de taxas λ, combinado com k por broadcasting
+
+        Returns:
+            Array de probabilidades
+        """
+        k, lambdas = self._validar_lote(k, lambdas)
+        return np.exp(special.xlogy(k, lambdas) - lambdas - special.gammaln(k + 1))
+
+    def probabilidades_acumuladas(self, k: np.ndarray, lambdas: np.ndarray) -> np.ndarray:
+        """
+        Calcula P(X ≤ k) em lote pela função gama incompleta regularizada Q(k+1, λ).
+
+        Args:
+            k: Array de números máximos de ocorrências
+            lambdas: Array de taxas λ, combinado com k por broadcasting
+
+        Returns:
+            Array de probabilidades acumuladas
+        """
+        k, lambdas = self._validar_lote(k, lambdas)
+        return special.pdtr(k, lambdas)
+
+    def probabilidades_complementares(self, k: np.ndarray, lambdas: np.ndarray) -> np.ndarray:
+        """
+        Calcula P(X > k) em lote pela função gama incompleta regularizada P(k+1, λ).
+
+        Ao contrário de calcular_probabilidade_complementar, não arredonda o
+        resultado nem perde precisão na cauda ao subtrair de 1.
+
+        Args:
+            k: Array de números máximos de ocorrências
+            lambdas: Array de taxas λ, combinado com k por broadcasting
+
+        Returns:
+            Array de probabilidades complementares
+        """
+        k, lambdas = self._validar_lote(k, lambdas)
+        return special.pdtrc(k, lambdas)
+    
+    def _tabela_acumulada(self, lambda_val: float, q: float) -> np.ndarray:
+        """
+        Retorna a tabela P(X ≤ k) memoizada para λ, estendida até atingir q.
+
+        A tabela vai de k = 0 até λ + 10√λ + 20, o que cobre qualquer q até
+        1 - 10⁻¹⁵; se q for maior, ela é recalculada com o dobro do tamanho.
+        O cache é LRU: cada consulta move λ para o fim, e as tabelas do início
+        são descartadas até o total de valores caber em max_elementos_cache.
+        """
+        tabela = self._tabelas_acumuladas.get(lambda_val)
+        if tabela is not None and tabela[-1] >= q:
+            self._tabelas_acumuladas.move_to_end(lambda_val)
+            return tabela
+        
+        tamanho = int(lambda_val + 10 * math.sqrt(lambda_val) + 20)
+        if tabela is not None:
+            self._elementos_cache -= tabela.size
+            tamanho = 2 * tabela.size
+        tabela = special.pdtr(np.arange(tamanho), lambda_val)
+        while tabela[-1] < q:  # A CDF chega a 1.0 em ponto flutuante
+            tamanho *= 2
+            tabela = special.pdtr(np.arange(tamanho), lambda_val)
+        
+        self._tabelas_acumuladas[lambda_val] = tabela
+        self._tabelas_acumuladas.move_to_end(lambda_val)
+        self._elementos_cache += tabela.size
+        while self._elementos_cache > self.max_elementos_cache and len(self._tabelas_acumuladas) > 1:
+            _, descartada = self._tabelas_acumuladas.popitem(last=False)
+            self._elementos_cache -= descartada.size
+        return tabela
+
+    def calcular_quantil(self, q: float, lambda_val: float) -> int:
+        """
+        Calcula o menor k com P(X ≤ k) ≥ q (função quantil ou CDF inversa).
+
+        Responde por busca binária na tabela acumulada memoizada de λ, de modo
+        que consultas repetidas para o mesmo λ não recalculam a distribuição.
+        Ex.: quantas unidades em estoque cobrem 99% da demanda.
+
+        Args:
+            q: Nível de probabilidade, em [0, 1)
+            lambda_val: Taxa λ
+
+        Returns:
+            Menor k com P(X ≤ k) ≥ q
+
+        Raises:
+            ValueError: Se q estiver fora de [0, 1) ou λ não for positivo
+        """
+        if not 0 <= q < 1:
+            raise ValueError("q deve estar em [0, 1)")
+        if lambda_val <= 0:
+            raise ValueError("lambda deve ser positivo")
+        return int(np.searchsorted(self._tabela_acumulada(lambda_val, q), q, side='left'))
+
+    def calcular_quantis(self, q: np.ndarray, lambdas: np.ndarray) -> np.ndarray:
+        """
+        Calcula quantis em lote para arrays de q e λ.
+
+        Os pedidos são agrupados por λ distinto, e cada grupo é respondido com
+        uma única busca binária vetorizada na tabela memoizada.
+
+        Args:
+            q: Array de níveis de probabilidade, em [0, 1)
+            lambdas: Array de taxas λ, combinado com q por broadcasting
+
+        Returns:
+            Array de inteiros com o menor k de cada par (q, λ)
+        """
+        q, lambdas = np.broadcast_arrays(np.asarray(q, dtype=float), np.asarray(lambdas, dtype=float))
+        if np.any((q < 0) | (q >= 1)):
+            raise ValueError("q deve estar em [0, 1)")
+        if np.any(lambdas <= 0):
+            raise ValueError("lambda deve ser positivo")
+        
+        quantis = np.empty(q.shape, dtype=np.int64)
+        unicos, grupos = np.unique(lambdas, return_inverse=True)
+        grupos = grupos.reshape(q.shape)
+        for indice, lambda_val in enumerate(unicos.tolist()):
+            pedidos = grupos == indice
+            niveis = q[pedidos]
+            tabela = self._tabela_acumulada(lambda_val, float(niveis.max()))
+            quantis[pedidos] = np.searchsorted(tabela, niveis, side='left')
+        return quantis
+    
     def converter_para_percentual(self, valor: float) -> str:
         """Converte uma probabilidade para formato percentual."""
         return f"{valor * 100:.2f}%"
@@ -103,6 +277,51 @@ class CalculadoraPoisson:
             detalhes=detalhes
         )
 
+    def calcular_lote(self, lista_params: List[PoissonParams]) -> List[PoissonResult]:
+        """
+        Executa o cálculo completo para muitos parâmetros de uma vez.
+
+        Os λ ajustados e as probabilidades são calculados com operações
+        vetorizadas, e o log registra um único resumo em vez de uma linha por item.
+
+        Args:
+            lista_params: Lista de parâmetros (ex.: um por equipamento)
+
+        Returns:
+            Lista de resultados, na mesma ordem e no mesmo formato de calcular
+        """
+        for params in lista_params:
+            self.validar_parametros(params)
+        if not lista_params:
+            return []
+        
+        lambdas = np.array([params.lambda_val for params in lista_params], dtype=float)
+        periodos = np.array([params.periodo_dias for params in lista_params], dtype=float)
+        k = np.array([params.k for params in lista_params])
+        lambdas_ajustados = lambdas * (periodos / self.periodo_base)
+        with np.errstate(divide='ignore'):
+            log_probs = special.xlogy(k, lambdas_ajustados) - lambdas_ajustados - special.gammaln(k + 1)
+        probs = np.exp(log_probs)
+        logging.info(f"Probabilidades calculadas em lote para {len(lista_params)} parâmetros")
+        
+        resultados = []
+        for params, lambda_ajustado, prob, log_prob in zip(
+                lista_params, lambdas_ajustados.tolist(), probs.tolist(), log_probs.tolist()):
+            detalhes = {
+                'lambda_original': params.lambda_val,
+                'lambda_ajustado': lambda_ajustado,
+                'k': params.k,
+                'periodo_dias': params.periodo_dias,
+                'log_probabilidade': log_prob if prob > 0 else float('-inf')
+            }
+            resultados.append(PoissonResult(
+                probabilidade=prob,
+                lambda_ajustado=lambda_ajustado,
+                percentual=f"{prob * 100:.2f}%",
+                detalhes=detalhes
+            ))
+        return resultados
+
 class ExemplosPoisson:
     """Exemplos práticos de uso da distribuição de Poisson."""
     
@@ -180,6 +399,19 @@ class ExemplosPoisson:
         print("Interpretação: Probabilidade de haver mais que " 
               f"{k_max} clientes em espera é {percentual}")
 
+    def exemplo_planejamento_estoque(self, lambda_val: float = 3, nivel: float = 0.99):
+        """
+        Demonstração: quantas unidades cobrem um nível de demanda.
+        Usa a função quantil para achar o menor estoque k com P(X ≤ k) ≥ nível.
+        """
+        print("\nExemplo: Planejamento de Estoque")
+        print(f"Demanda média (λ) = {lambda_val} unidades por período")
+        
+        estoque = self.calculadora.calcular_quantil(nivel, lambda_val)
+        cobertura = self.calculadora.calcular_probabilidade_acumulada(estoque, lambda_val)
+        print(f"Estoque para cobrir {nivel:.0%} da demanda: {estoque} unidades")
+        print(f"Cobertura obtida: P(X ≤ {estoque}) = {cobertura:.4f}")
+
 def main():
     """Função principal para demonstração dos cálculos."""
     exemplos = ExemplosPoisson()
@@ -189,6 +421,7 @@ def main():
     exemplos.exemplo_falhas((2, 4), 15)
     exemplos.exemplo_caso_detalhado()
     exemplos.exemplo_caixa_eletronico()  # Novo exemplo adicionado
+    exemplos.exemplo_planejamento_estoque()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
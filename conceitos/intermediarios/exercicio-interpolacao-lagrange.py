@@ -1,3 +1,6 @@
+import numpy as np
+from scipy.linalg import solve_banded
+
 def interpolar_lagrange(x_interp, x, y):
     """
     Retorna o valor interpolado usando a Interpolação de Lagrange.
@@ -24,12 +27,251 @@ def interpolar_lagrange(x_interp, x, y):
 
     return result
 
-# Dados conhecidos
-temperatura = [20, 25, 30, 35]
-calor_especifico = [0.99907, 0.99852, 0.99826, 0.99818]
+class InterpoladorLagrange:
+    """
+    Interpolação de Lagrange na forma baricêntrica.
+
+    Os pesos w_i = 1 / Π_{j≠i} (x_i - x_j) são calculados uma vez, em O(n²).
+    Cada ponto consultado custa O(n) pela fórmula
+
+        p(x) = Σ w_i y_i / (x - x_i)  /  Σ w_i / (x - x_i),
+
+    avaliada com NumPy para arrays inteiros de pontos. Acrescentar um nó
+    atualiza os pesos em O(n), sem recalcular tudo.
+    """
+
+    # Número máximo de elementos (pontos × nós) de cada matriz temporária
+    ELEMENTOS_POR_BLOCO = 10**6
+
+    def __init__(self, x, y):
+        """
+        Argumentos:
+        x (array-like): valores x conhecidos (distintos).
+        y (array-like): valores y conhecidos correspondentes a x.
+        """
+        self.x = np.array(x, dtype=float)
+        self.y = np.array(y, dtype=float)
+        if self.x.shape != self.y.shape or self.x.ndim != 1:
+            raise ValueError("x e y devem ter o mesmo comprimento.")
+        if len(np.unique(self.x)) != len(self.x):
+            raise ValueError("Os valores de x devem ser distintos.")
+
+        diferencas = self.x[:, np.newaxis] - self.x
+        np.fill_diagonal(diferencas, 1.0)
+        sinais, logs = self._log_pesos(diferencas)
+        self.pesos = sinais * np.exp(logs - np.max(logs))
+        # pesos = w · exp(_log_escala), com w os pesos sem normalização
+        self._log_escala = -np.max(logs)
+
+    @staticmethod
+    def _log_pesos(diferencas):
+        """
+        Calcula sinal e log|w| de 1 / Π diferencas em cada linha.
+
+        Os produtos de centenas de diferenças saem facilmente do intervalo do
+        float; em logaritmos eles não transbordam.
+        """
+        sinais = np.prod(np.sign(diferencas), axis=-1)
+        return sinais, -np.sum(np.log(np.abs(diferencas)), axis=-1)
+
+    def _normalizar(self):
+        """
+        Reescala os pesos pelo maior valor absoluto.
+
+        A fórmula baricêntrica não muda quando todos os pesos são multiplicados
+        pela mesma constante, e a escala evita overflow com muitos nós.
+        """
+        maior = np.max(np.abs(self.pesos))
+        self.pesos = self.pesos / maior
+        self._log_escala -= np.log(maior)
+
+    def adicionar_no(self, x_novo, y_novo):
+        """
+        Acrescenta o nó (x_novo, y_novo), atualizando os pesos em O(n).
+
+        Argumentos:
+        x_novo (float): novo valor x, diferente dos existentes.
+        y_novo (float): valor y correspondente.
+        """
+        diferencas = self.x - x_novo
+        if np.any(diferencas == 0):
+            raise ValueError("Os valores de x devem ser distintos.")
+        sinal, log_peso = self._log_pesos(-diferencas)
+        peso_novo = sinal * np.exp(log_peso + self._log_escala)
+        self.pesos = np.append(self.pesos / diferencas, peso_novo)
+        self._normalizar()
+        self.x = np.append(self.x, x_novo)
+        self.y = np.append(self.y, y_novo)
+
+    def __call__(self, x_interp):
+        """
+        Retorna os valores interpolados.
+
+        Argumentos:
+        x_interp (float ou array-like): ponto(s) em que o valor y é estimado.
+
+        Retorna:
+        float ou np.ndarray: valor(es) interpolado(s), com o formato de x_interp.
+        """
+        pontos = np.asarray(x_interp, dtype=float)
+        planos = pontos.ravel()
+        resultado = np.empty(planos.size)
+        tamanho_bloco = max(1, self.ELEMENTOS_POR_BLOCO // len(self.x))
+        for inicio in range(0, planos.size, tamanho_bloco):
+            bloco = planos[inicio:inicio + tamanho_bloco]
+            diferencas = bloco[:, np.newaxis] - self.x
+            coincide = diferencas == 0
+            # Pontos que coincidem com um nó recebem o valor do nó
+            diferencas[coincide] = 1.0
+            termos = self.pesos / diferencas
+            valores = (termos @ self.y) / termos.sum(axis=1)
+            linhas, colunas = np.nonzero(coincide)
+            valores[linhas] = self.y[colunas]
+            resultado[inicio:inicio + tamanho_bloco] = valores
+        resultado = resultado.reshape(pontos.shape)
+        return resultado if resultado.ndim else float(resultado)
+
+class InterpoladorPorPartes:
+    """
+    Interpolação local para tabelas com muitos nós.
+
+    Um polinômio global com milhares de nós oscila (fenômeno de Runge) e
+    custa O(n) por ponto. Aqui cada ponto usa apenas o trecho da tabela em
+    que cai, localizado por np.searchsorted em O(log n):
+
+    - metodo="spline": spline cúbica natural (segunda derivada nula nas pontas);
+    - metodo="lagrange": polinômio de Lagrange com os k nós mais próximos do
+      intervalo, na forma baricêntrica.
+
+    Os coeficientes de todos os intervalos (ou os pesos de todas as janelas)
+    são calculados uma vez no construtor. Fora da tabela, o polinômio do
+    intervalo da ponta é extrapolado.
+    """
+
+    def __init__(self, x, y, metodo="spline", k=4):
+        """
+        Argumentos:
+        x (array-like): valores x conhecidos (distintos, em qualquer ordem).
+        y (array-like): valores y conhecidos correspondentes a x.
+        metodo (str): "spline" ou "lagrange".
+        k (int): número de nós de cada polinômio local em metodo="lagrange".
+        """
+        x = np.asarray(x, dtype=float)
+        y = np.asarray(y, dtype=float)
+        if x.shape != y.shape or x.ndim != 1:
+            raise ValueError("x e y devem ter o mesmo comprimento.")
+        if len(x) < 2:
+            raise ValueError("São necessários pelo menos 2 nós.")
+        ordem = np.argsort(x)
+        self.x, self.y = x[ordem], y[ordem]
+        if np.any(np.diff(self.x) == 0):
+            raise ValueError("Os valores de x devem ser distintos.")
+        self.metodo = metodo
+
+        if metodo == "spline":
+            self.coeficientes = self._coeficientes_spline()
+        elif metodo == "lagrange":
+            self.k = min(k, len(self.x))
+            if self.k < 2:
+                raise ValueError("k deve ser pelo menos 2.")
+            self.pesos = self._pesos_janelas()
+        else:
+            raise ValueError("metodo deve ser 'spline' ou 'lagrange'.")
+
+    def _coeficientes_spline(self):
+        """
+        Resolve o sistema tridiagonal da spline natural e retorna, para cada
+        intervalo [x_i, x_i+1], os coeficientes (a, b, c, d) de
+        a + b·t + c·t² + d·t³, com t = x - x_i.
+        """
+        h = np.diff(self.x)
+        inclinacoes = np.diff(self.y) / h
+        n = len(self.x)
+        # Segundas derivadas M nos nós: M_0 = M_n-1 = 0 e, nos nós internos,
+        # h_i-1·M_i-1 + 2(h_i-1 + h_i)·M_i + h_i·M_i+1 = 6(s_i - s_i-1)
+        M = np.zeros(n)
+        if n > 2:
+            faixas = np.zeros((3, n - 2))
+            faixas[0, 1:] = h[1:-1]
+            faixas[1] = 2 * (h[:-1] + h[1:])
+            faixas[2, :-1] = h[1:-1]
+            M[1:-1] = solve_banded((1, 1), faixas, 6 * np.diff(inclinacoes))
+        return np.column_stack((self.y[:-1],
+                                inclinacoes - h * (2 * M[:-1] + M[1:]) / 6,
+                                M[:-1] / 2,
+                                np.diff(M) / (6 * h)))
+
+    def _pesos_janelas(self):
+        """
+        Calcula os pesos baricêntricos de cada janela de k nós consecutivos
+        (uma linha por posição inicial da janela).
+        """
+        janelas = self.x[np.arange(len(self.x) - self.k + 1)[:, np.newaxis] + np.arange(self.k)]
+        diferencas = janelas[:, :, np.newaxis] - janelas[:, np.newaxis, :]
+        diferencas[:, np.arange(self.k), np.arange(self.k)] = 1.0
+        pesos = 1.0 / np.prod(diferencas, axis=2)
+        return pesos / np.max(np.abs(pesos), axis=1, keepdims=True)
+
+    def __call__(self, x_interp):
+        """
+        Retorna os valores interpolados.
+
+        Argumentos:
+        x_interp (float ou array-like): ponto(s) em que o valor y é estimado.
+
+        Retorna:
+        float ou np.ndarray: valor(es) interpolado(s), com o formato de x_interp.
+        """
+        pontos = np.asarray(x_interp, dtype=float)
+        # Índice i do intervalo [x_i, x_i+1] que contém cada ponto
+        i = np.clip(np.searchsorted(self.x, pontos, side="right") - 1, 0, len(self.x) - 2)
+
+        if self.metodo == "spline":
+            a, b, c, d = np.moveaxis(self.coeficientes[i], -1, 0)
+            t = pontos - self.x[i]
+            resultado = a + t * (b + t * (c + t * d))
+        else:
+            # Janela de k nós centrada no intervalo, deslocada nas pontas da tabela
+            inicio = np.clip(i - (self.k - 1) // 2, 0, len(self.x) - self.k)
+            indices = inicio[..., np.newaxis] + np.arange(self.k)
+            diferencas = pontos[..., np.newaxis] - self.x[indices]
+            coincide = diferencas == 0
+            diferencas[coincide] = 1.0
+            termos = self.pesos[inicio] / diferencas
+            resultado = np.sum(termos * self.y[indices], axis=-1) / np.sum(termos, axis=-1)
+            # Pontos que coincidem com um nó recebem o valor do nó
+            resultado = np.where(coincide.any(axis=-1),
+                                 np.sum(np.where(coincide, self.y[indices], 0.0), axis=-1), resultado)
+
+        return resultado if resultado.ndim else float(resultado)
+
+if __name__ == "__main__":
+    # Dados conhecidos
+    temperatura = [20, 25, 30, 35]
+    calor_especifico = [0.99907, 0.99852, 0.99826, 0.99818]
+
+    # Estimando o calor específico em uma temperatura de 28 graus Celsius
+    temperatura_interp = 27.5
+    calor_especifico_interp = interpolar_lagrange(temperatura_interp, temperatura, calor_especifico)
+
+    print(f"O calor específico estimado para {temperatura_interp} graus Celsius é: {calor_especifico_interp}")
+
+    # O mesmo polinômio na forma baricêntrica, para muitas leituras de uma vez
+    interpolador = InterpoladorLagrange(temperatura, calor_especifico)
+    print(f"Forma baricêntrica em {temperatura_interp} graus Celsius: {interpolador(temperatura_interp)}")
+
+    leituras = np.random.default_rng(0).uniform(20, 35, 1_000_000)
+    estimativas = interpolador(leituras)
+    print(f"Calor específico médio em {leituras.size} leituras: {estimativas.mean():.6f}")
 
-# Estimando o calor específico em uma temperatura de 28 graus Celsius
-temperatura_interp = 27.5
-calor_especifico_interp = interpolar_lagrange(temperatura_interp, temperatura, calor_especifico)
+    # Um novo ponto da tabela atualiza os pesos sem recalcular os anteriores
+    interpolador.adicionar_no(40, 0.99828)
+    print(f"Com o nó de 40 graus: {interpolador(temperatura_interp)}")
 
-print(f"O calor específico estimado para {temperatura_interp} graus Celsius é: {calor_especifico_interp}")
+    # Tabela de calibração completa com milhares de nós: interpolação local
+    tabela_t = np.linspace(0, 100, 5001)
+    tabela_c = 1.0 + 0.0005 * np.cos(tabela_t / 15)
+    for metodo in ("spline", "lagrange"):
+        local = InterpoladorPorPartes(tabela_t, tabela_c, metodo=metodo)
+        erro = np.max(np.abs(local(leituras) - (1.0 + 0.0005 * np.cos(leituras / 15))))
+        print(f"Interpolação local ({metodo}) com {tabela_t.size} nós: erro máximo {erro:.2e}")
@@ -1,79 +1,265 @@
+"""
+Análise de uma função de demanda Q(p): primitiva, derivada, receita R(p) = p·Q(p)
+e o preço que maximiza a receita.
+
+O trabalho simbólico (sp.integrate, sp.diff, sp.solveset e sp.lambdify) é feito
+uma única vez por expressão. Os modelos ficam em cache na memória, indexados
+pela forma canônica da expressão, e podem ser gravados em um arquivo JSON
+para que execuções seguintes não repitam a integração e a resolução.
+"""
+
+import json
+import os
 import sympy as sp
-import scipy.integrate as spi
 import numpy as np
 import matplotlib.pyplot as plt
 
-# Definindo símbolos e funções simbólicas
-p = sp.symbols('p')
-Q = 100 - 20*p + 2*p**2
-
-# Análise simbólica usando sympy
-print("=== Análise Simbólica ===")
-
-# Calculando a primitiva de Q(p)
-primitiva = sp.integrate(Q, p)
-print("Primitiva de Q(p):", primitiva)
-
-# Calculando a derivada de Q(p)
-derivada = Q.diff(p)
-print("Derivada de Q(p):", derivada)
-
-# Definindo os limites a e b para a integral definida
-a = 5
-b = 15
-
-# Calculando a integral definida
-intervalo = (p, a, b)
-integral = sp.integrate(Q, intervalo)
-print(f"Integral de Q(p) no intervalo de ${a} a ${b}:", integral)
-
-# Calculando a receita total
-receita_total = integral.evalf()
-print(f"Receita total gerada pelas vendas no intervalo de ${a} a ${b}:", receita_total)
-
-# Análise da função de receita
-print("\n=== Análise da Função de Receita ===")
-# Definir a função de receita R(p)
-R = p * Q
-print("Função de receita R(p):", R)
-
-# Calcular a derivada da função de receita
-dR_dp = sp.diff(R, p)
-print("Derivada da receita dR/dp:", dR_dp)
-
-# Encontrar o preço que maximiza a receita
-p_max = sp.solve(dR_dp, p)
-print("Preço(s) que maximiza(m) a receita:", p_max)
-
-# Análise numérica e visualização
-print("\n=== Análise Numérica e Visualização ===")
-
-# Converter a expressão simbólica em função numérica para plotagem
-Q_lambda = sp.lambdify(p, Q, 'numpy')
-
-# Criar dados para plotagem
-p_vals = np.linspace(0, 20, 1000)
-Q_vals = Q_lambda(p_vals)
-
-# Plotar a função de demanda
-plt.figure(figsize=(12, 6))
-plt.subplot(1, 2, 1)
-plt.plot(p_vals, Q_vals)
-plt.title('Função de Demanda Q(p)')
-plt.xlabel('Preço (p)')
-plt.ylabel('Quantidade (Q)')
-plt.grid(True)
-
-# Plotar a função de receita
-R_lambda = sp.lambdify(p, R, 'numpy')
-R_vals = R_lambda(p_vals)
-
-plt.subplot(1, 2, 2)
-plt.plot(p_vals, R_vals)
-plt.title('Função de Receita R(p)')
-plt.xlabel('Preço (p)')
-plt.ylabel('Receita (R)')
-plt.grid(True)
-
-plt.tight_layout()
-plt.show()
+# Modelos já compilados, indexados por chave_canonica(Q, p)
+_MODELOS = {}
+
+def chave_canonica(Q, p):
+    """
+    Retorna a representação canônica de Q(p) usada como chave do cache.
+
+    Expressões iguais após a canonização automática do sympy (como
+    100 - 20*p + 2*p**2 e 2*p**2 - 20*p + 100) têm a mesma chave.
+
+    Args:
+        Q (sp.Expr): Expressão da demanda
+        p (sp.Symbol): Variável do preço
+
+    Returns:
+        str: Chave do cache
+    """
+    return f"{sp.srepr(p)}|{sp.srepr(Q)}"
+
+def _raizes_reais(expressao, p):
+    """
+    Retorna as raízes reais de expressao(p) = 0.
+
+    Polinômios usam sp.real_roots, que isola todas as raízes reais (inclusive
+    as que sp.solve devolve em radicais com is_real indefinido). Nos demais
+    casos usa sp.solveset no domínio real; se o conjunto de soluções não for
+    finito (por exemplo, periódico), nenhuma raiz é devolvida.
+
+    Args:
+        expressao (sp.Expr): Expressão em p
+        p (sp.Symbol): Variável
+
+    Returns:
+        list: Raízes reais exatas
+    """
+    if expressao.is_polynomial(p):
+        polinomio = sp.Poly(expressao, p)
+        return [] if polinomio.is_zero else list(sp.real_roots(polinomio))
+    solucoes = sp.solveset(expressao, p, domain=sp.S.Reals)
+    return list(solucoes) if isinstance(solucoes, sp.FiniteSet) else []
+
+class ModeloDemanda:
+    """
+    Resultados simbólicos e funções NumPy compiladas de uma demanda Q(p).
+
+    Atributos simbólicos: demanda, primitiva, derivada, receita,
+    derivada_receita, precos_criticos (raízes reais de dR/dp) e preco_otimo
+    (ponto crítico de máximo local com a maior receita, ou None).
+    As funções compiladas (Q, R, dR/dp e a primitiva) aceitam arrays do NumPy.
+    """
+
+    def __init__(self, Q, p, primitiva=None, precos_criticos=None):
+        """
+        Compila o modelo. primitiva e precos_criticos podem vir de um cache em
+        disco; quando ausentes, são calculados com sp.integrate e _raizes_reais.
+
+        Args:
+            Q (sp.Expr): Expressão da demanda
+            p (sp.Symbol): Variável do preço
+            primitiva (sp.Expr, optional): Primitiva de Q já calculada
+            precos_criticos (list, optional): Raízes reais de dR/dp já calculadas
+        """
+        self.p = p
+        self.demanda = Q
+        self.derivada = sp.diff(Q, p)
+        self.receita = sp.expand(p * Q)
+        self.derivada_receita = sp.diff(self.receita, p)
+        self.primitiva = sp.integrate(Q, p) if primitiva is None else primitiva
+        if precos_criticos is None:
+            precos_criticos = _raizes_reais(self.derivada_receita, p)
+        self.precos_criticos = sorted(precos_criticos, key=lambda raiz: float(sp.N(raiz)))
+
+        # Comparações numéricas: raízes em radicais ou CRootOf não se comparam simbolicamente
+        segunda_derivada = sp.diff(self.derivada_receita, p)
+        maximos = [raiz for raiz in self.precos_criticos if sp.N(segunda_derivada.subs(p, raiz)) < 0]
+        self.preco_otimo = max(maximos, key=lambda raiz: float(sp.N(self.receita.subs(p, raiz))),
+                               default=None)
+
+        self._demanda = sp.lambdify(p, Q, 'numpy')
+        self._receita = sp.lambdify(p, self.receita, 'numpy')
+        self._derivada_receita = sp.lambdify(p, self.derivada_receita, 'numpy')
+        self._primitiva = sp.lambdify(p, self.primitiva, 'numpy')
+
+    @staticmethod
+    def _avaliar(funcao, precos):
+        """Avalia uma função compilada, repetindo resultados constantes no formato de precos."""
+        precos = np.asarray(precos, dtype=float)
+        return np.broadcast_to(funcao(precos), precos.shape) * 1.0
+
+    def calcular_demanda(self, precos):
+        """
+        Args:
+            precos (float ou np.ndarray): Preço(s)
+
+        Returns:
+            np.ndarray: Q(p) em cada preço
+        """
+        return self._avaliar(self._demanda, precos)
+
+    def calcular_receita(self, precos):
+        """
+        Args:
+            precos (float ou np.ndarray): Preço(s)
+
+        Returns:
+            np.ndarray: R(p) = p·Q(p) em cada preço
+        """
+        return self._avaliar(self._receita, precos)
+
+    def calcular_receita_marginal(self, precos):
+        """
+        Args:
+            precos (float ou np.ndarray): Preço(s)
+
+        Returns:
+            np.ndarray: dR/dp em cada preço
+        """
+        return self._avaliar(self._derivada_receita, precos)
+
+    def integral_definida(self, a, b):
+        """
+        Calcula a integral de Q(p) de a até b pela primitiva compilada.
+
+        Args:
+            a (float ou np.ndarray): Limite(s) inferior(es)
+            b (float ou np.ndarray): Limite(s) superior(es)
+
+        Returns:
+            np.ndarray: F(b) - F(a), com a e b combinados por broadcasting
+        """
+        return self._avaliar(self._primitiva, b) - self._avaliar(self._primitiva, a)
+
+    def para_json(self):
+        """
+        Returns:
+            dict: Resultados simbólicos caros (primitiva e preços críticos) em srepr
+        """
+        return {
+            'primitiva': sp.srepr(self.primitiva),
+            'precos_criticos': [sp.srepr(raiz) for raiz in self.precos_criticos],
+        }
+
+def _ler_cache_em_disco(arquivo_cache):
+    """Lê o arquivo JSON do cache, ou um dicionário vazio se ele não existir."""
+    if arquivo_cache is None or not os.path.exists(arquivo_cache):
+        return {}
+    with open(arquivo_cache, encoding='utf-8') as arquivo:
+        return json.load(arquivo)
+
+def obter_modelo(Q, p=None, arquivo_cache=None):
+    """
+    Retorna o modelo compilado de Q(p), calculando-o só na primeira vez.
+
+    Args:
+        Q (sp.Expr ou str): Expressão da demanda, como 100 - 20*p + 2*p**2
+        p (sp.Symbol ou str, optional): Variável do preço; por padrão, o único
+            símbolo livre de Q
+        arquivo_cache (str, optional): Arquivo JSON onde a primitiva e os
+            preços críticos são guardados entre execuções
+
+    Returns:
+        ModeloDemanda: Modelo com as funções NumPy compiladas
+
+    Raises:
+        ValueError: Se p não for informado e Q não tiver exatamente um símbolo livre
+    """
+    Q = sp.sympify(Q)
+    if p is None:
+        if len(Q.free_symbols) != 1:
+            raise ValueError("Informe p: Q deve ter exatamente um símbolo livre")
+        (p,) = Q.free_symbols
+    elif isinstance(p, str):
+        p = sp.Symbol(p)
+
+    chave = chave_canonica(Q, p)
+    if chave in _MODELOS:
+        return _MODELOS[chave]
+
+    cache_em_disco = _ler_cache_em_disco(arquivo_cache)
+    if chave in cache_em_disco:
+        salvo = cache_em_disco[chave]
+        modelo = ModeloDemanda(Q, p, primitiva=sp.sympify(salvo['primitiva']),
+                               precos_criticos=[sp.sympify(raiz) for raiz in salvo['precos_criticos']])
+    else:
+        modelo = ModeloDemanda(Q, p)
+        if arquivo_cache is not None:
+            cache_em_disco[chave] = modelo.para_json()
+            with open(arquivo_cache, 'w', encoding='utf-8') as arquivo:
+                json.dump(cache_em_disco, arquivo, indent=2)
+
+    _MODELOS[chave] = modelo
+    return modelo
+
+def limpar_cache():
+    """Descarta os modelos compilados mantidos na memória."""
+    _MODELOS.clear()
+
+if __name__ == "__main__":
+    # Definindo símbolos e funções simbólicas
+    p = sp.symbols('p')
+    Q = 100 - 20*p + 2*p**2
+    modelo = obter_modelo(Q, p)
+
+    # Análise simbólica usando sympy
+    print("=== Análise Simbólica ===")
+    print("Primitiva de Q(p):", modelo.primitiva)
+    print("Derivada de Q(p):", modelo.derivada)
+
+    # Definindo os limites a e b para a integral definida
+    a = 5
+    b = 15
+
+    # Integral definida pela primitiva, sem nova integração simbólica
+    integral = modelo.primitiva.subs(p, b) - modelo.primitiva.subs(p, a)
+    print(f"Integral de Q(p) no intervalo de ${a} a ${b}:", integral)
+    print(f"Receita total gerada pelas vendas no intervalo de ${a} a ${b}:", integral.evalf())
+
+    # Análise da função de receita
+    print("\n=== Análise da Função de Receita ===")
+    print("Função de receita R(p):", modelo.receita)
+    print("Derivada da receita dR/dp:", modelo.derivada_receita)
+    print("Preço(s) que anula(m) dR/dp:", modelo.precos_criticos)
+    print("Preço que maximiza a receita:", modelo.preco_otimo)
+
+    # Análise numérica e visualização: só as funções NumPy compiladas são usadas
+    print("\n=== Análise Numérica e Visualização ===")
+    p_vals = np.linspace(0, 20, 1000)
+    Q_vals = modelo.calcular_demanda(p_vals)
+    R_vals = modelo.calcular_receita(p_vals)
+
+    # Plotar a função de demanda
+    plt.figure(figsize=(12, 6))
+    plt.subplot(1, 2, 1)
+    plt.plot(p_vals, Q_vals)
+    plt.title('Função de Demanda Q(p)')
+    plt.xlabel('Preço (p)')
+    plt.ylabel('Quantidade (Q)')
+    plt.grid(True)
+
+    # Plotar a função de receita
+    plt.subplot(1, 2, 2)
+    plt.plot(p_vals, R_vals)
+    plt.title('Função de Receita R(p)')
+    plt.xlabel('Preço (p)')
+    plt.ylabel('Receita (R)')
+    plt.grid(True)
+
+    plt.tight_layout()
+    plt.show()
@@ -0,0 +1,115 @@
+"""
+Testes unitários para o módulo da distribuição de Poisson.
+"""
+
+import importlib.util
+import os
+import time
+import unittest
+import numpy as np
+from scipy.stats import poisson
+
+# O nome do arquivo tem hífens, então o módulo é carregado pelo caminho
+_spec = importlib.util.spec_from_file_location(
+    "distribuicao_de_poisson", os.path.join(os.path.dirname(__file__), "distribuicao-de-Poisson.py"))
+distribuicao = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(distribuicao)
+
+class TestCalculadoraPoisson(unittest.TestCase):
+    def setUp(self):
+        """Cria uma calculadora com o período base padrão."""
+        self.calc = distribuicao.CalculadoraPoisson()
+
+    def test_acumulada_nos_dois_lados_da_troca(self):
+        """Testa a recorrência (λ ≤ 700) e a gama incompleta (λ > 700) contra o scipy."""
+        for lambda_val in (0.5, 3.0, 120.0, 699.0, 700.0, 701.0, 5000.0):
+            for k in np.unique(np.round(lambda_val + np.array([-3, -1, 0, 1, 3]) * np.sqrt(lambda_val))):
+                k = max(int(k), 0)
+                self.assertAlmostEqual(self.calc.calcular_probabilidade_acumulada(k, lambda_val) /
+                                       poisson.cdf(k, lambda_val), 1.0, places=10)
+        self.assertEqual(self.calc.calcular_probabilidade_acumulada(-1, 3.0), 0.0)
+
+    def test_acumulada_com_k_muito_acima_de_lambda(self):
+        """Testa se a recorrência para quando a soma satura, sem percorrer k termos."""
+        inicio = time.perf_counter()
+        total = self.calc.calcular_probabilidade_acumulada(10**7, 5.0)
+        self.assertLess(time.perf_counter() - inicio, 0.05)
+        self.assertAlmostEqual(total, 1.0, places=12)
+        # A parada antecipada não altera a soma da cauda antes da saturação
+        for k in (10, 20, 40):
+            self.assertAlmostEqual(self.calc.calcular_probabilidade_acumulada(k, 5.0) /
+                                   poisson.cdf(k, 5.0), 1.0, places=12)
+
+    def test_pontual_e_complementar(self):
+        """Testa P(X = k) e P(X > k) escalares."""
+        self.assertAlmostEqual(self.calc.calcular_probabilidade_pontual(2, 3.0), poisson.pmf(2, 3.0))
+        self.assertAlmostEqual(self.calc.calcular_probabilidade_pontual(800, 801.0) / poisson.pmf(800, 801.0),
+                               1.0, places=10)
+        self.assertEqual(self.calc.calcular_probabilidade_complementar(5, 3.0), round(poisson.sf(5, 3.0), 4))
+
+    def test_funcoes_em_lote(self):
+        """Testa as versões em lote com broadcasting de k e λ."""
+        k = np.arange(0, 40).reshape(-1, 1)
+        lambdas = np.array([0.1, 2.5, 30.0, 900.0])
+        np.testing.assert_allclose(self.calc.probabilidades_pontuais(k, lambdas), poisson.pmf(k, lambdas),
+                                   rtol=1e-10)
+        np.testing.assert_allclose(self.calc.probabilidades_acumuladas(k, lambdas), poisson.cdf(k, lambdas),
+                                   rtol=1e-10)
+        np.testing.assert_allclose(self.calc.probabilidades_complementares(k, lambdas), poisson.sf(k, lambdas),
+                                   rtol=1e-10)
+        with self.assertRaises(ValueError):
+            self.calc.probabilidades_acumuladas(np.array([1.5]), 2.0)
+        with self.assertRaises(ValueError):
+            self.calc.probabilidades_pontuais(1, np.array([2.0, 0.0]))
+
+    def test_calcular_lote_coincide_com_calcular(self):
+        """Testa o cálculo completo em lote contra o cálculo item a item."""
+        lista = [distribuicao.PoissonParams(lambda_val=l, k=k, periodo_dias=p)
+                 for l, k, p in ((6.0, 2, 30), (1.5, 0, 7), (40.0, 12, 15))]
+        for lote, item in zip(self.calc.calcular_lote(lista), map(self.calc.calcular, lista)):
+            self.assertAlmostEqual(lote.probabilidade, item.probabilidade)
+            self.assertAlmostEqual(lote.lambda_ajustado, item.lambda_ajustado)
+            self.assertEqual(lote.percentual, item.percentual)
+        self.assertEqual(self.calc.calcular_lote([]), [])
+        with self.assertRaises(ValueError):
+            self.calc.calcular_lote([distribuicao.PoissonParams(lambda_val=1.0, k=1, periodo_dias=31)])
+
+class TestQuantisPoisson(unittest.TestCase):
+    def setUp(self):
+        """Cria uma calculadora com cache pequeno para exercitar o descarte."""
+        self.calc = distribuicao.CalculadoraPoisson(max_elementos_cache=200)
+
+    def test_quantis_coincidem_com_ppf(self):
+        """Testa quantis escalares e em lote contra poisson.ppf."""
+        niveis = np.array([0.01, 0.5, 0.9, 0.99, 0.999999])
+        lambdas = np.array([[0.2], [3.0], [47.5], [900.0]])
+        np.testing.assert_array_equal(self.calc.calcular_quantis(niveis, lambdas), poisson.ppf(niveis, lambdas))
+        self.assertEqual(self.calc.calcular_quantil(0.99, 3.0), poisson.ppf(0.99, 3.0))
+        # Menor k com P(X ≤ k) ≥ 0 (o scipy devolve -1 por convenção)
+        self.assertEqual(self.calc.calcular_quantil(0.0, 3.0), 0)
+        self.assertEqual(self.calc.calcular_quantil(1 - 1e-15, 3.0), poisson.ppf(1 - 1e-15, 3.0))
+        with self.assertRaises(ValueError):
+            self.calc.calcular_quantil(1.0, 3.0)
+        with self.assertRaises(ValueError):
+            self.calc.calcular_quantis(0.5, np.array([1.0, -1.0]))
+
+    def test_tabela_reutilizada(self):
+        """Testa que consultas repetidas devolvem a mesma tabela memoizada."""
+        tabela = self.calc._tabela_acumulada(3.0, 0.9)
+        self.assertIs(self.calc._tabela_acumulada(3.0, 0.99), tabela)
+        self.calc.calcular_quantis(np.array([0.1, 0.5, 0.95]), 3.0)
+        self.assertIs(self.calc._tabelas_acumuladas[3.0], tabela)
+
+    def test_descarte_lru(self):
+        """Testa o descarte da tabela usada há mais tempo quando o limite é ultrapassado."""
+        for lambda_val in (1.0, 2.0, 3.0):
+            self.calc.calcular_quantil(0.5, lambda_val)
+        self.calc.calcular_quantil(0.5, 1.0)  # 1.0 passa a ser o mais recente
+        self.calc.calcular_quantil(0.5, 60.0)  # Tabela grande: força descartes
+        self.assertEqual(list(self.calc._tabelas_acumuladas), [1.0, 60.0])
+        self.assertLessEqual(self.calc._elementos_cache, self.calc.max_elementos_cache)
+        self.assertEqual(self.calc._elementos_cache,
+                         sum(tabela.size for tabela in self.calc._tabelas_acumuladas.values()))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,88 @@
+"""
+Testes unitários para o módulo de análise da função de demanda.
+"""
+
+import os
+import tempfile
+import unittest
+from unittest import mock
+import numpy as np
+import sympy as sp
+from conceitos.intermediarios import integral
+from conceitos.intermediarios.integral import obter_modelo, chave_canonica, limpar_cache
+
+class TestModeloDemanda(unittest.TestCase):
+    def setUp(self):
+        """Define a demanda do exemplo e uma demanda linear com máximo de receita."""
+        limpar_cache()
+        self.p = sp.symbols('p')
+        self.Q = 100 - 20*self.p + 2*self.p**2
+
+    def test_resultados_simbolicos(self):
+        """Testa a primitiva, a derivada e a integral definida do exemplo."""
+        modelo = obter_modelo(self.Q, self.p)
+        self.assertEqual(sp.simplify(modelo.primitiva.diff(self.p) - self.Q), 0)
+        self.assertEqual(modelo.derivada, 4*self.p - 20)
+        self.assertAlmostEqual(float(modelo.integral_definida(5, 15)),
+                               float(sp.integrate(self.Q, (self.p, 5, 15))))
+        self.assertEqual(modelo.precos_criticos, [])
+        self.assertIsNone(modelo.preco_otimo)
+
+    def test_preco_otimo(self):
+        """Testa o preço que maximiza a receita de Q(p) = 100 - 4p."""
+        modelo = obter_modelo("100 - 4*p")
+        self.assertEqual(modelo.preco_otimo, sp.Rational(25, 2))
+        self.assertEqual(float(modelo.calcular_receita(12.5)), 625.0)
+
+    def test_demanda_quartica(self):
+        """Testa raízes reais de dR/dp que o sympy só expressa em radicais ou CRootOf."""
+        modelo = obter_modelo(1000 - 30*self.p + self.p**3/10 - self.p**4/1000, self.p)
+        np.testing.assert_allclose([float(sp.N(raiz)) for raiz in modelo.precos_criticos],
+                                   [-15.9814985520147, 78.4649206436606])
+        self.assertAlmostEqual(float(sp.N(modelo.preco_otimo)), 78.4649206436606)
+        self.assertAlmostEqual(float(modelo.calcular_receita_marginal(float(sp.N(modelo.preco_otimo)))), 0.0,
+                               places=8)
+
+    def test_derivada_nao_polinomial(self):
+        """Testa a receita de uma demanda exponencial, com máximo em p = 1/b."""
+        modelo = obter_modelo(100 * sp.exp(-self.p / 20), self.p)
+        self.assertEqual(modelo.preco_otimo, 20)
+
+    def test_cache_pela_forma_canonica(self):
+        """Testa que expressões equivalentes reutilizam o mesmo modelo compilado."""
+        modelo = obter_modelo(self.Q, self.p)
+        self.assertIs(obter_modelo("2*p**2 - 20*p + 100"), modelo)
+        self.assertEqual(chave_canonica(self.Q, self.p), chave_canonica(sp.sympify("2*p**2 + 100 - 20*p"), self.p))
+        with mock.patch.object(integral.sp, 'integrate') as integrar:
+            obter_modelo(self.Q, self.p)
+            integrar.assert_not_called()
+
+    def test_avaliacao_vetorizada(self):
+        """Testa a receita em grades de preços com as funções compiladas."""
+        modelo = obter_modelo(self.Q, self.p)
+        precos = np.linspace(0, 20, 101).reshape(1, -1) + np.arange(3).reshape(-1, 1)
+        np.testing.assert_allclose(modelo.calcular_receita(precos), precos * (100 - 20*precos + 2*precos**2))
+        self.assertEqual(modelo.calcular_demanda(precos).shape, (3, 101))
+        self.assertEqual(obter_modelo("7 + 0*p", "p").calcular_demanda(precos).shape, (3, 101))
+
+    def test_cache_em_disco(self):
+        """Testa que uma nova execução lê a primitiva do arquivo, sem integrar de novo."""
+        with tempfile.TemporaryDirectory() as diretorio:
+            arquivo = os.path.join(diretorio, "modelos.json")
+            modelo = obter_modelo("100 - 4*p", arquivo_cache=arquivo)
+            limpar_cache()
+            with mock.patch.object(integral.sp, 'integrate') as integrar, \
+                 mock.patch.object(integral.sp, 'real_roots') as resolver:
+                recarregado = obter_modelo("100 - 4*p", arquivo_cache=arquivo)
+                integrar.assert_not_called()
+                resolver.assert_not_called()
+            self.assertEqual(recarregado.primitiva, modelo.primitiva)
+            self.assertEqual(recarregado.preco_otimo, modelo.preco_otimo)
+
+    def test_simbolo_ambiguo(self):
+        """Testa a exigência de p quando há mais de um símbolo."""
+        with self.assertRaises(ValueError):
+            obter_modelo("a - b*p")
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,98 @@
+"""
+Testes unitários para o módulo de interpolação de Lagrange.
+"""
+
+import importlib.util
+import os
+import unittest
+import numpy as np
+from scipy.interpolate import CubicSpline
+
+# O nome do arquivo tem hífens, então o módulo é carregado pelo caminho
+_spec = importlib.util.spec_from_file_location(
+    "exercicio_interpolacao_lagrange",
+    os.path.join(os.path.dirname(__file__), "exercicio-interpolacao-lagrange.py"))
+lagrange = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(lagrange)
+
+class TestInterpoladorLagrange(unittest.TestCase):
+    def setUp(self):
+        """Define a tabela de calor específico do exemplo, com um nó extra."""
+        self.x = [20, 25, 30, 35, 40]
+        self.y = [0.99907, 0.99852, 0.99826, 0.99818, 0.99828]
+
+    def test_coincide_com_interpolar_lagrange(self):
+        """Testa a forma baricêntrica contra a fórmula de Lagrange direta."""
+        interpolador = lagrange.InterpoladorLagrange(self.x, self.y)
+        pontos = np.array([21.3, 27.5, 33.3, 39.9, 45.0])
+        esperado = [lagrange.interpolar_lagrange(p, self.x, self.y) for p in pontos]
+        np.testing.assert_allclose(interpolador(pontos), esperado, rtol=1e-13)
+        self.assertEqual(interpolador(30), 0.99826)
+
+    def test_adicionar_no_coincide_com_reconstrucao(self):
+        """Testa os pesos incrementais contra os pesos calculados do zero."""
+        n = 300
+        x = np.random.default_rng(1).permutation(np.cos(np.pi * (np.arange(n) + 0.5) / n))
+        incremental = lagrange.InterpoladorLagrange(x[:2], np.exp(x[:2]))
+        for xi in x[2:]:
+            incremental.adicionar_no(xi, np.exp(xi))
+        completo = lagrange.InterpoladorLagrange(x, np.exp(x))
+        np.testing.assert_allclose(incremental.pesos, completo.pesos, rtol=1e-10)
+        pontos = np.linspace(-1, 1, 11)
+        np.testing.assert_allclose(incremental(pontos), np.exp(pontos), atol=1e-13)
+        with self.assertRaises(ValueError):
+            incremental.adicionar_no(x[5], 0.0)
+
+    def test_blocos_limitados_pelo_numero_de_nos(self):
+        """Testa a avaliação em vários blocos, com formato preservado."""
+        interpolador = lagrange.InterpoladorLagrange(self.x, self.y)
+        interpolador.ELEMENTOS_POR_BLOCO = 12  # Blocos de 2 pontos
+        pontos = np.linspace(20, 40, 21).reshape(3, 7)
+        resultado = interpolador(pontos)
+        self.assertEqual(resultado.shape, (3, 7))
+        np.testing.assert_allclose(resultado.ravel(),
+                                   [lagrange.interpolar_lagrange(p, self.x, self.y) for p in pontos.ravel()],
+                                   rtol=1e-13)
+
+class TestInterpoladorPorPartes(unittest.TestCase):
+    def setUp(self):
+        """Define uma tabela com nós irregulares, fora de ordem."""
+        rng = np.random.default_rng(2)
+        self.x = np.sort(rng.uniform(0, 10, 60))
+        self.y = np.sin(self.x)
+        self.ordem = rng.permutation(60)
+        self.pontos = rng.uniform(-1, 11, (4, 500))
+
+    def test_spline_natural_coincide_com_scipy(self):
+        """Testa a spline contra CubicSpline(bc_type='natural'), inclusive na extrapolação."""
+        spline = lagrange.InterpoladorPorPartes(self.x[self.ordem], self.y[self.ordem])
+        referencia = CubicSpline(self.x, self.y, bc_type='natural')
+        np.testing.assert_allclose(spline(self.pontos), referencia(self.pontos), rtol=1e-12, atol=1e-12)
+        np.testing.assert_allclose(spline(self.x), self.y, atol=1e-14)
+        self.assertAlmostEqual(lagrange.InterpoladorPorPartes([0, 1], [0, 2])(0.25), 0.5)
+
+    def test_lagrange_local_coincide_com_janela(self):
+        """Testa cada ponto contra interpolar_lagrange nos k nós da sua janela."""
+        for k in (2, 3, 4, 5):
+            local = lagrange.InterpoladorPorPartes(self.x, self.y, metodo="lagrange", k=k)
+            pontos = self.pontos.ravel()[:100]
+            esperado = []
+            for p in pontos:
+                i = np.clip(np.searchsorted(self.x, p, side="right") - 1, 0, len(self.x) - 2)
+                inicio = np.clip(i - (k - 1) // 2, 0, len(self.x) - k)
+                janela = slice(inicio, inicio + k)
+                esperado.append(lagrange.interpolar_lagrange(p, self.x[janela], self.y[janela]))
+            np.testing.assert_allclose(local(pontos), esperado, rtol=1e-10, atol=1e-12)
+            np.testing.assert_array_equal(local(self.x), self.y)
+
+    def test_validacao(self):
+        """Testa nós repetidos, método inválido e tabelas muito pequenas."""
+        with self.assertRaises(ValueError):
+            lagrange.InterpoladorPorPartes([1, 2, 2], [0, 1, 2])
+        with self.assertRaises(ValueError):
+            lagrange.InterpoladorPorPartes(self.x, self.y, metodo="linear")
+        with self.assertRaises(ValueError):
+            lagrange.InterpoladorPorPartes([1], [0])
+
+if __name__ == '__main__':
+    unittest.main()
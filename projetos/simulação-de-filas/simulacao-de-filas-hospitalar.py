@@ -30,10 +30,15 @@ CÁLCULOS IMPLEMENTADOS:
 
 2. Modelo M/M/2 (Dois médicos):
    - Utilização (ρ) = λ/(2μ)
-   - Probabilidade sistema vazio (P0) = [1 + ρ + ρ²/2]^(-1)
-   - Comprimento médio da fila (Lq) = (ρ² * P0)/(2(1-ρ))
+   - Probabilidade sistema vazio (P0) = (1-ρ)/(1+ρ)
+   - Comprimento médio da fila (Lq) = 2ρ³/(1-ρ²)
    - Tempo médio de espera (Wq) = Lq/λ
 
+3. Modelo M/M/c (c médicos):
+   - Probabilidade de espera pela fórmula de Erlang C, calculada pela
+     recorrência de Erlang B para evitar overflow de fatoriais
+   - Comprimento médio da fila (Lq) = C·ρ/(1-ρ)
+
 FLUXO DE EXECUÇÃO:
 1. Carrega configurações (arquivo JSON ou argumentos CLI)
 2. Valida parâmetros de entrada
@@ -2,11 +2,20 @@
 import numpy as np
 import matplotlib.pyplot as plt
 import pandas as pd
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+from scipy import stats
 from abc import ABC, abstractmethod
-from typing import Dict, Any
+from typing import Dict, Any, Callable, Iterator, List, Optional, Union
 import argparse
+import heapq
 import json
-from dataclasses import dataclass
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field, replace
+from functools import partial
+from itertools import chain, count, product, repeat
 from pathlib import Path
 
 # Parâmetros configuráveis da simulação
@@ -25,6 +34,17 @@ SIMULATION_PARAMS = {
     'TARGET_WAIT_TIME': 0.5,         # Tempo de espera alvo em horas
 }
 
+ArrivalProfile = Union[None, List[float], Callable[[np.ndarray], np.ndarray]]
+
+def _per_minute_profile(per_minute: Callable[[np.ndarray], np.ndarray], t: np.ndarray) -> np.ndarray:
+    """
+    Avalia em horas um perfil λ(t) definido em minutos.
+    
+    Fica no nível do módulo para que o perfil convertido, montado com
+    functools.partial, continue serializável pelo pool de processos.
+    """
+    return 60 * np.asarray(per_minute(np.asarray(t) * 60))
+
 @dataclass
 class SimulationConfig:
     """Configuração para simulação de filas."""
@@ -33,6 +53,13 @@ class SimulationConfig:
     simulation_time: float = 8.0  # Tempo de simulação em horas
     time_unit: str = "hours"  # Unidade de tempo (hours, minutes)
     confidence_level: float = 0.95  # Nível de confiança para intervalos
+    # Taxa de chegada variável λ(t) usada pelas simulações. Uma lista define
+    # taxas constantes por faixa de profile_interval, repetidas ciclicamente
+    # (ex.: 24 valores por hora = curva diária); uma função recebe um array
+    # de instantes e devolve as taxas. As fórmulas usam arrival_rate.
+    arrival_profile: ArrivalProfile = None
+    profile_interval: float = 1.0  # Duração de cada faixa do perfil
+    max_arrival_rate: Optional[float] = None  # Limite superior de λ(t); obrigatório para funções
     
     @classmethod
     def from_json(cls, json_path: str) -> 'SimulationConfig':
@@ -43,6 +70,8 @@ class SimulationConfig:
     
     def to_json(self, json_path: str) -> None:
         """Salva configuração em um arquivo JSON."""
+        if callable(self.arrival_profile):
+            raise ValueError("Perfil de chegada definido por função não pode ser salvo em JSON")
         with open(json_path, 'w') as f:
             json.dump(self.__dict__, f, indent=4)
     
@@ -52,7 +81,54 @@ class SimulationConfig:
             self.arrival_rate = self.arrival_rate * 60
             self.service_rate = self.service_rate * 60
             self.simulation_time = self.simulation_time / 60
+            if callable(self.arrival_profile):
+                self.arrival_profile = partial(_per_minute_profile, self.arrival_profile)
+            elif self.arrival_profile is not None:
+                self.arrival_profile = [rate * 60 for rate in self.arrival_profile]
+            self.profile_interval = self.profile_interval / 60
+            if self.max_arrival_rate is not None:
+                self.max_arrival_rate = self.max_arrival_rate * 60
             self.time_unit = "hours"
+    
+    def arrival_rate_bound(self) -> float:
+        """
+        Retorna o limite superior de λ(t) usado pelo método de thinning.
+        
+        Raises:
+            ValueError: Se o perfil for inválido ou o limite não for informado
+        """
+        if self.arrival_profile is None:
+            return self.arrival_rate
+        if callable(self.arrival_profile):
+            if self.max_arrival_rate is None or self.max_arrival_rate <= 0:
+                raise ValueError("Perfil de chegada por função requer max_arrival_rate positivo")
+            return self.max_arrival_rate
+        
+        rates = np.asarray(self.arrival_profile, dtype=float)
+        if rates.size == 0 or np.any(rates < 0) or not np.any(rates > 0):
+            raise ValueError("Perfil de chegada deve ter taxas não negativas e ao menos uma positiva")
+        if self.profile_interval <= 0:
+            raise ValueError("Duração das faixas do perfil deve ser positiva")
+        return float(rates.max())
+    
+    def arrival_rate_at(self, t: np.ndarray) -> np.ndarray:
+        """
+        Avalia a taxa de chegada λ(t) em um array de instantes (em horas).
+        
+        Args:
+            t: Instantes de avaliação
+            
+        Returns:
+            Array com a taxa de chegada em cada instante
+        """
+        t = np.asarray(t, dtype=float)
+        if self.arrival_profile is None:
+            return np.full_like(t, self.arrival_rate)
+        if callable(self.arrival_profile):
+            return np.broadcast_to(np.asarray(self.arrival_profile(t), dtype=float), t.shape)
+        rates = np.asarray(self.arrival_profile, dtype=float)
+        slots = (t // self.profile_interval).astype(np.int64) % len(rates)
+        return rates[slots]
 
 class QueueingModel(ABC):
     """Classe base para modelos de teoria das filas."""
@@ -124,37 +200,1019 @@ class MM1Model(QueueingModel):
         """Calcula tempo médio na fila."""
         return self.average_queue_length / self.config.arrival_rate
 
-class MM2Model(QueueingModel):
-    """Implementação do modelo M/M/2."""
+def erlang_c(offered_load: float, num_servers: int) -> float:
+    """
+    Calcula a probabilidade de espera de Erlang C, P(Wq > 0).
+    
+    Usa a recorrência de Erlang B, B(k) = a·B(k-1) / (k + a·B(k-1)), que só
+    envolve números entre 0 e 1 e não sofre overflow de fatoriais para c na
+    casa das centenas ou milhares.
+    
+    Args:
+        offered_load: Carga oferecida a = λ/μ
+        num_servers: Número de médicos (c)
+        
+    Returns:
+        Probabilidade de um paciente precisar esperar
+    """
+    erlang_b = 1.0
+    for k in range(1, num_servers + 1):
+        erlang_b = offered_load * erlang_b / (k + offered_load * erlang_b)
+    rho = offered_load / num_servers
+    return erlang_b / (1 - rho * (1 - erlang_b))
+
+class MMcModel(QueueingModel):
+    """Implementação do modelo M/M/c com c médicos."""
+    
+    def __init__(self, config: SimulationConfig, num_servers: int):
+        """
+        Inicializa o modelo com configurações.
+        
+        Args:
+            config: Configuração da simulação
+            num_servers: Número de médicos (c)
+        """
+        self.num_servers = num_servers
+        super().__init__(config)
     
     def _validate_parameters(self):
-        """Valida parâmetros específicos do M/M/2."""
+        """Valida parâmetros específicos do M/M/c."""
         super()._validate_parameters()
-        if self.config.arrival_rate >= 2 * self.config.service_rate:
+        if not isinstance(self.num_servers, int) or self.num_servers < 1:
+            raise ValueError("Número de médicos deve ser um inteiro positivo")
+        if self.config.arrival_rate >= self.num_servers * self.config.service_rate:
             raise ValueError("Sistema instável: taxa de chegada deve ser menor que taxa total de serviço")
     
     @property
     def utilization(self) -> float:
-        """Calcula utilização do sistema (ρ = λ/2μ)."""
-        return self.config.arrival_rate / (2 * self.config.service_rate)
+        """Calcula utilização do sistema (ρ = λ/cμ)."""
+        return self.config.arrival_rate / (self.num_servers * self.config.service_rate)
     
-    def _p0(self) -> float:
-        """Calcula P0 (probabilidade de sistema vazio)."""
-        rho = self.config.arrival_rate / self.config.service_rate
-        return 1 / (1 + rho + (rho * rho) / 2)
+    @property
+    def probability_of_wait(self) -> float:
+        """Calcula a probabilidade de espera (Erlang C)."""
+        offered_load = self.config.arrival_rate / self.config.service_rate
+        return erlang_c(offered_load, self.num_servers)
     
     @property
     def average_queue_length(self) -> float:
-        """Calcula número médio de clientes na fila."""
-        rho = self.config.arrival_rate / self.config.service_rate
-        p0 = self._p0()
-        return (rho * rho * p0) / (2 * (1 - rho/2))
+        """Calcula número médio de clientes na fila (Lq = C·ρ/(1-ρ))."""
+        rho = self.utilization
+        return self.probability_of_wait * rho / (1 - rho)
     
     @property
     def average_queue_time(self) -> float:
         """Calcula tempo médio na fila."""
         return self.average_queue_length / self.config.arrival_rate
 
+class MM2Model(MMcModel):
+    """Implementação do modelo M/M/2."""
+    
+    def __init__(self, config: SimulationConfig):
+        """
+        Inicializa o modelo com configurações.
+        
+        Args:
+            config: Configuração da simulação
+        """
+        super().__init__(config, num_servers=2)
+
+def find_minimum_servers(config: SimulationConfig,
+                         target_wait_time: Optional[float] = None) -> int:
+    """
+    Encontra o menor número de médicos cujo Wq não passa do tempo alvo.
+    
+    Como Wq decresce com c, basta percorrer c a partir do menor valor estável
+    atualizando Erlang B pela recorrência, com custo O(c) no total em vez de
+    recalcular o modelo inteiro para cada candidato.
+    
+    Args:
+        config: Configuração da simulação
+        target_wait_time: Tempo de espera alvo em horas
+            (padrão: SIMULATION_PARAMS['TARGET_WAIT_TIME'])
+            
+    Returns:
+        Menor número de médicos que atende ao alvo
+    """
+    config.convert_to_hourly_rates()
+    if config.arrival_rate <= 0 or config.service_rate <= 0:
+        raise ValueError("Taxas de chegada e serviço devem ser positivas")
+    if target_wait_time is None:
+        target_wait_time = SIMULATION_PARAMS['TARGET_WAIT_TIME']
+    if target_wait_time < 0:
+        raise ValueError("Tempo de espera alvo não pode ser negativo")
+    
+    arrival_rate, service_rate = config.arrival_rate, config.service_rate
+    offered_load = arrival_rate / service_rate
+    erlang_b = 1.0
+    num_servers = 0
+    while True:
+        num_servers += 1
+        erlang_b = offered_load * erlang_b / (num_servers + offered_load * erlang_b)
+        if num_servers <= offered_load:
+            continue  # Sistema instável com este número de médicos
+        rho = offered_load / num_servers
+        wait_probability = erlang_b / (1 - rho * (1 - erlang_b))
+        if wait_probability / (num_servers * service_rate - arrival_rate) <= target_wait_time:
+            return num_servers
+
+SeedLike = Union[None, int, np.random.SeedSequence]
+
+def spawn_seeds(seed: SeedLike, count: int):
+    """
+    Deriva count sementes filhas independentes de uma semente raiz.
+    
+    Ao contrário de SeedSequence.spawn, não altera o estado da semente recebida:
+    a mesma raiz gera sempre as mesmas filhas, no processo atual ou em outro.
+    """
+    root = seed if isinstance(seed, np.random.SeedSequence) else np.random.SeedSequence(seed)
+    return [np.random.SeedSequence(root.entropy, spawn_key=root.spawn_key + (i,),
+                                   pool_size=root.pool_size)
+            for i in range(count)]
+
+ARRIVAL_BLOCK_SIZE = 65536  # Candidatos a chegada sorteados por bloco
+
+def arrival_time_stream(config: SimulationConfig, rng: np.random.Generator,
+                        block_size: int = ARRIVAL_BLOCK_SIZE,
+                        acceptance_rng: Optional[np.random.Generator] = None) -> Iterator[np.ndarray]:
+    """
+    Gera os instantes de chegada, em horas, como uma sequência infinita de blocos.
+    
+    Usa o método de thinning de Lewis-Shedler vetorizado: cada bloco sorteia um
+    processo de Poisson homogêneo com a taxa máxima λmax e aceita cada candidato t
+    com probabilidade λ(t)/λmax, com uma única avaliação de λ(t) por bloco. Sem
+    perfil de chegada não há descarte e os blocos são os da taxa constante.
+    
+    Args:
+        config: Configuração com arrival_rate ou arrival_profile (em horas)
+        rng: Gerador de números aleatórios das chegadas
+        block_size: Número de candidatos sorteados por bloco
+        acceptance_rng: Gerador dos testes de aceitação (padrão: rng). Com um
+            gerador separado, as chegadas não dependem de block_size
+        
+    Yields:
+        Arrays crescentes com os instantes de chegada (podem ser vazios)
+    """
+    acceptance_rng = acceptance_rng or rng
+    rate_bound = config.arrival_rate_bound()
+    homogeneous = config.arrival_profile is None
+    scale = 1.0 / rate_bound
+    clock = 0.0
+    while True:
+        candidates = rng.exponential(scale, block_size)
+        candidates[0] += clock
+        np.cumsum(candidates, out=candidates)
+        clock = candidates[-1]
+        if homogeneous:
+            yield candidates
+        else:
+            accept = acceptance_rng.random(block_size) * rate_bound < config.arrival_rate_at(candidates)
+            yield candidates[accept]
+
+# Tipos de evento do calendário. Partidas vêm antes de chegadas em caso de
+# empate, liberando o médico para o paciente que chega no mesmo instante.
+_DEPARTURE = 0
+_ARRIVAL = 1
+
+@dataclass
+class SimulationRun:
+    """Resultado de uma replicação da simulação de eventos discretos."""
+    num_servers: int
+    patients_served: int
+    utilization: float
+    average_queue_length: float
+    average_queue_time: float
+    wait_times: np.ndarray = field(default=None, repr=False)
+    
+    def get_metrics(self) -> Dict[str, float]:
+        """Retorna as métricas empíricas no mesmo formato de QueueingModel."""
+        return {
+            "utilization": self.utilization,
+            "average_queue_length": self.average_queue_length,
+            "average_queue_time": self.average_queue_time,
+        }
+
+def summarize_replications(runs: pd.DataFrame, confidence_level: float) -> pd.DataFrame:
+    """
+    Resume replicações independentes com intervalos de confiança t-Student.
+    
+    Args:
+        runs: DataFrame com uma linha por replicação e uma coluna por métrica
+        confidence_level: Nível de confiança dos intervalos
+        
+    Returns:
+        DataFrame indexado pela métrica com média, meia-largura e limites do IC
+    """
+    n = len(runs)
+    if n < 2:
+        raise ValueError("São necessárias pelo menos 2 replicações para o intervalo de confiança")
+    
+    mean = runs.mean()
+    t_crit = stats.t.ppf((1 + confidence_level) / 2, n - 1)
+    half_width = t_crit * runs.std(ddof=1) / np.sqrt(n)
+    return pd.DataFrame({
+        "mean": mean,
+        "half_width": half_width,
+        "ci_lower": mean - half_width,
+        "ci_upper": mean + half_width,
+    })
+
+def mser_truncation(observations: np.ndarray, batch_size: int = 5,
+                    max_fraction: float = 0.5) -> int:
+    """
+    Estima o período de aquecimento pela regra MSER-5.
+    
+    Agrupa as observações em médias de batch_size valores e escolhe o corte d
+    que minimiza o erro padrão da média das observações restantes,
+    MSER(d) = Σ(Z(j) - média)² / (k - d)², avaliado para todos os d de uma vez
+    com somas acumuladas invertidas. Só a sequência de médias é alocada; as
+    observações são lidas através de uma view.
+    
+    Args:
+        observations: Sequência de saída da simulação (ex.: esperas por paciente)
+        batch_size: Observações por média (5 na regra MSER-5)
+        max_fraction: Maior fração das observações que pode ser descartada
+        
+    Returns:
+        Número de observações iniciais a descartar
+    """
+    num_batches = len(observations) // batch_size
+    if num_batches < 2:
+        raise ValueError("Observações insuficientes para a regra MSER")
+    batches = observations[:num_batches * batch_size].reshape(num_batches, batch_size).mean(axis=1)
+    
+    # Somas de Z e Z² do corte d até o fim, para todos os d
+    tail_sum = np.cumsum(batches[::-1])[::-1]
+    batches *= batches
+    tail_sq = np.cumsum(batches[::-1])[::-1]
+    remaining = np.arange(num_batches, 0, -1, dtype=float)
+    mser = (tail_sq - tail_sum * tail_sum / remaining) / (remaining * remaining)
+    
+    max_cut = max(1, int(max_fraction * num_batches))
+    return int(np.argmin(mser[:max_cut])) * batch_size
+
+def batch_means_interval(observations: np.ndarray, confidence_level: float,
+                         num_batches: int = 30) -> Dict[str, float]:
+    """
+    Calcula o IC da média de uma única execução longa pelo método das médias em lotes.
+    
+    As observações são divididas em num_batches lotes contíguos de mesmo
+    tamanho; com lotes longos as médias são aproximadamente independentes e o
+    IC t-Student é aplicado a elas. As observações mais antigas que sobram da
+    divisão são ignoradas, e os lotes são lidos através de uma view.
+    
+    Args:
+        observations: Sequência de saída já sem o aquecimento
+        confidence_level: Nível de confiança do intervalo
+        num_batches: Número de lotes
+        
+    Returns:
+        Dicionário com média, meia-largura, limites, tamanho dos lotes e a
+        autocorrelação de ordem 1 entre médias (próxima de 0 se os lotes bastam)
+    """
+    batch_size = len(observations) // num_batches
+    if num_batches < 2 or batch_size < 1:
+        raise ValueError("Observações insuficientes para o número de lotes")
+    start = len(observations) - batch_size * num_batches
+    means = observations[start:].reshape(num_batches, batch_size).mean(axis=1)
+    
+    mean = means.mean()
+    t_crit = stats.t.ppf((1 + confidence_level) / 2, num_batches - 1)
+    half_width = t_crit * means.std(ddof=1) / np.sqrt(num_batches)
+    centered = means - mean
+    lag1 = float(np.dot(centered[:-1], centered[1:]) / np.dot(centered, centered)) if half_width > 0 else 0.0
+    return {
+        "mean": float(mean),
+        "half_width": float(half_width),
+        "ci_lower": float(mean - half_width),
+        "ci_upper": float(mean + half_width),
+        "batch_size": batch_size,
+        "num_batches": num_batches,
+        "lag1_autocorrelation": lag1,
+    }
+
+def steady_state_wait(run: SimulationRun, confidence_level: float,
+                      num_batches: int = 30) -> Dict[str, float]:
+    """
+    Estima Wq em regime permanente a partir de uma única execução longa.
+    
+    Descarta o aquecimento pela regra MSER-5 e aplica médias em lotes ao
+    restante das esperas, sem copiar o array da execução.
+    
+    Args:
+        run: Execução com as esperas por paciente (wait_times)
+        confidence_level: Nível de confiança do intervalo
+        num_batches: Número de lotes
+        
+    Returns:
+        Resultado de batch_means_interval acrescido de 'warmup' (pacientes descartados)
+    """
+    warmup = mser_truncation(run.wait_times)
+    estimate = batch_means_interval(run.wait_times[warmup:], confidence_level, num_batches)
+    estimate["warmup"] = warmup
+    return estimate
+
+class DiscreteEventSimulator:
+    """
+    Simulação de eventos discretos de uma fila M/M/c com disciplina FIFO.
+    
+    O calendário de eventos é um heap binário (heapq) de tuplas (tempo, tipo).
+    Os instantes de chegada (taxa constante ou perfil λ(t)) e os tempos de
+    atendimento são sorteados pelo NumPy em blocos e consumidos como floats
+    nativos, mantendo baixo o custo por evento mesmo com milhões de chegadas
+    por replicação.
+    """
+    
+    BLOCK_SIZE = 65536  # Máximo de sorteios aleatórios gerados por bloco
+    
+    def __init__(self, config: SimulationConfig, num_servers: int = 1):
+        """
+        Inicializa o simulador.
+        
+        Args:
+            config: Configuração da simulação (simulation_time define o horizonte)
+            num_servers: Número de médicos atendendo em paralelo (c)
+        """
+        if num_servers < 1:
+            raise ValueError("Número de médicos deve ser positivo")
+        self.config = config
+        self.config.convert_to_hourly_rates()
+        if self.config.arrival_rate <= 0 or self.config.service_rate <= 0:
+            raise ValueError("Taxas de chegada e serviço devem ser positivas")
+        if self.config.simulation_time <= 0:
+            raise ValueError("Tempo de simulação deve ser positivo")
+        self.config.arrival_rate_bound()  # Valida o perfil de chegada
+        self.num_servers = num_servers
+    
+    @staticmethod
+    def _streams(seed: SeedLike):
+        """
+        Cria geradores independentes para chegadas, atendimentos e thinning.
+        
+        Usar fluxos separados faz com que a mesma semente produza os mesmos
+        pacientes em cenários com números diferentes de médicos, qualquer que
+        seja o tamanho dos blocos sorteados.
+        """
+        return [np.random.default_rng(s) for s in spawn_seeds(seed, 3)]
+    
+    def _block_size(self) -> int:
+        """Tamanho de bloco proporcional ao número esperado de chegadas no horizonte."""
+        expected = self.config.arrival_rate_bound() * self.config.simulation_time
+        return int(min(self.BLOCK_SIZE, 1.1 * expected + 64))
+    
+    @staticmethod
+    def _exponential_stream(rng: np.random.Generator, rate: float, block_size: int) -> Iterator[float]:
+        """Fluxo infinito de tempos exponenciais sorteados em blocos."""
+        scale = 1.0 / rate
+        return chain.from_iterable(
+            rng.exponential(scale, block_size).tolist() for _ in repeat(None)
+        )
+    
+    def run(self, seed: SeedLike = None) -> SimulationRun:
+        """
+        Executa uma replicação até o horizonte config.simulation_time.
+        
+        Args:
+            seed: Semente (int ou SeedSequence) da replicação
+            
+        Returns:
+            SimulationRun com Lq e utilização médias no tempo e Wq médio por paciente
+        """
+        arrival_rng, service_rng, acceptance_rng = self._streams(seed)
+        block_size = self._block_size()
+        arrivals = chain.from_iterable(
+            block.tolist()
+            for block in arrival_time_stream(self.config, arrival_rng, block_size, acceptance_rng)
+        )
+        services = self._exponential_stream(service_rng, self.config.service_rate, block_size)
+        horizon = self.config.simulation_time
+        servers = self.num_servers
+        
+        heappush, heappop = heapq.heappush, heapq.heappop
+        calendar = [(next(arrivals), _ARRIVAL)]
+        queue = deque()
+        waits = []
+        record_wait = waits.append
+        
+        now = 0.0
+        busy = 0
+        queue_area = 0.0  # Integral do tamanho da fila no tempo
+        busy_area = 0.0   # Integral do número de médicos ocupados no tempo
+        
+        while calendar:
+            t, kind = heappop(calendar)
+            if t > horizon:
+                break
+            dt = t - now
+            queue_area += len(queue) * dt
+            busy_area += busy * dt
+            now = t
+            
+            if kind == _ARRIVAL:
+                heappush(calendar, (next(arrivals), _ARRIVAL))
+                if busy < servers:
+                    busy += 1
+                    record_wait(0.0)
+                    heappush(calendar, (t + next(services), _DEPARTURE))
+                else:
+                    queue.append(t)
+            elif queue:
+                # Médico liberado atende o próximo paciente da fila
+                record_wait(t - queue.popleft())
+                heappush(calendar, (t + next(services), _DEPARTURE))
+            else:
+                busy -= 1
+        
+        dt = horizon - now
+        queue_area += len(queue) * dt
+        busy_area += busy * dt
+        
+        wait_times = np.array(waits)
+        return SimulationRun(
+            num_servers=servers,
+            patients_served=len(wait_times),
+            utilization=busy_area / (servers * horizon),
+            average_queue_length=queue_area / horizon,
+            average_queue_time=float(wait_times.mean()) if len(wait_times) else 0.0,
+            wait_times=wait_times,
+        )
+    
+    def replicate(self, replications: int = 10, seed: SeedLike = None) -> pd.DataFrame:
+        """
+        Executa replicações independentes e calcula intervalos de confiança.
+        
+        Args:
+            replications: Número de replicações
+            seed: Semente raiz; cada replicação recebe um fluxo filho independente
+            
+        Returns:
+            DataFrame de summarize_replications com as métricas empíricas
+        """
+        runs = pd.DataFrame([self.run(child).get_metrics() for child in spawn_seeds(seed, replications)])
+        return summarize_replications(runs, self.config.confidence_level)
+
+class LindleySimulator:
+    """
+    Simulação vetorizada dos tempos de espera em filas FIFO.
+    
+    As chegadas vêm de arrival_time_stream (taxa constante ou perfil λ(t)).
+    Para um médico usa a recursão de Lindley W(n+1) = max(0, W(n) + S(n) - A(n+1)),
+    resolvida em blocos com somas e mínimos acumulados do NumPy, sem laço Python
+    por paciente. Para c médicos usa a generalização de Kiefer-Wolfowitz: cada
+    paciente começa no instante em que o primeiro médico fica livre, mantido em um
+    heap de c posições. Essa recursão depende do vetor ordenado de instantes livres
+    e não se desenrola em somas acumuladas, então roda em um laço Python por
+    paciente (cerca de 8 vezes mais lento que o caso c = 1). Em ambos os casos os
+    sorteios são feitos em bloco e a memória extra é de um bloco.
+    """
+    
+    CHUNK_SIZE = 1_000_000  # Pacientes sorteados por bloco
+    
+    def __init__(self, config: SimulationConfig, num_servers: int = 1):
+        """
+        Inicializa o simulador.
+        
+        Args:
+            config: Configuração da simulação
+            num_servers: Número de médicos atendendo em paralelo (c)
+        """
+        if num_servers < 1:
+            raise ValueError("Número de médicos deve ser positivo")
+        self.config = config
+        self.config.convert_to_hourly_rates()
+        if self.config.arrival_rate <= 0 or self.config.service_rate <= 0:
+            raise ValueError("Taxas de chegada e serviço devem ser positivas")
+        self.config.arrival_rate_bound()  # Valida o perfil de chegada
+        self.num_servers = num_servers
+    
+    @staticmethod
+    def _single_server_waits(interarrivals: np.ndarray, services: np.ndarray,
+                             last_wait: float, last_service: float) -> np.ndarray:
+        """
+        Resolve a recursão de Lindley de um bloco sem laço Python.
+        
+        Com X(j) = S(j-1) - A(j) e C(j) = X(0) + ... + X(j), a recursão se
+        desenrola em W(j) = C(j) - min(-W(-1), min C(0..j)).
+        """
+        increments = np.empty_like(interarrivals)
+        increments[0] = last_service
+        increments[1:] = services[:-1]
+        increments -= interarrivals
+        np.cumsum(increments, out=increments)
+        floor = np.minimum.accumulate(increments)
+        np.minimum(floor, -last_wait, out=floor)
+        increments -= floor
+        return increments
+    
+    @staticmethod
+    def _multi_server_waits(arrivals: np.ndarray, services: np.ndarray,
+                            free_at: list) -> np.ndarray:
+        """
+        Aplica a recursão de Kiefer-Wolfowitz a um bloco, atualizando free_at.
+        
+        Laço Python por paciente sobre floats nativos (tolist), que é mais rápido
+        que indexar arrays do NumPy elemento a elemento; o custo é O(log c) por
+        paciente.
+        """
+        heapreplace = heapq.heapreplace
+        waits = []
+        record_wait = waits.append
+        for t, s in zip(arrivals.tolist(), services.tolist()):
+            free = free_at[0]
+            if free > t:
+                record_wait(free - t)
+                heapreplace(free_at, free + s)
+            else:
+                record_wait(0.0)
+                heapreplace(free_at, t + s)
+        return np.array(waits)
+    
+    def run(self, num_patients: int, seed: SeedLike = None) -> SimulationRun:
+        """
+        Simula a espera de num_patients pacientes a partir do sistema vazio.
+        
+        Args:
+            num_patients: Número de pacientes a simular
+            seed: Semente (int ou SeedSequence); usa os mesmos fluxos de
+                DiscreteEventSimulator para chegadas e atendimentos
+                
+        Returns:
+            SimulationRun com Wq médio por paciente, Lq pela lei de Little e
+            utilização medida até a última chegada
+        """
+        if num_patients < 1:
+            raise ValueError("Número de pacientes deve ser positivo")
+        arrival_rng, service_rng, acceptance_rng = DiscreteEventSimulator._streams(seed)
+        arrival_blocks = arrival_time_stream(self.config, arrival_rng, acceptance_rng=acceptance_rng)
+        service_scale = 1.0 / self.config.service_rate
+        servers = self.num_servers
+        
+        wait_times = np.empty(num_patients)
+        pending = np.empty(0)  # Chegadas já sorteadas e ainda não simuladas
+        clock = 0.0         # Instante da última chegada do bloco anterior
+        busy_time = 0.0     # Soma dos tempos de atendimento
+        last_wait = last_service = 0.0
+        free_at = [0.0] * servers
+        
+        for start in range(0, num_patients, self.CHUNK_SIZE):
+            size = min(self.CHUNK_SIZE, num_patients - start)
+            blocks, available = [pending], len(pending)
+            while available < size:
+                block = next(arrival_blocks)
+                blocks.append(block)
+                available += len(block)
+            arrivals = np.concatenate(blocks)
+            pending = arrivals[size:].copy()
+            arrivals = arrivals[:size]
+            services = service_rng.exponential(service_scale, size)
+            busy_time += services.sum()
+            
+            if servers == 1:
+                interarrivals = np.diff(arrivals, prepend=clock)
+                waits = self._single_server_waits(interarrivals, services, last_wait, last_service)
+                last_wait, last_service = waits[-1], services[-1]
+            else:
+                waits = self._multi_server_waits(arrivals, services, free_at)
+            clock = arrivals[-1]
+            wait_times[start:start + size] = waits
+        
+        average_queue_time = float(wait_times.mean())
+        return SimulationRun(
+            num_servers=servers,
+            patients_served=num_patients,
+            utilization=float(busy_time / (servers * clock)),
+            average_queue_length=float(average_queue_time * num_patients / clock),
+            average_queue_time=average_queue_time,
+            wait_times=wait_times,
+        )
+
+# Classes da triagem de Manchester, da mais urgente para a menos urgente,
+# com a proporção típica de pacientes em cada cor
+MANCHESTER_TRIAGE = {
+    'red': 0.01,     # Emergência
+    'orange': 0.10,  # Muito urgente
+    'yellow': 0.35,  # Urgente
+    'green': 0.45,   # Pouco urgente
+    'blue': 0.09,    # Não urgente
+}
+
+@dataclass
+class ServiceStage:
+    """Etapa de atendimento em série (ex.: triagem, consulta, exames)."""
+    name: str
+    service_rate: float  # Taxa de serviço (μ) por atendente, na unidade de tempo da configuração
+    num_servers: int = 1  # Número de atendentes da etapa
+    
+    @classmethod
+    def parse(cls, spec: str) -> 'ServiceStage':
+        """Cria uma etapa a partir de 'nome:taxa[:atendentes]' (ex.: 'exames:4:2')."""
+        parts = spec.split(':')
+        if len(parts) not in (2, 3):
+            raise ValueError(f"Etapa inválida '{spec}': use nome:taxa[:atendentes]")
+        return cls(parts[0], float(parts[1]), int(parts[2]) if len(parts) == 3 else 1)
+
+class _Patient:
+    """Estado de um paciente na simulação com prioridades."""
+    __slots__ = ('priority', 'system_arrival', 'queued_since', 'wait', 'remaining', 'seq', 'end')
+    
+    def __init__(self, priority: int, arrival: float, service: float):
+        self.priority = priority
+        self.system_arrival = arrival
+        self.queued_since = arrival  # Instante em que entrou na fila da etapa atual
+        self.wait = 0.0              # Espera acumulada na etapa atual
+        self.remaining = service     # Tempo de atendimento ainda não realizado
+        self.seq = -1             # Identificador do atendimento em curso (-1: nenhum)
+        self.end = 0.0            # Instante previsto de término do atendimento em curso
+
+@dataclass
+class PriorityRun:
+    """Resultado de uma replicação da simulação com prioridades e etapas em série."""
+    class_metrics: pd.DataFrame  # Uma linha por (etapa, classe)
+    stage_metrics: pd.DataFrame  # Uma linha por etapa
+    time_in_system: pd.DataFrame  # Tempo no sistema por classe, dos pacientes que saíram
+
+class PrioritySimulator:
+    """
+    Simulação de eventos discretos com classes de prioridade e etapas em série.
+    
+    Cada paciente recebe uma classe (ex.: cor da triagem de Manchester) e passa
+    pelas etapas na ordem dada, como triagem → consulta → exames, cada uma com
+    seus próprios atendentes. Cada etapa mantém uma deque FIFO por classe, e o
+    atendente liberado chama o paciente da classe mais urgente com fila, a um
+    custo que depende só do número de classes.
+    
+    No modo preemptivo, um paciente que chega a uma etapa lotada interrompe o
+    atendimento menos urgente em curso; o interrompido volta ao início da fila
+    da sua classe e depois retoma o tempo restante. O evento de término
+    interrompido continua no heap e é descartado ao ser retirado.
+    
+    A espera de cada paciente em cada etapa (incluindo as interrupções) é acumulada em contagem, soma, soma
+    dos quadrados e máximo por classe, em uma única passagem e sem guardar os
+    pacientes atendidos.
+    """
+    
+    def __init__(self, config: SimulationConfig, stages: Optional[List[ServiceStage]] = None,
+                 class_probabilities: Optional[Dict[str, float]] = None,
+                 preemptive: bool = False):
+        """
+        Inicializa o simulador.
+        
+        Args:
+            config: Configuração da simulação (chegadas e horizonte)
+            stages: Etapas em série (padrão: uma consulta com config.service_rate e um médico)
+            class_probabilities: Proporção de pacientes por classe, da mais urgente
+                para a menos urgente (padrão: MANCHESTER_TRIAGE)
+            preemptive: Se pacientes mais urgentes interrompem atendimentos em curso
+        """
+        minutes = config.time_unit == "minutes"
+        self.config = config
+        self.config.convert_to_hourly_rates()
+        if self.config.arrival_rate <= 0:
+            raise ValueError("Taxa de chegada deve ser positiva")
+        if self.config.simulation_time <= 0:
+            raise ValueError("Tempo de simulação deve ser positivo")
+        self.config.arrival_rate_bound()  # Valida o perfil de chegada
+        
+        if stages is None:
+            stages = [ServiceStage('doctor', self.config.service_rate)]
+        elif minutes:
+            stages = [replace(stage, service_rate=stage.service_rate * 60) for stage in stages]
+        if not stages:
+            raise ValueError("É necessária pelo menos uma etapa de atendimento")
+        for stage in stages:
+            if stage.service_rate <= 0 or stage.num_servers < 1:
+                raise ValueError(f"Etapa '{stage.name}' deve ter taxa e número de atendentes positivos")
+        self.stages = list(stages)
+        
+        class_probabilities = class_probabilities or MANCHESTER_TRIAGE
+        probabilities = np.asarray(list(class_probabilities.values()), dtype=float)
+        if np.any(probabilities < 0) or not np.isclose(probabilities.sum(), 1.0):
+            raise ValueError("Proporções das classes devem ser não negativas e somar 1")
+        self.class_names = list(class_probabilities)
+        self.class_probabilities = probabilities / probabilities.sum()
+        self.preemptive = preemptive
+    
+    def run(self, seed: SeedLike = None) -> PriorityRun:
+        """
+        Executa uma replicação até o horizonte config.simulation_time.
+        
+        Os fluxos de chegada, da primeira etapa e de thinning são os de
+        DiscreteEventSimulator para a mesma semente; as classes e as demais
+        etapas usam fluxos próprios. Assim, os modos preemptivo e não
+        preemptivo recebem os mesmos pacientes.
+        
+        Args:
+            seed: Semente (int ou SeedSequence) da replicação
+            
+        Returns:
+            PriorityRun com as métricas por classe e por etapa
+        """
+        num_stages = len(self.stages)
+        num_classes = len(self.class_names)
+        streams = [np.random.default_rng(s) for s in spawn_seeds(seed, num_stages + 3)]
+        arrival_rng, first_service_rng, acceptance_rng, class_rng = streams[:4]
+        expected = self.config.arrival_rate_bound() * self.config.simulation_time
+        block_size = int(min(DiscreteEventSimulator.BLOCK_SIZE, 1.1 * expected + 64))
+        
+        arrivals = chain.from_iterable(
+            block.tolist()
+            for block in arrival_time_stream(self.config, arrival_rng, block_size, acceptance_rng)
+        )
+        cumulative = np.cumsum(self.class_probabilities)[:-1]
+        classes = chain.from_iterable(
+            np.searchsorted(cumulative, class_rng.random(block_size), side='right').tolist()
+            for _ in repeat(None)
+        )
+        services = [
+            DiscreteEventSimulator._exponential_stream(rng, stage.service_rate, block_size)
+            for rng, stage in zip([first_service_rng] + streams[4:], self.stages)
+        ]
+        horizon = self.config.simulation_time
+        preemptive = self.preemptive
+        last_stage = num_stages - 1
+        
+        heappush, heappop = heapq.heappush, heapq.heappop
+        next_seq = count().__next__
+        calendar = []  # Términos de atendimento: (tempo, seq, etapa, paciente)
+        capacity = [stage.num_servers for stage in self.stages]
+        queues = [[deque() for _ in range(num_classes)] for _ in range(num_stages)]
+        in_service = [[{} for _ in range(num_classes)] for _ in range(num_stages)]
+        busy = [0] * num_stages
+        busy_area = [0.0] * num_stages  # Integral do número de atendentes ocupados
+        last_change = [0.0] * num_stages
+        
+        # Acumuladores de espera por etapa e classe, e de tempo no sistema por classe
+        served = [[0] * num_classes for _ in range(num_stages)]
+        wait_sum = [[0.0] * num_classes for _ in range(num_stages)]
+        wait_sq = [[0.0] * num_classes for _ in range(num_stages)]
+        wait_max = [[0.0] * num_classes for _ in range(num_stages)]
+        departed = [0] * num_classes
+        sojourn_sum = [0.0] * num_classes
+        
+        def start(stage: int, patient: _Patient, now: float) -> None:
+            seq = next_seq()
+            patient.seq = seq
+            patient.wait += now - patient.queued_since
+            patient.end = end = now + patient.remaining
+            heappush(calendar, (end, seq, stage, patient))
+            if preemptive:
+                in_service[stage][patient.priority][seq] = patient
+        
+        def arrive(stage: int, patient: _Patient, now: float) -> None:
+            if busy[stage] < capacity[stage]:
+                busy_area[stage] += busy[stage] * (now - last_change[stage])
+                last_change[stage] = now
+                busy[stage] += 1
+                start(stage, patient, now)
+                return
+            priority = patient.priority
+            if preemptive:
+                # Interrompe o atendimento da classe menos urgente abaixo da do paciente
+                for lower in range(num_classes - 1, priority, -1):
+                    victims = in_service[stage][lower]
+                    if victims:
+                        _, victim = victims.popitem()
+                        victim.remaining = victim.end - now
+                        victim.seq = -1
+                        victim.queued_since = now
+                        queues[stage][lower].appendleft(victim)
+                        start(stage, patient, now)
+                        return
+            queues[stage][priority].append(patient)
+        
+        next_arrival = next(arrivals)
+        while True:
+            if calendar and calendar[0][0] <= next_arrival:
+                t, seq, stage, patient = heappop(calendar)
+                if t > horizon:
+                    break
+                if patient.seq != seq:
+                    continue  # Atendimento interrompido por preempção
+                priority = patient.priority
+                if preemptive:
+                    del in_service[stage][priority][seq]
+                
+                wait = patient.wait
+                served[stage][priority] += 1
+                wait_sum[stage][priority] += wait
+                wait_sq[stage][priority] += wait * wait
+                if wait > wait_max[stage][priority]:
+                    wait_max[stage][priority] = wait
+                
+                # Atendente liberado chama o paciente mais urgente da fila
+                for queue in queues[stage]:
+                    if queue:
+                        start(stage, queue.popleft(), t)
+                        break
+                else:
+                    busy_area[stage] += busy[stage] * (t - last_change[stage])
+                    last_change[stage] = t
+                    busy[stage] -= 1
+                
+                if stage < last_stage:
+                    patient.queued_since = t
+                    patient.wait = 0.0
+                    patient.remaining = next(services[stage + 1])
+                    arrive(stage + 1, patient, t)
+                else:
+                    departed[priority] += 1
+                    sojourn_sum[priority] += t - patient.system_arrival
+            else:
+                t = next_arrival
+                if t > horizon:
+                    break
+                next_arrival = next(arrivals)
+                arrive(0, _Patient(next(classes), t, next(services[0])), t)
+        
+        class_rows = []
+        stage_rows = []
+        for stage_index, stage in enumerate(self.stages):
+            busy_area[stage_index] += busy[stage_index] * (horizon - last_change[stage_index])
+            stage_rows.append({
+                'stage': stage.name,
+                'num_servers': stage.num_servers,
+                'patients_served': sum(served[stage_index]),
+                'utilization': busy_area[stage_index] / (stage.num_servers * horizon),
+            })
+            for class_index, name in enumerate(self.class_names):
+                n = served[stage_index][class_index]
+                total = wait_sum[stage_index][class_index]
+                mean = total / n if n else np.nan
+                variance = (wait_sq[stage_index][class_index] - total * mean) / (n - 1) if n > 1 else np.nan
+                class_rows.append({
+                    'stage': stage.name,
+                    'class': name,
+                    'patients_served': n,
+                    'average_queue_time': mean,
+                    'std_queue_time': float(np.sqrt(max(variance, 0.0))) if n > 1 else np.nan,
+                    'max_queue_time': wait_max[stage_index][class_index] if n else np.nan,
+                    # Lei de Little: área sob a fila da classe ≈ soma das esperas
+                    'average_queue_length': total / horizon,
+                })
+        
+        time_in_system = pd.DataFrame({
+            'class': self.class_names,
+            'patients': departed,
+            'average_time_in_system': [total / n if n else np.nan
+                                       for total, n in zip(sojourn_sum, departed)],
+        })
+        return PriorityRun(
+            class_metrics=pd.DataFrame(class_rows),
+            stage_metrics=pd.DataFrame(stage_rows),
+            time_in_system=time_in_system,
+        )
+
+def _run_replication(task) -> List[Dict[str, float]]:
+    """
+    Executa uma replicação de todos os cenários; executado nos processos do pool.
+    
+    Todos os cenários usam a mesma semente e, portanto, os mesmos pacientes
+    (números aleatórios comuns).
+    
+    Args:
+        task: Tupla (parâmetros da configuração, números de médicos, SeedSequence)
+        
+    Returns:
+        Lista com as métricas de cada cenário
+    """
+    params, servers, seed = task
+    config = SimulationConfig(**params)
+    rows = []
+    for num_servers in servers:
+        metrics = DiscreteEventSimulator(config, num_servers).run(seed).get_metrics()
+        metrics['num_servers'] = num_servers
+        rows.append(metrics)
+    return rows
+
+@dataclass
+class ReplicationStudy:
+    """Resultado de um estudo com replicações independentes."""
+    runs: pd.DataFrame             # Uma linha por (replicação, número de médicos)
+    summary: pd.DataFrame          # IC de cada métrica, indexado por (num_servers, métrica)
+    wait_difference: pd.DataFrame  # IC pareado de Wq(c) - Wq(c da referência)
+    history: pd.DataFrame          # Meia-largura do IC de Wq após cada lote
+    converged: bool                # Se a meia-largura alvo foi atingida
+    
+    @property
+    def replications(self) -> int:
+        """Número de replicações executadas."""
+        return int(self.runs['replication'].nunique())
+
+class ReplicationManager:
+    """
+    Executa replicações independentes de vários cenários em um pool de processos.
+    
+    Cada replicação recebe um fluxo independente derivado por SeedSequence, e o
+    mesmo fluxo é usado em todos os cenários da replicação (números aleatórios
+    comuns): a diferença entre um e dois médicos é estimada com pacientes
+    idênticos, o que reduz muito a variância da comparação. As replicações são
+    executadas em lotes até a meia-largura do IC de Wq de todos os cenários
+    atingir o alvo, ou até o máximo de replicações.
+    """
+    
+    def __init__(self, config: SimulationConfig, servers: List[int] = (1, 2),
+                 workers: Optional[int] = None):
+        """
+        Inicializa o gerenciador.
+        
+        Args:
+            config: Configuração da simulação
+            servers: Números de médicos comparados; o primeiro é a referência
+            workers: Número de processos (padrão: número de CPUs; 1 = sem pool)
+        """
+        if not servers:
+            raise ValueError("Informe ao menos um número de médicos")
+        self.config = config
+        self.config.convert_to_hourly_rates()
+        for num_servers in servers:
+            DiscreteEventSimulator(self.config, num_servers)  # Valida os cenários
+        self.servers = list(servers)
+        self.workers = workers or os.cpu_count() or 1
+    
+    def _summarize(self, runs: pd.DataFrame):
+        """Calcula os ICs por cenário e o IC pareado das diferenças de Wq."""
+        confidence_level = self.config.confidence_level
+        metrics = runs.drop(columns=['replication', 'num_servers'])
+        summary = pd.concat({
+            num_servers: summarize_replications(group, confidence_level)
+            for num_servers, group in metrics.groupby(runs['num_servers'])
+        }, names=['num_servers', 'metric'])
+        
+        waits = runs.pivot(index='replication', columns='num_servers', values='average_queue_time')
+        reference = self.servers[0]
+        differences = waits[self.servers[1:]].sub(waits[reference], axis=0)
+        differences.columns = [f'{num_servers} vs {reference}' for num_servers in self.servers[1:]]
+        wait_difference = (summarize_replications(differences, confidence_level)
+                           if len(differences.columns) else pd.DataFrame())
+        return summary, wait_difference
+    
+    def run(self, target_half_width: Optional[float] = None, min_replications: int = 10,
+            max_replications: int = 1000, batch_size: Optional[int] = None,
+            seed: Optional[int] = None) -> ReplicationStudy:
+        """
+        Executa replicações até atingir a precisão desejada para Wq.
+        
+        Args:
+            target_half_width: Meia-largura alvo do IC de Wq, em horas
+                (None = executa exatamente max_replications)
+            min_replications: Replicações antes do primeiro teste de parada
+            max_replications: Limite de replicações
+            batch_size: Replicações por lote após o mínimo (padrão: 20% das já
+                executadas, e no mínimo uma por processo)
+            seed: Semente raiz do estudo
+            
+        Returns:
+            ReplicationStudy com as replicações, os ICs e o histórico de precisão
+        """
+        if target_half_width is None:
+            min_replications = max_replications
+        if min_replications < 2 or max_replications < min_replications:
+            raise ValueError("Requer 2 <= min_replications <= max_replications")
+        params = dict(self.config.__dict__)
+        seeds = spawn_seeds(seed, max_replications)
+        
+        rows, history = [], []
+        executor = ProcessPoolExecutor(max_workers=self.workers) if self.workers > 1 else None
+        try:
+            done, converged = 0, False
+            while done < max_replications and not converged:
+                if done < min_replications:
+                    size = min_replications - done
+                else:
+                    size = batch_size or max(self.workers, done // 5)
+                size = min(size, max_replications - done)
+                tasks = [(params, self.servers, seeds[i]) for i in range(done, done + size)]
+                if executor:
+                    chunksize = max(1, size // (4 * self.workers))
+                    results = executor.map(_run_replication, tasks, chunksize=chunksize)
+                else:
+                    results = map(_run_replication, tasks)
+                for replication, scenario_rows in enumerate(results, start=done):
+                    for row in scenario_rows:
+                        row['replication'] = replication
+                        rows.append(row)
+                done += size
+                
+                summary, _ = self._summarize(pd.DataFrame(rows))
+                half_widths = summary.xs('average_queue_time', level='metric')['half_width']
+                history.append({'replications': done, **half_widths.to_dict()})
+                converged = (target_half_width is not None
+                             and bool((half_widths <= target_half_width).all()))
+        finally:
+            if executor:
+                executor.shutdown()
+        
+        runs = pd.DataFrame(rows)[['replication', 'num_servers', 'utilization',
+                                   'average_queue_length', 'average_queue_time']]
+        summary, wait_difference = self._summarize(runs)
+        return ReplicationStudy(
+            runs=runs,
+            summary=summary,
+            wait_difference=wait_difference,
+            history=pd.DataFrame(history).set_index('replications'),
+            converged=converged,
+        )
+
 class HospitalQueueAnalyzer:
     """Classe para análise e comparação de diferentes cenários de filas hospitalares."""
     
@@ -166,6 +1224,9 @@ class HospitalQueueAnalyzer:
             config: Configuração da simulação
         """
         self.config = config
+        # Os modelos convertem a configuração para horas; a unidade original
+        # ainda é necessária para as taxas das etapas da triagem
+        self.input_time_unit = config.time_unit
         self.mm1 = MM1Model(config)
         self.mm2 = MM2Model(config)
     
@@ -186,8 +1247,149 @@ class HospitalQueueAnalyzer:
         }
         return pd.DataFrame(metrics)
     
-    def plot_comparison(self, save_path: str = None):
-        """Cria visualização comparando modelos M/M/1 e M/M/2."""
+    def _metric_labels(self) -> Dict[str, str]:
+        """Rótulos das métricas usados nas tabelas de comparação."""
+        return {
+            'utilization': 'Utilization',
+            'average_queue_length': 'Avg Queue Length',
+            'average_queue_time': f'Avg Wait Time ({self.config.time_unit})',
+        }
+    
+    def _scenarios(self):
+        """Cenários comparados: (nome, modelo analítico, número de médicos)."""
+        return [('Single Doctor', self.mm1, 1), ('Two Doctors', self.mm2, 2)]
+    
+    def simulate_models(self, replications: int = 10, seed: Optional[int] = None) -> pd.DataFrame:
+        """
+        Simula os cenários com um e dois médicos e compara com os valores analíticos.
+        
+        Args:
+            replications: Número de replicações por cenário
+            seed: Semente raiz; os dois cenários recebem os mesmos pacientes,
+                inclusive com seed=None (a raiz é sorteada uma única vez)
+            
+        Returns:
+            DataFrame com valor analítico, média simulada e IC de cada métrica
+        """
+        root = np.random.SeedSequence(seed)
+        rows = []
+        for scenario, model, servers in self._scenarios():
+            simulator = DiscreteEventSimulator(self.config, num_servers=servers)
+            summary = simulator.replicate(replications, root)
+            analytic = model.get_metrics()
+            for key, label in self._metric_labels().items():
+                rows.append({
+                    'Metric': label,
+                    'Scenario': scenario,
+                    'Analytic': analytic[key],
+                    'Simulated': summary.loc[key, 'mean'],
+                    'CI Lower': summary.loc[key, 'ci_lower'],
+                    'CI Upper': summary.loc[key, 'ci_upper'],
+                })
+        return pd.DataFrame(rows)
+    
+    def replication_study(self, target_half_width: Optional[float] = None,
+                          max_replications: int = 1000, workers: Optional[int] = None,
+                          seed: Optional[int] = None) -> ReplicationStudy:
+        """
+        Compara um e dois médicos com números aleatórios comuns e parada sequencial.
+        
+        Args:
+            target_half_width: Meia-largura alvo do IC de Wq, em horas
+            max_replications: Limite de replicações
+            workers: Número de processos (padrão: número de CPUs)
+            seed: Semente raiz do estudo
+            
+        Returns:
+            ReplicationStudy com os ICs por cenário e da diferença de Wq
+        """
+        manager = ReplicationManager(self.config, servers=[1, 2], workers=workers)
+        return manager.run(target_half_width, max_replications=max_replications, seed=seed)
+    
+    def simulate_patients(self, num_patients: int = 1_000_000, seed: Optional[int] = None) -> pd.DataFrame:
+        """
+        Confere as fórmulas contra a simulação vetorizada de Lindley em larga escala.
+        
+        Args:
+            num_patients: Número de pacientes simulados por cenário
+            seed: Semente; os dois cenários recebem os mesmos pacientes,
+                inclusive com seed=None (a raiz é sorteada uma única vez)
+            
+        Returns:
+            DataFrame com valor analítico, valor simulado e erro relativo de cada métrica
+        """
+        root = np.random.SeedSequence(seed)
+        rows = []
+        for scenario, model, servers in self._scenarios():
+            simulated = LindleySimulator(self.config, num_servers=servers).run(num_patients, root).get_metrics()
+            analytic = model.get_metrics()
+            for key, label in self._metric_labels().items():
+                rows.append({
+                    'Metric': label,
+                    'Scenario': scenario,
+                    'Analytic': analytic[key],
+                    'Simulated': simulated[key],
+                    'Relative Error': (simulated[key] - analytic[key]) / analytic[key],
+                })
+        return pd.DataFrame(rows)
+    
+    def steady_state_models(self, num_patients: int = 1_000_000, seed: Optional[int] = None,
+                            num_batches: int = 30) -> pd.DataFrame:
+        """
+        Estima Wq em regime permanente com uma única execução longa por cenário.
+        
+        Args:
+            num_patients: Número de pacientes da execução (recursão de Lindley)
+            seed: Semente; os dois cenários recebem os mesmos pacientes
+            num_batches: Número de lotes do método das médias em lotes
+            
+        Returns:
+            DataFrame com Wq analítico, estimativa, IC e aquecimento descartado
+        """
+        rows = []
+        for scenario, model, servers in self._scenarios():
+            run = LindleySimulator(self.config, num_servers=servers).run(num_patients, seed)
+            estimate = steady_state_wait(run, self.config.confidence_level, num_batches)
+            rows.append({
+                'Scenario': scenario,
+                'Analytic': model.average_queue_time,
+                'Simulated': estimate['mean'],
+                'CI Lower': estimate['ci_lower'],
+                'CI Upper': estimate['ci_upper'],
+                'Warm-up (patients)': estimate['warmup'],
+                'Batch Size': estimate['batch_size'],
+            })
+        return pd.DataFrame(rows)
+    
+    def simulate_triage(self, stages: Optional[List[ServiceStage]] = None,
+                        class_probabilities: Optional[Dict[str, float]] = None,
+                        preemptive: bool = False, seed: Optional[int] = None) -> PriorityRun:
+        """
+        Simula o atendimento por prioridade de triagem ao longo das etapas.
+        
+        Args:
+            stages: Etapas em série, com taxas na unidade de tempo original da
+                configuração (padrão: uma consulta com um médico)
+            class_probabilities: Proporção por classe (padrão: MANCHESTER_TRIAGE)
+            preemptive: Se pacientes mais urgentes interrompem atendimentos em curso
+            seed: Semente da simulação
+            
+        Returns:
+            PriorityRun com esperas por classe e etapa
+        """
+        if stages is not None and self.input_time_unit == "minutes":
+            stages = [replace(stage, service_rate=stage.service_rate * 60) for stage in stages]
+        simulator = PrioritySimulator(self.config, stages, class_probabilities, preemptive)
+        return simulator.run(seed)
+    
+    def plot_comparison(self, save_path: str = None, show: bool = True):
+        """
+        Cria visualização comparando modelos M/M/1 e M/M/2.
+        
+        Args:
+            save_path: Caminho opcional para salvar a imagem
+            show: Se False, fecha a figura sem abrir janela (uso em lote)
+        """
         metrics = self.compare_models()
         
         fig, axes = plt.subplots(1, 3, figsize=(15, 5))
@@ -202,7 +1404,10 @@ class HospitalQueueAnalyzer:
         plt.tight_layout()
         if save_path:
             plt.savefig(save_path)
-        plt.show()
+        if show:
+            plt.show()
+        else:
+            plt.close(fig)
     
     def save_results(self, output_dir: str):
         """Salva resultados da análise em arquivos."""
@@ -216,7 +1421,147 @@ class HospitalQueueAnalyzer:
         self.compare_models().to_csv(str(output_path / "metrics.csv"), index=False)
         
         # Salva gráficos
-        self.plot_comparison(str(output_path / "comparison.png"))
+        self.plot_comparison(str(output_path / "comparison.png"), show=False)
+
+def _run_scenario(task) -> Dict[str, Any]:
+    """
+    Avalia um cenário da varredura; executado nos processos do pool.
+    
+    Args:
+        task: Tupla (parâmetros da configuração, número de médicos,
+            replicações, SeedSequence do cenário)
+            
+    Returns:
+        Dicionário com os parâmetros do cenário e suas métricas
+    """
+    params, num_servers, replications, seed = task
+    config = SimulationConfig(**params)
+    config.convert_to_hourly_rates()
+    row = {
+        'arrival_rate': config.arrival_rate,
+        'service_rate': config.service_rate,
+        'num_servers': num_servers,
+        'simulation_time': config.simulation_time,
+    }
+    try:
+        model = MMcModel(config, num_servers)
+    except ValueError:
+        # Cenário instável: mantém a linha com métricas ausentes
+        row['stable'] = False
+        return row
+    
+    row['stable'] = True
+    row.update(model.get_metrics())
+    if replications:
+        summary = DiscreteEventSimulator(config, num_servers).replicate(replications, seed)
+        for key in summary.index:
+            row[f'sim_{key}'] = summary.loc[key, 'mean']
+            row[f'sim_{key}_half_width'] = summary.loc[key, 'half_width']
+    return row
+
+def run_sweep(configs: List[SimulationConfig], servers: List[int], replications: int = 0,
+              seed: Optional[int] = None, workers: Optional[int] = None) -> pd.DataFrame:
+    """
+    Avalia todas as combinações de configuração e número de médicos em um pool de processos.
+    
+    Os cenários são enviados aos processos em lotes (chunksize), de modo que o
+    custo de iniciar o Python e de comunicação é pago uma vez por worker, e não
+    uma vez por cenário.
+    
+    Args:
+        configs: Configurações a avaliar
+        servers: Números de médicos avaliados para cada configuração
+        replications: Replicações da simulação por cenário (0 = apenas fórmulas)
+        seed: Semente raiz; cenários da mesma configuração recebem os mesmos pacientes
+        workers: Número de processos (padrão: número de CPUs; 1 = sem pool)
+        
+    Returns:
+        DataFrame com uma linha por cenário
+    """
+    if replications == 1:
+        raise ValueError("São necessárias pelo menos 2 replicações para o intervalo de confiança")
+    
+    seeds = spawn_seeds(seed, len(configs))
+    tasks = [
+        (dict(config.__dict__), num_servers, replications, config_seed)
+        for config, config_seed in zip(configs, seeds)
+        for num_servers in servers
+    ]
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        rows = [_run_scenario(task) for task in tasks]
+    else:
+        chunksize = max(1, len(tasks) // (4 * workers))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            rows = list(executor.map(_run_scenario, tasks, chunksize=chunksize))
+    return pd.DataFrame(rows)
+
+def build_grid(arrival_rates: List[float], service_rates: List[float],
+               base: Optional[SimulationConfig] = None) -> List[SimulationConfig]:
+    """
+    Monta a grade de configurações a partir de listas de taxas.
+    
+    Args:
+        arrival_rates: Taxas de chegada (λ)
+        service_rates: Taxas de atendimento por médico (μ)
+        base: Configuração de onde vêm os demais campos (horizonte, unidade, confiança)
+        
+    Returns:
+        Lista com uma configuração por par (λ, μ)
+    """
+    base = base or SimulationConfig(
+        arrival_rate=SIMULATION_PARAMS['DEFAULT_ARRIVAL_RATE'],
+        service_rate=SIMULATION_PARAMS['DEFAULT_SERVICE_RATE'],
+    )
+    return [replace(base, arrival_rate=lam, service_rate=mu)
+            for lam, mu in product(arrival_rates, service_rates)]
+
+def save_sweep_results(results: pd.DataFrame, output_path: str) -> None:
+    """
+    Salva os resultados da varredura em formato colunar.
+    
+    Args:
+        results: DataFrame retornado por run_sweep
+        output_path: Arquivo de saída; extensão .parquet usa Parquet, outras usam CSV
+    """
+    path = Path(output_path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if path.suffix == '.parquet':
+        try:
+            results.to_parquet(path, index=False)
+        except ImportError as e:
+            raise ValueError("Saída Parquet requer pyarrow ou fastparquet instalado") from e
+    else:
+        results.to_csv(path, index=False)
+
+def plot_sweep(results: pd.DataFrame, save_path: str) -> None:
+    """
+    Salva o gráfico de Wq por taxa de chegada, uma curva por (μ, número de médicos).
+    
+    A figura é desenhada diretamente em um canvas Agg, sem janela e sem alterar
+    o backend global do matplotlib, própria para execuções em lote.
+    
+    Args:
+        results: DataFrame retornado por run_sweep
+        save_path: Caminho da imagem
+    """
+    fig = Figure(figsize=(10, 6))
+    FigureCanvasAgg(fig)
+    ax = fig.subplots()
+    stable = results[results['stable']]
+    for (mu, servers), group in stable.groupby(['service_rate', 'num_servers']):
+        group = group.sort_values('arrival_rate')
+        ax.plot(group['arrival_rate'], group['average_queue_time'], marker='o',
+                label=f'μ={mu:g}, c={servers}')
+    ax.set_xlabel('Arrival Rate (patients/hour)')
+    ax.set_ylabel('Avg Wait Time (hours)')
+    ax.set_yscale('log')
+    ax.set_title('Hospital Queue Parameter Sweep')
+    ax.grid(True, alpha=0.3)
+    if len(stable):
+        ax.legend()
+    fig.tight_layout()
+    fig.savefig(save_path)
 
 def main():
     """Interface de linha de comando para análise de filas hospitalares."""
@@ -227,10 +1572,72 @@ def main():
     parser.add_argument('--time-unit', choices=['minutes', 'hours'], default='hours',
                        help='Unidade de tempo para as taxas')
     parser.add_argument('--output-dir', type=str, help='Diretório para salvar resultados')
+    parser.add_argument('--simulation-time', type=float,
+                       default=SIMULATION_PARAMS['DEFAULT_SIMULATION_TIME'],
+                       help='Horizonte da simulação de eventos discretos (na unidade de tempo)')
+    parser.add_argument('--arrival-profile', type=float, nargs='+',
+                       help='Taxas de chegada por faixa de tempo, repetidas ciclicamente (ex.: 24 valores horários)')
+    parser.add_argument('--profile-interval', type=float, default=1.0,
+                       help='Duração de cada faixa do perfil de chegada (na unidade de tempo)')
+    parser.add_argument('--simulate', action='store_true',
+                       help='Executa a simulação de eventos discretos junto com as fórmulas')
+    parser.add_argument('--replications', type=int, default=10,
+                       help='Número de replicações da simulação (máximo, com --target-half-width)')
+    parser.add_argument('--target-half-width', type=float,
+                       help='Replica em paralelo até a meia-largura do IC de Wq atingir este valor (horas)')
+    parser.add_argument('--seed', type=int, help='Semente para reprodutibilidade da simulação')
+    parser.add_argument('--patients', type=int,
+                       help='Confere as fórmulas simulando este número de pacientes (recursão de Lindley)')
+    parser.add_argument('--steady-state', action='store_true',
+                       help='Estima Wq em regime permanente com uma execução longa (MSER-5 e médias em lotes)')
+    parser.add_argument('--triage', action='store_true',
+                       help='Simula o atendimento por prioridade com as cores da triagem de Manchester')
+    parser.add_argument('--preemptive', action='store_true',
+                       help='Com --triage, pacientes mais urgentes interrompem atendimentos em curso')
+    parser.add_argument('--stages', type=ServiceStage.parse, nargs='+',
+                       help='Etapas em série para --triage, no formato nome:taxa[:atendentes] '
+                            '(ex.: triage:12 doctor:3:2 exams:6)')
+    
+    sweep = parser.add_argument_group('varredura de parâmetros')
+    sweep.add_argument('--sweep', action='store_true',
+                       help='Avalia vários cenários em paralelo e salva uma única tabela')
+    sweep.add_argument('--arrival-rates', type=float, nargs='+', help='Grade de taxas de chegada')
+    sweep.add_argument('--service-rates', type=float, nargs='+', help='Grade de taxas de atendimento')
+    sweep.add_argument('--configs', type=str, nargs='+', help='Arquivos JSON de SimulationConfig')
+    sweep.add_argument('--servers', type=int, nargs='+', default=[1, 2],
+                       help='Números de médicos avaliados em cada cenário')
+    sweep.add_argument('--workers', type=int,
+                       help='Número de processos da varredura e do estudo de replicações (padrão: número de CPUs)')
+    sweep.add_argument('--output', type=str, default='sweep_results.csv',
+                       help='Arquivo de saída (.csv ou .parquet); o gráfico é salvo ao lado em .png')
     
     args = parser.parse_args()
     
     try:
+        if args.sweep:
+            if args.configs:
+                configs = [SimulationConfig.from_json(path) for path in args.configs]
+            elif args.arrival_rates and args.service_rates:
+                base = SimulationConfig(
+                    arrival_rate=args.arrival_rates[0],
+                    service_rate=args.service_rates[0],
+                    simulation_time=args.simulation_time,
+                    time_unit=args.time_unit,
+                    confidence_level=SIMULATION_PARAMS['CONFIDENCE_LEVEL'],
+                    arrival_profile=args.arrival_profile,
+                    profile_interval=args.profile_interval
+                )
+                configs = build_grid(args.arrival_rates, args.service_rates, base)
+            else:
+                raise ValueError("A varredura requer --configs ou --arrival-rates e --service-rates")
+            
+            replications = args.replications if args.simulate else 0
+            results = run_sweep(configs, args.servers, replications, args.seed, args.workers)
+            save_sweep_results(results, args.output)
+            plot_sweep(results, str(Path(args.output).with_suffix('.png')))
+            print(f"\nParameter sweep: {len(results)} scenarios saved to {args.output}")
+            return 0
+        
         if args.config:
             config = SimulationConfig.from_json(args.config)
         else:
@@ -239,7 +1646,11 @@ def main():
             config = SimulationConfig(
                 arrival_rate=args.arrival_rate,
                 service_rate=args.service_rate,
-                time_unit=args.time_unit
+                simulation_time=args.simulation_time,
+                time_unit=args.time_unit,
+                confidence_level=SIMULATION_PARAMS['CONFIDENCE_LEVEL'],
+                arrival_profile=args.arrival_profile,
+                profile_interval=args.profile_interval
             )
         
         analyzer = HospitalQueueAnalyzer(config)
@@ -248,6 +1659,45 @@ def main():
         print("=" * 50)
         print(analyzer.compare_models().to_string(index=False))
         
+        if args.simulate and args.target_half_width:
+            study = analyzer.replication_study(args.target_half_width, args.replications,
+                                               args.workers, args.seed)
+            status = "target reached" if study.converged else "target not reached"
+            print(f"\nReplication Study ({study.replications} replications, {status}, "
+                  f"{config.confidence_level:.0%} CI):")
+            print("=" * 50)
+            print(study.summary.to_string())
+            print("\nPaired difference in Avg Wait Time (common random numbers):")
+            print(study.wait_difference.to_string())
+        elif args.simulate:
+            print(f"\nDiscrete-Event Simulation ({args.replications} replications, "
+                  f"{config.confidence_level:.0%} CI):")
+            print("=" * 50)
+            print(analyzer.simulate_models(args.replications, args.seed).to_string(index=False))
+        
+        if args.patients:
+            print(f"\nLindley Recursion Check ({args.patients:,} patients):")
+            print("=" * 50)
+            print(analyzer.simulate_patients(args.patients, args.seed).to_string(index=False))
+        
+        if args.steady_state:
+            num_patients = args.patients or 1_000_000
+            print(f"\nSteady-State Avg Wait Time ({num_patients:,} patients, MSER-5 warm-up, "
+                  f"batch means, {config.confidence_level:.0%} CI):")
+            print("=" * 50)
+            print(analyzer.steady_state_models(num_patients, args.seed).to_string(index=False))
+        
+        if args.triage:
+            discipline = "preemptive" if args.preemptive else "non-preemptive"
+            run = analyzer.simulate_triage(args.stages, preemptive=args.preemptive, seed=args.seed)
+            print(f"\nManchester Triage Simulation ({discipline} priority):")
+            print("=" * 50)
+            print(run.stage_metrics.to_string(index=False))
+            print()
+            print(run.class_metrics.to_string(index=False))
+            print()
+            print(run.time_in_system.to_string(index=False))
+        
         print("\nGenerating visualization...")
         if args.output_dir:
             analyzer.save_results(args.output_dir)
@@ -258,6 +1708,10 @@ def main():
                       / analyzer.mm1.average_queue_time * 100)
         print(f"\nAdding a second doctor reduces average wait time by {improvement:.1f}%")
         
+        target = SIMULATION_PARAMS['TARGET_WAIT_TIME']
+        print(f"Minimum doctors for an average wait of at most {target} hours: "
+              f"{find_minimum_servers(config, target)}")
+        
     except ValueError as e:
         print(f"Error: {e}")
         return 1
@@ -0,0 +1,389 @@
+"""
+Testes unitários para o módulo de simulação de filas hospitalares.
+"""
+
+import math
+import pickle
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+import matplotlib
+import numpy as np
+import pandas as pd
+from simulacao import (SimulationConfig, MM1Model, MM2Model, MMcModel, erlang_c,
+                       find_minimum_servers, DiscreteEventSimulator,
+                       LindleySimulator, HospitalQueueAnalyzer, arrival_time_stream, build_grid,
+                       run_sweep, save_sweep_results, plot_sweep, ReplicationManager,
+                       mser_truncation, batch_means_interval, steady_state_wait,
+                       PrioritySimulator, ServiceStage, MANCHESTER_TRIAGE)
+
+def profile_per_minute(t):
+    """Perfil em minutos no nível do módulo, serializável pelo pool de processos."""
+    return 0.04 + 0.01 * np.sin(2 * np.pi * t / 1440)
+
+class TestMMcModel(unittest.TestCase):
+    def test_single_server_matches_mm1(self):
+        """Testa se o M/M/c com um médico coincide com o M/M/1."""
+        config = SimulationConfig(arrival_rate=2.0, service_rate=3.0)
+        mmc = MMcModel(config, num_servers=1).get_metrics()
+        mm1 = MM1Model(config).get_metrics()
+        for key in mm1:
+            self.assertAlmostEqual(mmc[key], mm1[key])
+
+    def test_mm2_closed_form(self):
+        """Testa o M/M/2 contra a fórmula fechada Lq = 2ρ³/(1-ρ²)."""
+        model = MM2Model(SimulationConfig(arrival_rate=2.0, service_rate=3.0))
+        rho = model.utilization
+        self.assertAlmostEqual(model.average_queue_length, 2 * rho**3 / (1 - rho**2))
+
+    def test_erlang_c_factorial_formula(self):
+        """Testa a recorrência contra a fórmula com fatoriais para c pequeno."""
+        a, c = 3.5, 5
+        top = a**c / math.factorial(c) * c / (c - a)
+        expected = top / (sum(a**k / math.factorial(k) for k in range(c)) + top)
+        self.assertAlmostEqual(erlang_c(a, c), expected)
+
+    def test_erlang_c_large_pool(self):
+        """Testa que centenas de médicos não causam overflow."""
+        model = MMcModel(SimulationConfig(arrival_rate=450.0, service_rate=1.0), num_servers=500)
+        self.assertTrue(0 < model.probability_of_wait < 1)
+        self.assertTrue(math.isfinite(model.average_queue_time))
+
+    def test_unstable_system(self):
+        """Testa a validação de estabilidade."""
+        with self.assertRaises(ValueError):
+            MMcModel(SimulationConfig(arrival_rate=6.0, service_rate=3.0), num_servers=2)
+
+    def test_find_minimum_servers(self):
+        """Testa se o menor c atende ao alvo e c - 1 não atende."""
+        config = SimulationConfig(arrival_rate=4500.0, service_rate=10.0)
+        target = 0.001
+        c = find_minimum_servers(config, target)
+        self.assertLessEqual(MMcModel(config, c).average_queue_time, target)
+        self.assertGreater(MMcModel(config, c - 1).average_queue_time, target)
+        self.assertEqual(find_minimum_servers(SimulationConfig(arrival_rate=2.0, service_rate=3.0)), 2)
+
+class TestDiscreteEventSimulator(unittest.TestCase):
+    def setUp(self):
+        """Define uma configuração longa o bastante para estimativas estáveis."""
+        self.config = SimulationConfig(arrival_rate=2.0, service_rate=3.0, simulation_time=5000.0)
+
+    def test_invalid_servers(self):
+        """Testa a validação do número de médicos."""
+        with self.assertRaises(ValueError):
+            DiscreteEventSimulator(self.config, num_servers=0)
+
+    def test_run_reproducible(self):
+        """Testa se a mesma semente reproduz a mesma replicação."""
+        simulator = DiscreteEventSimulator(self.config)
+        run1 = simulator.run(seed=7)
+        run2 = simulator.run(seed=7)
+        self.assertEqual(run1.patients_served, run2.patients_served)
+        np.testing.assert_array_equal(run1.wait_times, run2.wait_times)
+
+    def test_run_matches_mm1(self):
+        """Testa se a simulação se aproxima das fórmulas do M/M/1."""
+        run = DiscreteEventSimulator(self.config).run(seed=1)
+        model = MM1Model(self.config)
+        self.assertAlmostEqual(run.utilization, model.utilization, delta=0.02)
+        self.assertAlmostEqual(run.average_queue_time, model.average_queue_time, delta=0.1)
+        self.assertTrue(np.all(run.wait_times >= 0))
+
+    def test_replicate_confidence_interval(self):
+        """Testa o resumo das replicações com intervalos de confiança."""
+        summary = DiscreteEventSimulator(self.config).replicate(replications=5, seed=3)
+        self.assertIn('average_queue_time', summary.index)
+        self.assertTrue((summary['ci_lower'] <= summary['mean']).all())
+        self.assertTrue((summary['mean'] <= summary['ci_upper']).all())
+
+    def test_replicate_requires_two_runs(self):
+        """Testa que o IC exige pelo menos duas replicações."""
+        with self.assertRaises(ValueError):
+            DiscreteEventSimulator(self.config).replicate(replications=1)
+
+    def test_analyzer_simulate_models(self):
+        """Testa a tabela de comparação entre valores analíticos e simulados."""
+        analyzer = HospitalQueueAnalyzer(self.config)
+        table = analyzer.simulate_models(replications=3, seed=0)
+        self.assertEqual(len(table), 6)
+        self.assertEqual(set(table['Scenario']), {'Single Doctor', 'Two Doctors'})
+
+    def test_analyzer_common_random_numbers_without_seed(self):
+        """Testa se, com seed=None, os dois cenários recebem a mesma raiz de sementes."""
+        analyzer = HospitalQueueAnalyzer(self.config)
+        replicate = DiscreteEventSimulator.replicate
+        with mock.patch.object(DiscreteEventSimulator, 'replicate', autospec=True,
+                               side_effect=replicate) as spy:
+            analyzer.simulate_models(replications=2)
+        roots = [call.args[2] for call in spy.call_args_list]
+        self.assertEqual(len(roots), 2)
+        self.assertEqual(roots[0].entropy, roots[1].entropy)
+
+class TestLindleySimulator(unittest.TestCase):
+    def test_matches_event_simulation(self):
+        """Testa se a recursão reproduz as esperas do simulador de eventos."""
+        for servers, service_rate in [(1, 3.0), (2, 1.5)]:
+            config = SimulationConfig(arrival_rate=2.5, service_rate=service_rate, simulation_time=2000.0)
+            events = DiscreteEventSimulator(config, num_servers=servers).run(seed=5)
+            simulator = LindleySimulator(config, num_servers=servers)
+            simulator.CHUNK_SIZE = 1000  # Força várias fronteiras entre blocos
+            n = events.patients_served - 10
+            lindley = simulator.run(n, seed=5)
+            np.testing.assert_allclose(lindley.wait_times, events.wait_times[:n], atol=1e-8)
+
+    def test_large_run_matches_mm1(self):
+        """Testa a concordância com o M/M/1 em uma execução longa."""
+        config = SimulationConfig(arrival_rate=2.0, service_rate=3.0)
+        run = LindleySimulator(config).run(1_000_000, seed=11)
+        self.assertAlmostEqual(run.average_queue_time, MM1Model(config).average_queue_time, delta=0.03)
+        self.assertEqual(run.patients_served, 1_000_000)
+
+    def test_invalid_patients(self):
+        """Testa a validação do número de pacientes."""
+        with self.assertRaises(ValueError):
+            LindleySimulator(SimulationConfig(arrival_rate=2.0, service_rate=3.0)).run(0)
+
+class TestArrivalProfile(unittest.TestCase):
+    def setUp(self):
+        """Define uma curva de chegadas com pico de 6 pacientes/hora."""
+        self.profile = [1.0, 2.0, 6.0, 3.0]
+        self.config = SimulationConfig(arrival_rate=3.0, service_rate=4.0, simulation_time=4000.0,
+                                       arrival_profile=self.profile)
+
+    def _arrivals(self, config, blocks=100):
+        """Concatena os primeiros blocos de chegadas do thinning."""
+        stream = arrival_time_stream(config, np.random.default_rng(0), block_size=4096)
+        return np.concatenate([next(stream) for _ in range(blocks)])
+
+    def test_thinning_follows_profile(self):
+        """Testa se as chegadas por faixa seguem as taxas do perfil."""
+        arrivals = self._arrivals(self.config)
+        cycles = np.floor(arrivals[-1] / 4)
+        arrivals = arrivals[arrivals < cycles * 4]
+        counts = np.bincount((arrivals % 4).astype(int), minlength=4) / cycles
+        np.testing.assert_allclose(counts, self.profile, rtol=0.05)
+        self.assertTrue(np.all(np.diff(arrivals) > 0))
+
+    def test_callable_profile(self):
+        """Testa um perfil definido por função NumPy."""
+        config = SimulationConfig(arrival_rate=2.0, service_rate=4.0,
+                                  arrival_profile=lambda t: 2.0 + np.sin(2 * np.pi * t / 24),
+                                  max_arrival_rate=3.0)
+        arrivals = self._arrivals(config)
+        self.assertAlmostEqual(len(arrivals) / arrivals[-1], 2.0, delta=0.05)
+        with self.assertRaises(ValueError):
+            arrival_time_stream(SimulationConfig(arrival_rate=2.0, service_rate=4.0,
+                                                 arrival_profile=lambda t: t), np.random.default_rng()).__next__()
+
+    def test_minutes_conversion(self):
+        """Testa a conversão do perfil de minutos para horas."""
+        config = SimulationConfig(arrival_rate=0.05, service_rate=0.1, time_unit='minutes',
+                                  arrival_profile=[0.05, 0.1], profile_interval=30)
+        config.convert_to_hourly_rates()
+        self.assertEqual(config.arrival_profile, [3.0, 6.0])
+        self.assertAlmostEqual(config.profile_interval, 0.5)
+        np.testing.assert_allclose(config.arrival_rate_at([0.1, 0.6, 1.1]), [3.0, 6.0, 3.0])
+
+    def test_minutes_callable_profile_is_picklable(self):
+        """Testa se um perfil por função em minutos continua serializável após a conversão."""
+        def make_config():
+            return SimulationConfig(arrival_rate=0.04, service_rate=0.1, simulation_time=3000.0,
+                                    time_unit='minutes', arrival_profile=profile_per_minute,
+                                    max_arrival_rate=0.05)
+        config = make_config()
+        config.convert_to_hourly_rates()
+        restored = pickle.loads(pickle.dumps(config))
+        t = np.array([0.0, 6.0, 18.0])
+        np.testing.assert_allclose(restored.arrival_rate_at(t), 60 * profile_per_minute(t * 60))
+        
+        config = make_config()
+        serial = ReplicationManager(config, workers=1).run(max_replications=2, seed=3)
+        parallel = ReplicationManager(config, workers=2).run(max_replications=2, seed=3)
+        pd.testing.assert_frame_equal(serial.runs, parallel.runs)
+
+    def test_simulators_agree_with_profile(self):
+        """Testa se os dois simuladores veem as mesmas chegadas com perfil."""
+        events = DiscreteEventSimulator(self.config, num_servers=2).run(seed=9)
+        n = events.patients_served - 10
+        lindley = LindleySimulator(self.config, num_servers=2).run(n, seed=9)
+        np.testing.assert_allclose(lindley.wait_times, events.wait_times[:n], atol=1e-8)
+
+class TestReplicationManager(unittest.TestCase):
+    def setUp(self):
+        """Define cenários curtos para replicações rápidas."""
+        self.config = SimulationConfig(arrival_rate=2.0, service_rate=3.0, simulation_time=200.0)
+
+    def test_sequential_stopping(self):
+        """Testa a parada antecipada ao atingir a meia-largura alvo."""
+        study = ReplicationManager(self.config, workers=1).run(
+            target_half_width=0.1, min_replications=5, max_replications=500, seed=2)
+        self.assertTrue(study.converged)
+        self.assertLess(study.replications, 500)
+        half_widths = study.summary.xs('average_queue_time', level='metric')['half_width']
+        self.assertTrue((half_widths <= 0.1).all())
+        self.assertEqual(study.history.index[-1], study.replications)
+
+    def test_fixed_replications(self):
+        """Testa que sem alvo são executadas exatamente max_replications."""
+        study = ReplicationManager(self.config, workers=1).run(max_replications=6, seed=2)
+        self.assertEqual(study.replications, 6)
+        self.assertFalse(study.converged)
+
+    def test_common_random_numbers_reduce_variance(self):
+        """Testa se o IC pareado é mais estreito que o de cenários independentes."""
+        study = ReplicationManager(self.config, workers=1).run(max_replications=30, seed=5)
+        half_widths = study.summary.xs('average_queue_time', level='metric')['half_width']
+        independent = np.sqrt((half_widths ** 2).sum())
+        self.assertLess(study.wait_difference.loc['2 vs 1', 'half_width'], independent)
+
+    def test_pool_matches_serial(self):
+        """Testa se o pool de processos reproduz a execução serial."""
+        serial = ReplicationManager(self.config, workers=1).run(max_replications=4, seed=8)
+        parallel = ReplicationManager(self.config, workers=2).run(max_replications=4, seed=8)
+        pd.testing.assert_frame_equal(serial.runs, parallel.runs)
+
+class TestSteadyStateEstimators(unittest.TestCase):
+    def test_mser_detects_initial_transient(self):
+        """Testa se a MSER-5 descarta um transiente inicial conhecido."""
+        rng = np.random.default_rng(0)
+        series = np.concatenate([np.linspace(50, 1, 2000), rng.normal(1, 0.2, 20000)])
+        warmup = mser_truncation(series)
+        self.assertGreaterEqual(warmup, 1900)
+        self.assertLessEqual(warmup, 2500)
+
+    def test_mser_stationary_series(self):
+        """Testa que uma série estacionária perde pouco ou nada."""
+        series = np.random.default_rng(1).normal(0, 1, 10000)
+        self.assertLess(mser_truncation(series), 2000)
+
+    def test_batch_means_does_not_modify_input(self):
+        """Testa o IC das médias em lotes sem alterar as observações."""
+        series = np.random.default_rng(2).normal(5, 1, 30_001)
+        original = series.copy()
+        result = batch_means_interval(series, 0.95, num_batches=30)
+        np.testing.assert_array_equal(series, original)
+        self.assertEqual(result['batch_size'], 1000)
+        self.assertLess(result['ci_lower'], 5)
+        self.assertGreater(result['ci_upper'], 5)
+
+    def test_steady_state_wait_covers_mm1(self):
+        """Testa se o IC de uma única execução longa cobre o Wq analítico."""
+        config = SimulationConfig(arrival_rate=2.0, service_rate=3.0)
+        run = LindleySimulator(config).run(1_000_000, seed=6)
+        estimate = steady_state_wait(run, 0.99)
+        self.assertLessEqual(estimate['ci_lower'], MM1Model(config).average_queue_time)
+        self.assertGreaterEqual(estimate['ci_upper'], MM1Model(config).average_queue_time)
+        self.assertGreaterEqual(estimate['warmup'], 0)
+
+class TestPrioritySimulator(unittest.TestCase):
+    def setUp(self):
+        """Define um M/M/1 com ρ = 0,6 e duas classes de prioridade."""
+        self.classes = {'urgent': 0.3, 'standard': 0.7}
+        self.lam, self.mu = 1.8, 3.0
+
+    def config(self):
+        """Cria uma configuração nova (o simulador converte unidades no lugar)."""
+        return SimulationConfig(arrival_rate=self.lam, service_rate=self.mu, simulation_time=40000.0)
+
+    def test_non_preemptive_matches_cobham(self):
+        """Testa as esperas por classe contra a fórmula de Cobham."""
+        run = PrioritySimulator(self.config(), class_probabilities=self.classes).run(seed=1)
+        waits = run.class_metrics.set_index('class')['average_queue_time']
+        residual = self.lam / self.mu**2
+        sigma1, sigma = 0.3 * self.lam / self.mu, self.lam / self.mu
+        self.assertAlmostEqual(waits['urgent'], residual / (1 - sigma1), delta=0.02)
+        self.assertAlmostEqual(waits['standard'], residual / ((1 - sigma1) * (1 - sigma)), delta=0.05)
+
+    def test_preemptive_top_class_ignores_others(self):
+        """Testa que a classe mais urgente vê um M/M/1 só com a própria carga."""
+        run = PrioritySimulator(self.config(), class_probabilities=self.classes,
+                                preemptive=True).run(seed=1)
+        urgent = run.class_metrics.set_index('class').loc['urgent']
+        lam1 = 0.3 * self.lam
+        self.assertAlmostEqual(urgent['average_queue_time'], lam1 / (self.mu * (self.mu - lam1)), delta=0.01)
+
+    def test_single_class_matches_mmc(self):
+        """Testa que uma única classe reproduz o M/M/c FIFO."""
+        config = SimulationConfig(arrival_rate=2.5, service_rate=1.5, simulation_time=40000.0)
+        run = PrioritySimulator(config, [ServiceStage('doctor', 1.5, 2)], {'all': 1.0}).run(seed=2)
+        model = MMcModel(SimulationConfig(arrival_rate=2.5, service_rate=1.5), 2)
+        self.assertAlmostEqual(run.class_metrics['average_queue_time'][0], model.average_queue_time, delta=0.05)
+        self.assertAlmostEqual(run.stage_metrics['utilization'][0], model.utilization, delta=0.02)
+
+    def test_tandem_stages(self):
+        """Testa a passagem pelas etapas em série com a triagem de Manchester."""
+        config = SimulationConfig(arrival_rate=4.0, service_rate=3.0, simulation_time=2000.0)
+        stages = [ServiceStage('triage', 12.0), ServiceStage('doctor', 3.0, 2), ServiceStage('exams', 6.0)]
+        run = PrioritySimulator(config, stages, preemptive=True).run(seed=3)
+        self.assertEqual(list(run.stage_metrics['stage']), ['triage', 'doctor', 'exams'])
+        self.assertEqual(len(run.class_metrics), 3 * len(MANCHESTER_TRIAGE))
+        served = run.stage_metrics['patients_served']
+        self.assertTrue((served.diff().dropna() <= 0).all())
+        self.assertTrue((run.class_metrics['average_queue_time'].dropna() >= 0).all())
+        # Na consulta, as classes mais urgentes esperam menos
+        doctor = run.class_metrics[run.class_metrics['stage'] == 'doctor']
+        self.assertLess(doctor['average_queue_time'].iloc[1], doctor['average_queue_time'].iloc[3])
+
+    def test_analyzer_converts_stage_rates_in_minutes(self):
+        """Testa que etapas por minuto, via analisador, equivalem às mesmas etapas por hora."""
+        runs = []
+        for unit, scale in (('hours', 1.0), ('minutes', 60.0)):
+            config = SimulationConfig(arrival_rate=2.5 / scale, service_rate=3.0 / scale,
+                                      simulation_time=500.0 * scale, time_unit=unit)
+            stages = [ServiceStage('triage', 12.0 / scale), ServiceStage('doctor', 3.0 / scale, 2)]
+            runs.append(HospitalQueueAnalyzer(config).simulate_triage(stages, seed=5))
+        hours, minutes = runs
+        np.testing.assert_array_equal(minutes.stage_metrics['patients_served'],
+                                      hours.stage_metrics['patients_served'])
+        np.testing.assert_allclose(minutes.stage_metrics['utilization'],
+                                   hours.stage_metrics['utilization'], rtol=1e-9)
+        np.testing.assert_allclose(minutes.class_metrics['average_queue_time'],
+                                   hours.class_metrics['average_queue_time'], rtol=1e-9)
+
+    def test_invalid_probabilities(self):
+        """Testa a validação das proporções das classes."""
+        with self.assertRaises(ValueError):
+            PrioritySimulator(self.config(), class_probabilities={'a': 0.5, 'b': 0.2})
+
+    def test_parse_stage(self):
+        """Testa a leitura de etapas no formato nome:taxa[:atendentes]."""
+        self.assertEqual(ServiceStage.parse('exams:4:2'), ServiceStage('exams', 4.0, 2))
+        self.assertEqual(ServiceStage.parse('triage:12').num_servers, 1)
+        with self.assertRaises(ValueError):
+            ServiceStage.parse('doctor')
+
+class TestParameterSweep(unittest.TestCase):
+    def setUp(self):
+        """Define uma grade pequena com um cenário instável."""
+        self.configs = build_grid([2.0, 4.0], [3.0])
+
+    def test_run_sweep_serial(self):
+        """Testa a varredura sem pool de processos."""
+        results = run_sweep(self.configs, [1, 2], workers=1)
+        self.assertEqual(len(results), 4)
+        unstable = results[(results['arrival_rate'] == 4.0) & (results['num_servers'] == 1)]
+        self.assertFalse(unstable['stable'].iloc[0])
+        stable = results[results['stable']]
+        self.assertTrue(stable['average_queue_time'].notna().all())
+
+    def test_run_sweep_pool_matches_serial(self):
+        """Testa se o pool de processos devolve os mesmos resultados."""
+        serial = run_sweep(self.configs, [2, 3], replications=2, seed=4, workers=1)
+        parallel = run_sweep(self.configs, [2, 3], replications=2, seed=4, workers=2)
+        pd.testing.assert_frame_equal(serial, parallel)
+
+    def test_save_and_plot(self):
+        """Testa a escrita do CSV e do gráfico sem janela."""
+        results = run_sweep(self.configs, [1, 2], workers=1)
+        with tempfile.TemporaryDirectory() as tmp:
+            output = Path(tmp) / 'sweep.csv'
+            save_sweep_results(results, str(output))
+            backend = matplotlib.get_backend()
+            plot_sweep(results, str(output.with_suffix('.png')))
+            self.assertEqual(matplotlib.get_backend(), backend)
+            self.assertEqual(len(pd.read_csv(output)), 4)
+            self.assertTrue(output.with_suffix('.png').exists())
+
+if __name__ == '__main__':
+    unittest.main()
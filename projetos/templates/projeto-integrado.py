@@ -1,6 +1,7 @@
 """
 Statistical Analysis System
-This module implements statistical tests (chi-square), Markov chain simulations,
+This module implements statistical tests (chi-square), Markov chain simulations
+and analysis (stationary distributions, n-step transitions, absorbing chains),
 and queuing theory analysis (M/M/1, M/M/c) with a command-line interface.
 
 Example usage:
@@ -12,6 +13,8 @@ Date:
 
 import numpy as np
 import scipy.stats as stats
+import scipy.sparse as sparse
+import scipy.sparse.linalg as sparse_linalg
 from typing import List, Tuple, Dict, Optional
 import matplotlib.pyplot as plt
 from dataclasses import dataclass
@@ -25,16 +28,25 @@ class QueueMetrics:
     avg_wait_time: float
     avg_time_system: float
 
-def validate_probabilities(matrix: np.ndarray) -> bool:
+def validate_probabilities(matrix) -> bool:
     """
     Validate if a matrix is a valid transition probability matrix.
     
     Args:
-        matrix: numpy array representing transition matrix
+        matrix: numpy array or scipy.sparse matrix representing transition matrix
         
     Returns:
         bool: True if valid, False otherwise
     """
+    if sparse.issparse(matrix):
+        if matrix.shape[0] != matrix.shape[1]:
+            return False
+        values = matrix.tocsr().data
+        if not np.all((values >= 0) & (values <= 1)):
+            return False
+        row_sums = np.asarray(matrix.sum(axis=1)).ravel()
+        return np.allclose(row_sums, 1.0)
+    
     if not isinstance(matrix, np.ndarray):
         return False
     
@@ -83,6 +95,75 @@ def chi_square_test(observed: List[float], expected: Optional[List[float]] = Non
         "reject_null": p_value < 0.05
     }
 
+def _state_dtype(num_states: int) -> np.dtype:
+    """Return the smallest signed integer type able to store state indices."""
+    for dtype in (np.int8, np.int16, np.int32):
+        if num_states <= np.iinfo(dtype).max + 1:
+            return np.dtype(dtype)
+    return np.dtype(np.int64)
+
+def simulate_markov_chains(
+    transition_matrix: np.ndarray,
+    initial_states: np.ndarray,
+    steps: int,
+    seed: Optional[int] = None,
+    record_history: bool = True,
+    block_steps: int = 256
+) -> np.ndarray:
+    """
+    Simulate many independent Markov chains in parallel.
+    
+    Each row of the transition matrix is turned into a cumulative distribution
+    once, and row i is shifted by i so that all rows form a single increasing
+    array. The next state of every chain is then found with one searchsorted
+    call per step over all chains, using the row of each chain's current state.
+    
+    Args:
+        transition_matrix: Square matrix of transition probabilities
+        initial_states: Initial state index of each chain
+        steps: Number of steps to simulate
+        seed: Seed for the random number generator
+        record_history: If False, only the final states are returned
+        block_steps: Steps whose uniforms are drawn at once
+        
+    Returns:
+        State history with shape (steps + 1, num_chains) using int8/int16/int32
+        indices, or the final states when record_history is False
+    """
+    if not validate_probabilities(transition_matrix):
+        raise ValueError("Invalid transition matrix")
+    
+    num_states = transition_matrix.shape[0]
+    dtype = _state_dtype(num_states)
+    states = np.asarray(initial_states)
+    if states.ndim != 1 or np.any(states < 0) or np.any(states >= num_states):
+        raise ValueError("Initial states must be a 1-D array of valid state indices")
+    if steps < 0:
+        raise ValueError("Number of steps must be non-negative")
+    
+    cumulative = np.cumsum(transition_matrix, axis=1)
+    cumulative[:, -1] = 1.0  # Guard against rounding in the row sums
+    cumulative += np.arange(num_states)[:, None]
+    cumulative = cumulative.ravel()
+    
+    rng = np.random.default_rng(seed)
+    states = states.astype(np.int64)
+    history = np.empty((steps + 1, len(states)), dtype=dtype) if record_history else None
+    if record_history:
+        history[0] = states
+    
+    for start in range(0, steps, block_steps):
+        uniforms = rng.random((min(block_steps, steps - start), len(states)))
+        for offset, u in enumerate(uniforms, start=start + 1):
+            u += states
+            # u + state can round up to state + 1 with many states; clip back into the row
+            states = np.minimum(np.searchsorted(cumulative, u, side='right') - states * num_states,
+                                num_states - 1)
+            if record_history:
+                history[offset] = states
+    
+    return history if record_history else states.astype(dtype)
+
 def markov_chain_simulation(
     transition_matrix: np.ndarray,
     initial_state: np.ndarray,
@@ -102,16 +183,173 @@ def markov_chain_simulation(
     if not validate_probabilities(transition_matrix):
         raise ValueError("Invalid transition matrix")
         
-    current_state = initial_state
-    state_history = []
+    current_state = np.dot(initial_state, n_step_transition(transition_matrix, steps))
     
-    for _ in range(steps):
-        current_state = np.dot(current_state, transition_matrix)
-        state_idx = np.random.choice(len(current_state), p=current_state)
-        state_history.append(state_idx)
+    # Each step is drawn from the row of the current state, not from the marginal
+    start = np.random.choice(len(initial_state), p=initial_state)
+    history = simulate_markov_chains(transition_matrix, np.array([start]), steps,
+                                     seed=np.random.randint(2**31 - 1))
+    state_history = history[1:, 0].tolist()
     
     return current_state, state_history
 
+def stationary_distribution(
+    transition_matrix,
+    method: str = "direct",
+    tol: float = 1e-12,
+    max_iter: int = 100000
+) -> np.ndarray:
+    """
+    Compute the stationary distribution π such that π P = π and sum(π) = 1.
+    
+    The direct method solves (Pᵀ - I) π = 0 together with the normalization
+    constraint, using a sparse LU solver for scipy.sparse input (best for
+    banded chains such as birth-death processes; prefer the power method for
+    large unstructured chains, where LU fill-in grows quickly).
+    The power method repeats π ← π P until the L1 change falls below tol,
+    touching only the nonzero entries for sparse input.
+    
+    Args:
+        transition_matrix: Square transition matrix (numpy array or scipy.sparse)
+        method: "direct" (linear solve) or "power" (power iteration)
+        tol: Convergence tolerance for the power method
+        max_iter: Maximum number of power iterations
+        
+    Returns:
+        Stationary probability vector
+    """
+    if not validate_probabilities(transition_matrix):
+        raise ValueError("Invalid transition matrix")
+    
+    n = transition_matrix.shape[0]
+    is_sparse = sparse.issparse(transition_matrix)
+    
+    if method == "direct":
+        rhs = np.zeros(n)
+        rhs[-1] = 1.0
+        if is_sparse:
+            # The last balance equation is replaced by sum(π) = 1, as in the
+            # dense branch; placed last, the row of ones adds no LU fill-in
+            balance = (transition_matrix.T - sparse.identity(n, format="csr")).tocsr()
+            system = sparse.vstack([balance[:-1], sparse.csr_matrix(np.ones((1, n)))]).tocsc()
+            try:
+                pi = sparse_linalg.spsolve(system, rhs)
+            except RuntimeError:
+                pi = np.full(n, np.nan)
+            if not np.all(np.isfinite(pi)):
+                raise np.linalg.LinAlgError("Singular system: the chain has no unique "
+                                            "stationary distribution")
+        else:
+            system = transition_matrix.T - np.eye(n)
+            system[-1] = 1.0
+            pi = np.linalg.solve(system, rhs)
+    elif method == "power":
+        transposed = transition_matrix.T.tocsr() if is_sparse else transition_matrix.T
+        pi = np.full(n, 1.0 / n)
+        for _ in range(max_iter):
+            updated = transposed @ pi
+            if np.abs(updated - pi).sum() < tol:
+                pi = updated
+                break
+            pi = updated
+        else:
+            raise ValueError(f"Power iteration did not converge after {max_iter} iterations "
+                             "(the chain may be periodic)")
+    else:
+        raise ValueError("Method must be 'direct' or 'power'")
+    
+    pi = np.clip(pi, 0.0, None)
+    return pi / pi.sum()
+
+def n_step_transition(transition_matrix, n: int):
+    """
+    Compute the n-step transition matrix Pⁿ by repeated squaring.
+    
+    Only O(log n) matrix products are needed instead of n. Sparse input stays
+    sparse, although powers of sparse matrices tend to fill in.
+    
+    Args:
+        transition_matrix: Square transition matrix (numpy array or scipy.sparse)
+        n: Number of steps
+        
+    Returns:
+        Matrix whose entry (i, j) is P(X_n = j | X_0 = i)
+    """
+    if not validate_probabilities(transition_matrix):
+        raise ValueError("Invalid transition matrix")
+    if n < 0:
+        raise ValueError("Number of steps must be non-negative")
+    
+    if sparse.issparse(transition_matrix):
+        result = sparse.identity(transition_matrix.shape[0], format="csr")
+        power = transition_matrix.tocsr()
+    else:
+        result = np.eye(transition_matrix.shape[0])
+        power = transition_matrix
+    
+    while n:
+        if n & 1:
+            result = result @ power
+        n >>= 1
+        if n:
+            power = power @ power
+    return result
+
+def absorbing_chain_analysis(transition_matrix) -> Dict:
+    """
+    Analyze an absorbing Markov chain through its fundamental matrix.
+    
+    With the transient block Q and the transient-to-absorbing block R, the
+    fundamental matrix is N = (I - Q)⁻¹. Expected steps before absorption are
+    t = N·1 and absorption probabilities are B = N·R. Both are obtained by
+    solving with a single factorization of (I - Q) instead of multiplying by
+    an explicit inverse; N itself is only formed (from the same solve) for
+    dense input.
+    
+    Args:
+        transition_matrix: Square transition matrix (numpy array or scipy.sparse)
+        
+    Returns:
+        Dict with absorbing and transient state indices, expected steps to
+        absorption, absorption probabilities and (dense input) the fundamental matrix
+    """
+    if not validate_probabilities(transition_matrix):
+        raise ValueError("Invalid transition matrix")
+    
+    is_sparse = sparse.issparse(transition_matrix)
+    matrix = transition_matrix.tocsr() if is_sparse else transition_matrix
+    diagonal = matrix.diagonal()
+    absorbing = np.flatnonzero(np.isclose(diagonal, 1.0))
+    transient = np.flatnonzero(~np.isclose(diagonal, 1.0))
+    if len(absorbing) == 0:
+        raise ValueError("Chain has no absorbing states")
+    
+    Q = matrix[transient][:, transient]
+    R = matrix[transient][:, absorbing]
+    
+    fundamental = None
+    if is_sparse:
+        lu = sparse_linalg.splu((sparse.identity(len(transient), format="csc") - Q).tocsc())
+        expected_steps = lu.solve(np.ones(len(transient)))
+        absorption = lu.solve(R.toarray())
+    else:
+        # One solve with stacked right-hand sides [1 | R | I] factors (I - Q) once
+        num_absorbing = len(absorbing)
+        solution = np.linalg.solve(np.eye(len(transient)) - Q,
+                                   np.column_stack([np.ones(len(transient)), R,
+                                                    np.eye(len(transient))]))
+        expected_steps = solution[:, 0]
+        absorption = solution[:, 1:1 + num_absorbing]
+        fundamental = solution[:, 1 + num_absorbing:]
+    
+    return {
+        "absorbing_states": absorbing,
+        "transient_states": transient,
+        "fundamental_matrix": fundamental,
+        "expected_steps": expected_steps,
+        "absorption_probabilities": absorption,
+    }
+
 def queue_analysis(
     arrival_rate: float,
     service_rate: float,
@@ -143,12 +381,17 @@ def queue_analysis(
         W = 1 / (service_rate - arrival_rate)  # Average time in system
         Wq = rho / (service_rate - arrival_rate)  # Average waiting time
     else:
-        # For M/M/c
-        p0 = 1.0  # Probability of empty system (simplified calculation)
-        L = rho * service_rate / (1 - rho)
-        Lq = L - arrival_rate / service_rate
-        W = L / arrival_rate
-        Wq = Lq / arrival_rate
+        # For M/M/c: Erlang C computed through the Erlang B recurrence,
+        # which stays between 0 and 1 and never builds large factorials
+        offered_load = arrival_rate / service_rate
+        erlang_b = 1.0
+        for k in range(1, num_servers + 1):
+            erlang_b = offered_load * erlang_b / (k + offered_load * erlang_b)
+        erlang_c = erlang_b / (1 - rho * (1 - erlang_b))  # Probability of waiting
+        Lq = erlang_c * rho / (1 - rho)  # Average number in queue
+        Wq = Lq / arrival_rate  # Average waiting time
+        W = Wq + 1 / service_rate  # Average time in system
+        L = arrival_rate * W  # Average number in system
     
     return QueueMetrics(
         utilization=rho,
@@ -218,6 +461,37 @@ def test_implementations():
     except Exception as e:
         print("Markov chain test failed:", e)
     
+    # Test batched Markov chains
+    try:
+        P = np.array([[0.7, 0.3], [0.4, 0.6]])
+        history = simulate_markov_chains(P, np.zeros(1000, dtype=int), 2000, seed=0)
+        frequencies = np.bincount(history[1:].ravel(), minlength=2) / history[1:].size
+        print("Batched Markov chains test passed:",
+              history.dtype == np.int8 and np.allclose(frequencies, [4/7, 3/7], atol=0.01))
+    except Exception as e:
+        print("Batched Markov chains test failed:", e)
+    
+    # Test stationary distribution, n-step transitions and absorbing chains
+    try:
+        P = np.array([[0.7, 0.3], [0.4, 0.6]])
+        pi = stationary_distribution(P)
+        pi_power = stationary_distribution(sparse.csr_matrix(P), method="power")
+        P_50 = n_step_transition(P, 50)
+        # State 0 is transient: the sparse solve must still match the dense one
+        transient_first = np.array([[0.5, 0.5, 0.0], [0.0, 0.5, 0.5], [0.0, 0.5, 0.5]])
+        pi_transient = stationary_distribution(sparse.csr_matrix(transient_first))
+        absorbing = absorbing_chain_analysis(np.array([[1.0, 0.0, 0.0],
+                                                       [0.5, 0.0, 0.5],
+                                                       [0.0, 0.0, 1.0]]))
+        print("Markov chain analysis test passed:",
+              np.allclose(pi, [4/7, 3/7]) and np.allclose(pi_power, pi)
+              and np.allclose(pi_transient, [0.0, 0.5, 0.5])
+              and np.allclose(pi_transient, stationary_distribution(transient_first))
+              and np.allclose(P_50, np.vstack([pi, pi]))
+              and np.allclose(absorbing["absorption_probabilities"], [[0.5, 0.5]]))
+    except Exception as e:
+        print("Markov chain analysis test failed:", e)
+    
     # Test queue analysis
     try:
         metrics = queue_analysis(2, 3)
@@ -278,6 +552,14 @@ def main():
                 for i, prob in enumerate(final_state):
                     print(f"State {i}: {prob:.4f}")
                 
+                try:
+                    pi = stationary_distribution(P)
+                    print("Stationary distribution:")
+                    for i, prob in enumerate(pi):
+                        print(f"State {i}: {prob:.4f}")
+                except (ValueError, np.linalg.LinAlgError):
+                    print("Stationary distribution is not unique for this chain")
+                
                 plot = input("\nWould you like to see the state history plot? (y/n): ").lower() == 'y'
                 if plot:
                     plot_markov_chain_history(history, n)